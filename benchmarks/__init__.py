@@ -0,0 +1,18 @@
+"""Benchmarks of Charmy, run from the repo root with `python -m benchmarks`.
+
+Usage
+-----
+.. code-block:: shell
+
+    python -m benchmarks --list                   # List all benchmarks
+    python -m benchmarks "geometry.*" --quick     # Run selected benchmarks, skipping slow ones
+    python -m benchmarks --save local             # Save results as baseline `local`
+    python -m benchmarks --compare local --check  # Fail if anything got slower than baseline
+
+Baselines are saved in `benchmarks/baselines/`, which is not tracked by git. Timings depend on the
+machine, so no baseline is shipped: save one on your machine before making changes, e.g. with
+`python -m benchmarks --save local` on the main branch, then compare your branch with
+`--compare local`. Frame benchmarks render with the headless backend, and are skipped if its
+dependencies are not installed, so install them (`pip install -e .[backend-headless]`) before
+saving a baseline to have frames compared too.
+"""
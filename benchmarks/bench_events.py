@@ -0,0 +1,19 @@
+"""Benchmarks of event handling."""
+
+from charmy.event import EventHandling
+from charmy.utils import event_types
+
+from .runner import register
+
+
+def _trigger(handler_count: int, conditions: dict | None = None):
+    def setup():
+        subject = EventHandling()
+        for _ in range(handler_count):
+            subject.bind(event_types.WidgetUpdate, lambda _: None, conditions)
+        return lambda: subject.trigger(event_types.WidgetUpdate(subject))
+    return setup
+
+for _count in (0, 1, 10, 100):
+    register(f"events.trigger[handlers={_count}]", _trigger(_count))
+register("events.trigger_with_conditions[handlers=10]", _trigger(10, {"redraw": True}))
@@ -0,0 +1,102 @@
+"""Benchmarks of rendering frames of generated scenes, with the headless backend."""
+
+import random
+
+from charmy import graphics
+from charmy.styles import shape, text_style
+
+from .runner import BenchmarkSkipped, register
+
+
+WINDOW_SIZE = (1280, 800)
+
+
+def _make_window():
+    try:
+        from charmy.backend import headless # NOQA: F401 Check if dependencies are installed
+    except ImportError as e:
+        raise BenchmarkSkipped(f"headless backend not available ({e})")
+    from charmy.cmm import CharmyManager
+    from charmy.widgets.window import Window
+    window = Window(CharmyManager("headless"), size=WINDOW_SIZE)
+    window.update(True)
+    return window
+
+
+def _build_scene(window, object_count: int) -> list[graphics.DrawnObject]:
+    """Draw a scene of rects, round rects, lines and texts at random places, same for each run."""
+    rng = random.Random(object_count)
+    style = text_style.TextStyle("Arial", 12)
+    objects: list[graphics.DrawnObject] = []
+    for index in range(object_count):
+        x, y = rng.randrange(WINDOW_SIZE[0]), rng.randrange(WINDOW_SIZE[1])
+        w, h = rng.randint(4, 60), rng.randint(4, 60)
+        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256), 1.0)
+        kind = index % 10
+        obj: graphics.DrawnObject
+        if kind < 6:
+            obj = graphics.DrawnShape(window, shape.Rect((x, y), (w, h)), color)
+        elif kind < 8:
+            obj = graphics.DrawnShape(
+                window, shape.RoundRect((x, y), (w, h), min(w, h) // 4), color, 1, (0, 0, 0),
+                )
+        elif kind < 9:
+            obj = graphics.DrawnLine(window, shape.Line([(x, y), (x + w, y + h)]), color, 2)
+        else:
+            obj = graphics.DrawnText(window, f"Item {index}", style, color, offset=(x, y))
+        obj.draw()
+        objects.append(obj)
+    return objects
+
+
+def _full_frame(object_count: int):
+    """Redraw the whole window, replaying recorded commands of all objects."""
+    def setup():
+        window = _make_window()
+        _build_scene(window, object_count)
+        window.update(True)
+        return lambda: window.update(True)
+    return setup
+
+def _first_frame(object_count: int):
+    """Redraw the whole window with nothing recorded yet, as for the first frame."""
+    def setup():
+        window = _make_window()
+        _build_scene(window, object_count)
+        def run():
+            window._display_list.clear()
+            window.update(True)
+        return run
+    return setup
+
+def _damage_one(object_count: int):
+    """Change color of one object, then redraw only what it damaged."""
+    def setup():
+        window = _make_window()
+        target = _build_scene(window, object_count)[0]
+        window.update(True)
+        colors = [(255, 0, 0), (0, 0, 255)]
+        def run():
+            colors.reverse()
+            target.texture = colors[0] # type: ignore
+            target.draw()
+            window.update()
+        return run
+    return setup
+
+def _idle(object_count: int):
+    """Update a window where nothing changed."""
+    def setup():
+        window = _make_window()
+        _build_scene(window, object_count)
+        window.update(True)
+        return lambda: window.update()
+    return setup
+
+for _count in (100, 1_000, 10_000, 100_000):
+    _slow = _count >= 100_000
+    _repeat = 3 if _slow else None
+    register(f"frames.full[objects={_count}]", _full_frame(_count), _repeat, _slow)
+    register(f"frames.first[objects={_count}]", _first_frame(_count), _repeat, _slow)
+    register(f"frames.damage_one[objects={_count}]", _damage_one(_count), _repeat, _slow)
+    register(f"frames.idle[objects={_count}]", _idle(_count), _repeat, _slow)
@@ -0,0 +1,103 @@
+"""Benchmarks of geometry: curve flattening and boundaries of large polylines."""
+
+import math
+import random
+
+from charmy.styles import shape
+from charmy.utils import geo_math
+
+from .runner import register
+
+
+CUBIC = [(20, 300), (120, -150), (380, 650), (480, 100)]
+QUADRATIC = [(20, 300), (250, -200), (480, 300)]
+
+
+def _flatten_cubic(tolerance: float):
+    def setup():
+        return lambda: geo_math.flatten_cubic_bezier(CUBIC, tolerance)
+    return setup
+
+def _flatten_quadratic(tolerance: float):
+    def setup():
+        return lambda: geo_math.flatten_quadratic_bezier(QUADRATIC, tolerance)
+    return setup
+
+def _flatten_circle_arc(tolerance: float):
+    def setup():
+        return lambda: geo_math.flatten_circle_arc((250, 250), 200, 0, 270, tolerance)
+    return setup
+
+def _flatten_shape(tolerance: float):
+    def setup():
+        rounded = shape.RoundRect((10, 10), (400, 240), 40)
+        return lambda: rounded.flatten(tolerance) # type: ignore
+    return setup
+
+for _tolerance in (15, 5, 1):
+    register(f"geometry.flatten_cubic[tolerance={_tolerance}]", _flatten_cubic(_tolerance))
+    register(f"geometry.flatten_quadratic[tolerance={_tolerance}]",
+             _flatten_quadratic(_tolerance))
+    register(f"geometry.flatten_circle_arc[tolerance={_tolerance}]",
+             _flatten_circle_arc(_tolerance))
+    register(f"geometry.flatten_round_rect[tolerance={_tolerance}]", _flatten_shape(_tolerance))
+
+
+def _flatten_cubic_error(max_error: float):
+    def setup():
+        return lambda: geo_math.flatten_cubic_bezier(CUBIC, max_error=max_error)
+    return setup
+
+def _flatten_circle_arc_error(max_error: float):
+    def setup():
+        return lambda: geo_math.flatten_circle_arc((250, 250), 200, 0, 270, max_error=max_error)
+    return setup
+
+def _flatten_shape_error(max_error: float):
+    def setup():
+        rounded = shape.RoundRect((10, 10), (400, 240), 40)
+        return lambda: rounded.flatten(max_error=max_error) # type: ignore
+    return setup
+
+for _max_error in (2, 0.5, 0.1):
+    register(f"geometry.flatten_cubic[max_error={_max_error}]", _flatten_cubic_error(_max_error))
+    register(f"geometry.flatten_circle_arc[max_error={_max_error}]",
+             _flatten_circle_arc_error(_max_error))
+    register(f"geometry.flatten_round_rect[max_error={_max_error}]",
+             _flatten_shape_error(_max_error))
+
+
+def _flatten_cubic_batch(curve_count: int, batched: bool):
+    def setup():
+        rng = random.Random(curve_count)
+        curves = [[(rng.randint(0, 500), rng.randint(0, 500)) for _ in range(4)]
+                  for _ in range(curve_count)]
+        if batched:
+            return lambda: geo_math.flatten_cubic_beziers(curves)
+        return lambda: [geo_math.flatten_cubic_bezier(curve) for curve in curves]
+    return setup
+
+for _count in (100, 1_000):
+    register(f"geometry.flatten_cubic_batch[curves={_count}]",
+             _flatten_cubic_batch(_count, True))
+    register(f"geometry.flatten_cubic_each[curves={_count}]",
+             _flatten_cubic_batch(_count, False))
+
+
+def _polyline_boundary(point_count: int):
+    def setup():
+        rng = random.Random(point_count)
+        points = [
+            (int(500 + 400 * math.cos(i / 50) + rng.randint(-20, 20)),
+             int(500 + 400 * math.sin(i / 70) + rng.randint(-20, 20)))
+            for i in range(point_count)
+            ]
+        polyline = shape.PolyLine(points)
+        def run():
+            polyline.points = points # Invalidates cached boundary
+            return polyline.boundary
+        return run
+    return setup
+
+for _count in (1_000, 10_000, 100_000):
+    register(f"geometry.polyline_boundary[points={_count}]", _polyline_boundary(_count))
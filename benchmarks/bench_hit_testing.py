@@ -0,0 +1,87 @@
+"""Benchmarks of hit testing: points in shapes and finding hovered widgets in container trees."""
+
+import typing
+
+from charmy.styles import shape
+from charmy.widgets.container import Container
+
+from .runner import register
+
+
+def _test_shape() -> shape.AnyShape:
+    return shape.AnyShape([
+        shape.PolyLine([(50, 50), (70, 200), (420, 270), (170, 330), (350, 120), (200, 80)]),
+        shape.CubicBezier([(200, 80), (150, 150), (120, 150), (50, 50)]),
+        ])
+
+def _grid_points(boundary: shape.ShapeRange, step: int) -> list[shape.Point]:
+    (x, y), (w, h) = boundary
+    return [(px, py) for py in range(y, y + h + 1, step) for px in range(x, x + w + 1, step)]
+
+
+def _shape_contains(test_shape: typing.Callable[[], shape.SingleShape], step: int):
+    def setup():
+        single_shape = test_shape()
+        points = _grid_points(single_shape.boundary, step)
+        return lambda: [point in single_shape for point in points]
+    return setup
+
+register("hit_testing.any_shape_contains[points=grid/10px]", _shape_contains(_test_shape, 10))
+register("hit_testing.rect_contains[points=grid/10px]",
+         _shape_contains(lambda: shape.Rect((50, 50), (370, 280)), 10))
+register("hit_testing.round_rect_contains[points=grid/10px]",
+         _shape_contains(lambda: shape.RoundRect((50, 50), (370, 280), 30), 10))
+
+
+class _Box(Container):
+    """Minimal container in a rect, standing in for frames in a tree of widgets."""
+
+    layout_profile = None # Placed, not managed
+
+    def __init__(self, pos: shape.Point, size: shape.Size, parent: "_Box | None" = None):
+        super().__init__()
+        self._pos = pos
+        self._size = size
+        self.background = (255, 255, 255)
+        self.parent = parent
+        if parent is not None:
+            parent.children.append(self) # type: ignore
+
+    @property
+    def pos(self) -> shape.Point:
+        return self._pos
+
+    @property
+    def abs_pos(self) -> shape.Point:
+        if self.parent is None:
+            return self._pos
+        parent_pos = self.parent.abs_pos
+        return (parent_pos[0] + self._pos[0], parent_pos[1] + self._pos[1])
+
+    @property
+    def size(self) -> shape.Size:
+        return self._size
+
+    def __contains__(self, pos: shape.Point) -> bool: # type: ignore[override]
+        return (self._pos[0] <= pos[0] < self._pos[0] + self._size[0] and
+                self._pos[1] <= pos[1] < self._pos[1] + self._size[1])
+
+
+def _mouse_hover(depth: int, siblings: int):
+    def setup():
+        root = _Box((0, 0), (4096, 4096))
+        parent = root
+        size = 4096
+        for _ in range(depth):
+            # Hovered child is added first, so all its siblings on top are tested before it
+            size = max(size // 2, 16)
+            hovered = _Box((0, 0), (size, size), parent)
+            for index in range(1, siblings):
+                _Box((size + index, 0), (size, size), parent)
+            parent = hovered
+        return lambda: root.get_mouse_hover((5, 5))
+    return setup
+
+for _depth, _siblings in ((5, 1), (20, 1), (20, 10), (50, 10)):
+    register(f"hit_testing.get_mouse_hover[depth={_depth},siblings={_siblings}]",
+             _mouse_hover(_depth, _siblings))
@@ -0,0 +1,333 @@
+"""Benchmark registry, timing and baseline comparison.
+
+Timing
+------
+Each benchmark gives a function to time. It is run once to warm up, then the number of calls per
+batch is calibrated so that one batch takes at least `min_time`, and `repeat` batches are timed
+with garbage collection disabled. The median time per call is what gets reported and compared, and
+the minimum is kept to estimate how noisy the timing was, as other loads of the machine can only 
+make a batch slower, never faster.
+
+Baselines
+---------
+Results can be saved as a baseline JSON file, and later results are compared against it by the
+median time of each benchmark that exists in both. A benchmark is reported as a regression if it
+got slower by more than the threshold, widened to the noise seen in either run (the spread between
+median and minimum), and if it is still slower when timed again with more batches, so a burst of
+load on the machine alone does not fail `--check`.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import dataclasses
+import fnmatch
+import gc
+import json
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+__all__ = [
+    "BASELINES_DIR", "Benchmark", "BenchmarkSkipped", "Result", "benchmark", "register",
+    "select", "measure", "run", "save_results", "load_results", "compare",
+    ]
+
+
+BASELINES_DIR = pathlib.Path(__file__).parent / "baselines"
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by setup of a benchmark that cannot run in current environment."""
+
+
+@dataclasses.dataclass
+class Benchmark:
+    """A registered benchmark.
+
+    :param name: Unique name, in `{group}.{case}` or `{group}.{case}[{param}]`
+    :param setup: Prepares data and returns the function to time, which takes no argument
+    :param repeat: Override number of timed batches, for slow benchmarks
+    :param slow: Skipped with `--quick`
+    """
+    name: str
+    setup: typing.Callable[[], typing.Callable[[], typing.Any]]
+    repeat: int | None = None
+    slow: bool = False
+
+
+@dataclasses.dataclass
+class Result:
+    """Timing result of a benchmark, times are in seconds per call."""
+    name: str
+    median: float
+    min: float
+    loops: int # Calls per batch
+    repeat: int # Batches timed
+
+    @property
+    def spread(self) -> float:
+        """Relative distance from minimum to median, as an estimate of timing noise."""
+        return (self.median - self.min) / self.min if self.min > 0 else 0.
+
+    def as_dict(self) -> dict[str, typing.Any]:
+        return dataclasses.asdict(self)
+
+
+_registry: dict[str, Benchmark] = {}
+
+
+def register(name: str,
+             setup: typing.Callable[[], typing.Callable[[], typing.Any]],
+             repeat: int | None = None,
+             slow: bool = False,
+             ) -> Benchmark:
+    """Register a benchmark.
+
+    :param name: Unique name of the benchmark
+    :param setup: Prepares data and returns the function to time
+    :param repeat: Override number of timed batches
+    :param slow: Skipped with `--quick`
+    """
+    if name in _registry:
+        raise ValueError(f"Benchmark {name} is already registered.")
+    _registry[name] = Benchmark(name, setup, repeat, slow)
+    return _registry[name]
+
+
+def benchmark(name: str, repeat: int | None = None, slow: bool = False):
+    """Decorator to register a setup function as a benchmark, see `register()`."""
+    def decorator(setup: typing.Callable[[], typing.Callable[[], typing.Any]]):
+        register(name, setup, repeat, slow)
+        return setup
+    return decorator
+
+
+def select(patterns: typing.Sequence[str] = (), quick: bool = False) -> list[Benchmark]:
+    """Get registered benchmarks in registering order.
+
+    :param patterns: Names or glob patterns of names to select, all if empty
+    :param quick: Leave out slow benchmarks
+    """
+    return [
+        bench for bench in _registry.values()
+        if (not patterns or any(
+            bench.name == pattern or fnmatch.fnmatchcase(bench.name, pattern)
+            for pattern in patterns
+            ))
+        and not (quick and bench.slow)
+        ]
+
+
+def _time_batch(func: typing.Callable[[], typing.Any], loops: int) -> float:
+    timer = time.perf_counter
+    loop_range = range(loops)
+    start = timer()
+    for _ in loop_range:
+        func()
+    return timer() - start
+
+
+def measure(func: typing.Callable[[], typing.Any],
+            repeat: int = 7,
+            min_time: float = 0.05,
+            ) -> tuple[float, float, int]:
+    """Time a function.
+
+    :param func: The function to time
+    :param repeat: Number of timed batches
+    :param min_time: Minimum time of one batch in seconds, used to calibrate calls per batch
+    :return result: `(median, min, loops)`, times are in seconds per call
+    """
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        elapsed = _time_batch(func, 1) # Warm up, and first guess of time per call
+        loops = 1
+        while elapsed < min_time and loops < 1 << 24:
+            # Grow towards min_time, but never more than 10x at once as first calls may be slower
+            loops = max(loops + 1, min(loops * 10, int(loops * min_time / max(elapsed, 1e-9))))
+            elapsed = _time_batch(func, loops)
+        times = [_time_batch(func, loops) / loops for _ in range(repeat)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return statistics.median(times), min(times), loops
+
+
+def run(benchmarks: typing.Iterable[Benchmark],
+        repeat: int = 7,
+        min_time: float = 0.05,
+        report: typing.Callable[[str], typing.Any] = print,
+        ) -> dict[str, Result]:
+    """Run benchmarks and report each result as it finishes.
+
+    :param benchmarks: Benchmarks to run
+    :param repeat: Number of timed batches, unless overridden by a benchmark
+    :param min_time: Minimum time of one batch in seconds
+    :param report: Function to report progress lines to
+    :return results: Results by benchmark names, skipped benchmarks are left out
+    """
+    results: dict[str, Result] = {}
+    for bench in benchmarks:
+        try:
+            func = bench.setup()
+        except BenchmarkSkipped as e:
+            report(f"{bench.name:<52} skipped: {e}")
+            continue
+        bench_repeat = min(repeat, bench.repeat) if bench.repeat is not None else repeat
+        median, minimum, loops = measure(func, bench_repeat, min_time)
+        results[bench.name] = Result(bench.name, median, minimum, loops, bench_repeat)
+        report(f"{bench.name:<52} {format_time(median):>10} (min {format_time(minimum)}, "
+               f"{loops} loops x {bench_repeat})")
+    return results
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a suitable unit."""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def _environment() -> dict[str, str | None]:
+    try:
+        commit: str | None = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=pathlib.Path(__file__).parent, check=True,
+            ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "commit": commit,
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+
+
+def save_results(results: dict[str, Result], path: pathlib.Path) -> None:
+    """Save results with environment info to a JSON file.
+
+    :param results: Results to save
+    :param path: Path of the JSON file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "environment": _environment(),
+        "results": {name: result.as_dict() for name, result in results.items()},
+        }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: pathlib.Path) -> tuple[dict[str, typing.Any], dict[str, Result]]:
+    """Load results saved by `save_results()`.
+
+    :param path: Path of the JSON file
+    :return results: `(environment, results)`
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data["environment"], {
+        name: Result(**result) for name, result in data["results"].items()
+        }
+
+
+def compare(results: dict[str, Result],
+            baseline: dict[str, Result],
+            threshold: float = 0.1,
+            report: typing.Callable[[str], typing.Any] = print,
+            ) -> list[str]:
+    """Compare results against a baseline and report each benchmark in both.
+
+    :param results: Current results
+    :param baseline: Baseline results
+    :param threshold: 
+        Relative slowdown of median allowed before reported as regression, widened to twice the 
+        spread of the benchmark in either results if larger
+    :param report: Function to report lines to
+    :return regressions: Names of benchmarks that regressed
+    """
+    regressions: list[str] = []
+    for name, result in results.items():
+        if name not in baseline:
+            report(f"{name:<52} {'new':>10}")
+            continue
+        ratio = result.median / baseline[name].median
+        allowed = max(threshold, 2 * result.spread, 2 * baseline[name].spread)
+        if ratio > 1 + allowed:
+            verdict = "SLOWER"
+            regressions.append(name)
+        elif ratio < 1 / (1 + allowed):
+            verdict = "faster"
+        else:
+            verdict = "same"
+        report(f"{name:<52} {ratio:>9.2f}x {verdict}")
+    return regressions
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+    """Command line entry, see `python -m benchmarks --help`."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run Charmy benchmarks.",
+        )
+    parser.add_argument("patterns", nargs="*", help="glob patterns of benchmark names to run")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    parser.add_argument("--quick", action="store_true",
+                        help="skip slow benchmarks and time fewer batches")
+    parser.add_argument("--repeat", type=int, default=None, help="number of timed batches")
+    parser.add_argument("--min-time", type=float, default=None,
+                        help="minimum time of one batch in seconds")
+    parser.add_argument("--save", metavar="NAME", help="save results as baseline NAME")
+    parser.add_argument("--compare", metavar="NAME", help="compare results with baseline NAME")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative slowdown of median reported as regression, widened to the "
+                             "noise of each benchmark (default 0.1)")
+    parser.add_argument("--check", action="store_true",
+                        help="exit with status 1 if any benchmark regressed")
+    args = parser.parse_args(argv)
+
+    from . import bench_geometry, bench_events, bench_hit_testing, bench_frames # Register all
+
+    benchmarks = select(args.patterns, args.quick)
+    if args.list:
+        for bench in benchmarks:
+            print(bench.name + (" (slow)" if bench.slow else ""))
+        return 0
+    repeat = args.repeat if args.repeat is not None else (3 if args.quick else 7)
+    min_time = args.min_time if args.min_time is not None else (0.01 if args.quick else 0.05)
+    print(f"Python {platform.python_version()} on {platform.platform()}")
+    results = run(benchmarks, repeat, min_time)
+    if args.save:
+        path = BASELINES_DIR / f"{args.save}.json"
+        save_results(results, path)
+        print(f"Saved baseline to {path}")
+    if args.compare:
+        environment, baseline = load_results(BASELINES_DIR / f"{args.compare}.json")
+        regressions = compare(results, baseline, args.threshold, report=lambda line: None)
+        if regressions:
+            # Time them again with more batches, to tell real regressions from bursts of load
+            print(f"\nTiming {len(regressions)} possibly regressed benchmark(s) again...")
+            results.update(run(select(regressions), max(repeat * 3, 15), min_time))
+        print(f"\nCompared with baseline {args.compare} "
+              f"(commit {environment.get('commit')}, Python {environment.get('python')}):")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than "
+                  f"{args.threshold:.0%}: {', '.join(regressions)}")
+            if args.check:
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
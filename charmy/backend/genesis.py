@@ -19,6 +19,13 @@ import ctypes
 import math
 import warnings
 import time
+import collections
+import functools
+
+try:
+    import numpy
+except ImportError:
+    numpy = None # 👈 Optional, only used to copy pixels faster
 
 from charmy.backend import template
 
@@ -26,6 +33,7 @@ import charmy.backend.utils as charmy_stuff
 
 if typing.TYPE_CHECKING:
     from charmy.widgets import window as _window
+    from charmy.utils import frame_stats as _frame_stats
 
 __all__ = ["Backend", "DEBUG_FLAGS"]
 
@@ -37,6 +45,323 @@ class DEBUG_FLAGS:
     WARN_UNCLOSED_SHAPES        : bool = False
 
 
+# region Pixel copying
+
+def blit_regions(src: typing.Any, src_stride: int, dst: typing.Any, dst_stride: int, 
+                 regions: typing.Sequence[tuple[int, int, int, int]], 
+                 bytes_per_pixel: int = 4) -> None:
+    """Copy rect regions of pixels between two buffers of the same pixel format.
+
+    Each region is copied as one strided 2-D slice assignment with NumPy if installed, otherwise
+    with slices of memoryviews, row by row unless the region covers whole rows of both buffers.
+
+    :param src: Buffer of source pixels
+    :param src_stride: Bytes per row of source pixels
+    :param dst: Writable buffer of destination pixels
+    :param dst_stride: Bytes per row of destination pixels
+    :param regions: Regions to copy, in `(x, y, width, height)` already clamped to both buffers
+    :param bytes_per_pixel: Bytes per pixel of both buffers
+    """
+    if len(regions) == 0:
+        return
+    src_view = memoryview(src).cast("B")
+    dst_view = memoryview(dst).cast("B")
+    if numpy is not None:
+        src_rows = numpy.frombuffer(src_view, dtype=numpy.uint8)
+        src_rows = src_rows[:len(src_rows) // src_stride * src_stride].reshape(-1, src_stride)
+        dst_rows = numpy.frombuffer(dst_view, dtype=numpy.uint8)
+        dst_rows = dst_rows[:len(dst_rows) // dst_stride * dst_stride].reshape(-1, dst_stride)
+        for x, y, width, height in regions:
+            start, end = x * bytes_per_pixel, (x + width) * bytes_per_pixel
+            dst_rows[y:y + height, start:end] = src_rows[y:y + height, start:end]
+        return
+    for x, y, width, height in regions:
+        row_bytes = width * bytes_per_pixel
+        src_offset = y * src_stride + x * bytes_per_pixel
+        dst_offset = y * dst_stride + x * bytes_per_pixel
+        if src_stride == dst_stride == row_bytes:
+            # Whole rows in both buffers, so the region is contiguous
+            dst_view[dst_offset:dst_offset + row_bytes * height] = \
+                src_view[src_offset:src_offset + row_bytes * height]
+            continue
+        for _ in range(height):
+            dst_view[dst_offset:dst_offset + row_bytes] = \
+                src_view[src_offset:src_offset + row_bytes]
+            src_offset += src_stride
+            dst_offset += dst_stride
+
+
+# region Path caching
+
+class PathCache:
+    """LRU cache of Cairo paths of shapes, each built once in coordinates of the shape itself.
+
+    Paths are keyed by `cache_key` of shapes, which is cached by the shapes and renewed as soon as 
+    they are changed, so changed shapes never get stale paths, and stale paths are evicted as least 
+    recently used. Shapes with the same geometry share one path, whichever object they belong to.
+    """
+
+    max_entries: int = 1024
+
+    def __init__(self):
+        self._paths: collections.OrderedDict[typing.Hashable, cairo.Path] = \
+            collections.OrderedDict()
+        self._context: cairo.Context | None = None # Scratch context to build paths on
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, shape: charmy_stuff.styles.shape.SingleShape) -> cairo.Path:
+        """Get path of a shape, building and caching it if not cached yet.
+
+        :param shape: The shape
+        :return path: Path of the shape, to be added with `cairo.Context.append_path()`
+        """
+        key = shape.cache_key
+        path = self._paths.get(key)
+        if path is not None:
+            self._paths.move_to_end(key)
+            self.hits += 1
+            return path
+        self.misses += 1
+        if self._context is None:
+            self._context = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+        self._context.new_path()
+        ShapeBase.cairo_append_shape(self._context, shape)
+        path = self._context.copy_path()
+        self._context.new_path()
+        self._paths[key] = path
+        if len(self._paths) > self.max_entries:
+            self._paths.popitem(last=False)
+        return path
+
+    def clear(self) -> None:
+        """Forget all cached paths."""
+        self._paths.clear()
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+path_cache = PathCache()
+
+
+# region Font caching
+
+class FontCache:
+    """Cache of Cairo font faces and scaled fonts of text styles, shared by all windows.
+
+    Scaled fonts are made with identity transform and default font options, and are used to draw as 
+    well as to measure texts, so measuring needs no Cairo context. Least recently used scaled fonts 
+    are evicted, while font faces are few and kept.
+    """
+
+    max_scaled_fonts: int = 256
+
+    def __init__(self):
+        self._faces: dict[tuple[str, typing.Any, typing.Any], cairo.ToyFontFace] = {}
+        self._scaled_fonts: collections.OrderedDict[typing.Hashable, cairo.ScaledFont] = \
+            collections.OrderedDict()
+        self._font_options: cairo.FontOptions | None = None
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_face(self, font: str, slant: typing.Any, weight: typing.Any) -> cairo.ToyFontFace:
+        """Get a font face, creating it if not cached yet.
+
+        :param font: Font family name
+        :param slant: Cairo font slant
+        :param weight: Cairo font weight
+        """
+        key = (font, slant, weight)
+        face = self._faces.get(key)
+        if face is None:
+            face = self._faces[key] = cairo.ToyFontFace(font, slant, weight)
+        return face
+
+    def get(self, style: charmy_stuff.styles.text_style.TextStyle) -> cairo.ScaledFont:
+        """Get scaled font of a text style, creating it if not cached yet.
+
+        :param style: The text style
+        :return scaled_font: The scaled font, in size of the text style
+        """
+        return self.get_scaled_font(style.font, style.weight, style.italic, style.size)
+
+    def get_scaled_font(self, font: str, weight: int, italic: bool, size: float, 
+                        ) -> cairo.ScaledFont:
+        """Get scaled font of a text style given by its fields, see `get()`."""
+        key = (font, weight, italic, size)
+        scaled_font = self._scaled_fonts.get(key)
+        if scaled_font is not None:
+            self._scaled_fonts.move_to_end(key)
+            self.hits += 1
+            return scaled_font
+        self.misses += 1
+        face = self.get_face(
+            font, 
+            cairo.FontSlant.ITALIC if italic else cairo.FontSlant.NORMAL, 
+            cairo.FontWeight.BOLD if weight >= charmy_stuff.styles.text_style.WEIGHT.BOLD \
+                else cairo.FontWeight.NORMAL, 
+            )
+        if self._font_options is None:
+            self._font_options = cairo.FontOptions()
+        scaled_font = cairo.ScaledFont(
+            face, cairo.Matrix(xx=size, yy=size), cairo.Matrix(), self._font_options, 
+            )
+        self._scaled_fonts[key] = scaled_font
+        if len(self._scaled_fonts) > self.max_scaled_fonts:
+            self._scaled_fonts.popitem(last=False)
+        return scaled_font
+
+    def clear(self) -> None:
+        """Forget all cached fonts."""
+        self._faces.clear()
+        self._scaled_fonts.clear()
+
+font_cache = FontCache()
+
+
+class GlyphCache:
+    """LRU cache of glyphs of texts, shaped once with `text_to_glyphs()` of scaled fonts.
+
+    Glyphs are positioned with the origin of the text at `(0, 0)`, and drawn with `show_glyphs()` 
+    under a translation to where the text is. Least recently used texts are evicted when the cache 
+    holds more than `max_glyphs` glyphs in total.
+    """
+
+    max_glyphs: int = 65536
+
+    def __init__(self):
+        self._glyphs: collections.OrderedDict[typing.Hashable, list[cairo.Glyph]] = \
+            collections.OrderedDict()
+        self.glyph_count: int = 0 # Glyphs of all texts in cache
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, text: str, style: charmy_stuff.styles.text_style.TextStyle) -> list[cairo.Glyph]:
+        """Get glyphs of a text in a style, shaping and caching them if not cached yet.
+
+        :param text: The text
+        :param style: Style of the text
+        :return glyphs: Glyphs to draw with `show_glyphs()`, with origin of the text at `(0, 0)`
+        """
+        key = (text, style.font, style.size, style.weight, style.italic)
+        glyphs = self._glyphs.get(key)
+        if glyphs is not None:
+            self._glyphs.move_to_end(key)
+            self.hits += 1
+            return glyphs
+        self.misses += 1
+        glyphs = font_cache.get(style).text_to_glyphs(0, 0, text, with_clusters=False)
+        self._glyphs[key] = glyphs
+        self.glyph_count += len(glyphs)
+        while self.glyph_count > self.max_glyphs and len(self._glyphs) > 1:
+            self.glyph_count -= len(self._glyphs.popitem(last=False)[1])
+        return glyphs
+
+    def clear(self) -> None:
+        """Forget all cached glyphs."""
+        self._glyphs.clear()
+        self.glyph_count = 0
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+glyph_cache = GlyphCache()
+
+
+# region Context state
+
+class ContextState:
+    """Tracks state of a Cairo context set through it, and skips calls that would not change it.
+
+    Source color, line width, fill rule, font face, font size and scaled font are tracked. Only state 
+    set through the tracker is known to it, so call `forget()` after changing state on the context 
+    directly. Each skipped call is counted as `calls_saved` of the current frame in `frame_stats`.
+
+    A window keeps the tracker of its own context across frames, as do layers while rendered, so 
+    state set by a batch of shapes drawn directly is not set again by following batches, even with 
+    recorded objects replayed in between (which only change the source). Recordings get a tracker 
+    of their own, as each of them is replayed with its own state.
+    """
+
+    __slots__ = ("context", "frame_stats", "source", "line_width", "fill_rule", "font_face", 
+                 "font_size", "scaled_font")
+
+    def __init__(self, 
+                 context: cairo.Context, 
+                 frame_stats: _frame_stats.FrameStats | None = None, 
+                 ):
+        """To track state of a Cairo context.
+
+        :param context: The Cairo context, whose state must be the default one
+        :param frame_stats: Frame statistics to count skipped calls into
+        """
+        self.context: cairo.Context = context
+        self.frame_stats: _frame_stats.FrameStats | None = frame_stats
+        self.source: typing.Any = None # Source color in RGBA, `None` if unknown
+        self.line_width: float | None = None
+        self.fill_rule: typing.Any = None
+        self.font_face: tuple[str, typing.Any, typing.Any] | None = None
+        self.font_size: float | None = None
+        self.scaled_font: cairo.ScaledFont | None = None
+
+    def forget(self) -> None:
+        """Forget all tracked state, so the next call of each setter is issued for sure."""
+        self.source = self.line_width = self.fill_rule = self.font_face = self.font_size = None
+        self.scaled_font = None
+
+    def _saved(self) -> None:
+        if self.frame_stats is not None:
+            self.frame_stats.current.calls_saved += 1
+
+    def set_source_rgba(self, r: float, g: float, b: float, a: float = 1.) -> None:
+        """Set source of the context to a color, same as `cairo.Context.set_source_rgba()`."""
+        color = (r, g, b, a)
+        if color == self.source:
+            return self._saved()
+        self.source = color
+        self.context.set_source_rgba(r, g, b, a)
+
+    def set_line_width(self, width: float) -> None:
+        """Set line width of the context, same as `cairo.Context.set_line_width()`."""
+        if width == self.line_width:
+            return self._saved()
+        self.line_width = width
+        self.context.set_line_width(width)
+
+    def set_fill_rule(self, fill_rule: typing.Any) -> None:
+        """Set fill rule of the context, same as `cairo.Context.set_fill_rule()`."""
+        if fill_rule == self.fill_rule:
+            return self._saved()
+        self.fill_rule = fill_rule
+        self.context.set_fill_rule(fill_rule)
+
+    def select_font_face(self, family: str, slant: typing.Any, weight: typing.Any) -> None:
+        """Set font face of the context, same as `cairo.Context.select_font_face()`."""
+        font_face = (family, slant, weight)
+        if font_face == self.font_face:
+            return self._saved()
+        self.font_face = font_face
+        self.scaled_font = None
+        self.context.select_font_face(family, slant, weight)
+
+    def set_font_size(self, size: float) -> None:
+        """Set font size of the context, same as `cairo.Context.set_font_size()`."""
+        if size == self.font_size:
+            return self._saved()
+        self.font_size = size
+        self.scaled_font = None
+        self.context.set_font_size(size)
+
+    def set_scaled_font(self, scaled_font: cairo.ScaledFont) -> None:
+        """Set font face, size and options of the context at once, same as 
+        `cairo.Context.set_scaled_font()`."""
+        if scaled_font is self.scaled_font:
+            return self._saved()
+        self.scaled_font = scaled_font
+        self.font_face = self.font_size = None
+        self.context.set_scaled_font(scaled_font)
+
+
 # region Backend class
 
 class Backend(template.Backend):
@@ -58,8 +383,32 @@ class Backend(template.Backend):
     
     def backend_init(self, **kwargs) -> None:
         # sdl2.ext.init()
+        self._wakeup_event_type: int = sdl2.SDL_RegisterEvents(1)
+        # 👆 User event pushed to wake up wait_events() from other threads
         return
 
+    def wait_events(self, timeout: float | None = None) -> None:
+        """Block until SDL events arrive, `wakeup()` is called, or timeout.
+
+        Events are left in the queue, to be handled by windows when pumping events.
+
+        :param timeout: Time to wait at most in seconds, or `None` to wait until events arrive
+        """
+        if self._wakeup_event_type == 0xFFFFFFFF:
+            return super().wait_events(timeout) # Ran out of SDL user events, cannot be woken up
+        if timeout is None:
+            sdl2.SDL_WaitEvent(None)
+        else:
+            sdl2.SDL_WaitEventTimeout(None, math.ceil(timeout * 1000))
+
+    def wakeup(self) -> None:
+        """Wake up `wait_events()` immediately by pushing an SDL user event, thread-safe."""
+        if self._wakeup_event_type == 0xFFFFFFFF:
+            return super().wakeup()
+        event = sdl2.SDL_Event()
+        event.type = self._wakeup_event_type
+        sdl2.SDL_PushEvent(ctypes.byref(event))
+
 
 # region Window
 
@@ -93,6 +442,10 @@ class WindowBase(template.WindowBase):
     supports = WindowSupportState()
     Backend = Backend
 
+    zero_copy: typing.ClassVar[bool] = True
+    # 👆 Let Cairo draw straight into SDL window surface if pixel formats match, instead of drawing 
+    # on a private surface and copying pixels to SDL window surface every frame
+
     def __init__(self, backend: template.Backend, charmy_window: _window.WindowEntity):
         """Creates a window.
 
@@ -124,12 +477,14 @@ class WindowBase(template.WindowBase):
         # sdl2.SDL_SetWindowSize(self.window, self.size[0], self.size[1])
 
         # Initialize Cairo canvas
-        self.surface: cairo.ImageSurface = cairo.ImageSurface(
-            cairo.FORMAT_ARGB32, self.size[0], self.size[1])
-        self.cairo_context: cairo.Context = cairo.Context(self.surface)
-        self.cairo_context.set_line_join(cairo.LINE_JOIN_ROUND)
-        self.cairo_context.set_line_cap(cairo.LINE_CAP_ROUND)
-        self.cairo_context.set_source_rgba(0, 0, 0, 1.0)  # Black back
+        self.surface: cairo.ImageSurface
+        self.cairo_context: cairo.Context
+        self.cairo_state: ContextState # 👈 Set state of cairo_context through this
+        self.zero_copy_active: bool = False
+        # 👆 Whether Cairo is drawing straight into SDL window surface currently
+        self._window_pixels: ctypes.Array | None = None
+        self.cairo_reinit_surface()
+        self.cairo_state.set_source_rgba(0, 0, 0, 1.0)  # Black back
         self.cairo_context.paint()
 
     def show(self) -> typing.Self:
@@ -140,13 +495,178 @@ class WindowBase(template.WindowBase):
         # self.window.show()
         return self
 
+    def draw_background(self) -> typing.Self:
+        """Draw the background of the window, by painting the texture within current clip.
+
+        :return self: The WindowBase itself
+        """
+        if TextureBase.cairo_set_context_texture(self.cairo_state, self.background):
+            self.cairo_context.paint()
+        return self
+
+    def set_clip(self, 
+                 regions: typing.Sequence[charmy_stuff.styles.shape.ShapeRange]
+                 ) -> typing.Self:
+        """Restrict following drawing to the given regions with a Cairo clip.
+
+        :param regions: Regions where drawing is allowed
+        :return self: The WindowBase itself
+        """
+        self.cairo_context.reset_clip()
+        self.cairo_context.new_path() # Avoid leftover path being included in clip
+        for (x, y), (w, h) in regions:
+            self.cairo_context.rectangle(x, y, w, h)
+        self.cairo_context.clip()
+        return self
+
+    def reset_clip(self) -> typing.Self:
+        """Remove the clip set by `set_clip()`.
+
+        :return self: The WindowBase itself
+        """
+        self.cairo_context.reset_clip()
+        return self
+
+    def record(self, 
+               region: charmy_stuff.styles.shape.ShapeRange | None, 
+               draw: typing.Callable[[], typing.Any]
+               ) -> cairo.RecordingSurface:
+        """Record Cairo commands issued by `draw()` into a Cairo recording surface.
+
+        The recording is bounded to the region, so replaying it only paints over the region instead
+        of the whole clip.
+
+        :param region: Region of the window `draw()` may paint in, unbounded if `None`
+        :param draw: Function that draws with this window's backend
+        :return recording: The recording surface holding the commands
+        """
+        extents = None
+        if region is not None:
+            (x, y), (w, h) = region
+            left, top = math.floor(x), math.floor(y)
+            extents = cairo.Rectangle(left, top, math.ceil(x + w) - left, math.ceil(y + h) - top)
+        recording = cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA, extents)
+        window_context = self.cairo_context, self.cairo_state
+        self.cairo_set_context(cairo.Context(recording)) # Drawing APIs draw on this context
+        try:
+            draw()
+        finally:
+            self.cairo_context, self.cairo_state = window_context
+        return recording
+
+    def replay(self, recording: cairo.RecordingSurface) -> typing.Self:
+        """Replay commands recorded by `record()` within current clip.
+
+        :param recording: The recording surface to replay
+        :return self: The WindowBase itself
+        """
+        self.cairo_context.set_source_surface(recording, 0, 0)
+        self.cairo_state.source = None
+        self.cairo_context.paint()
+        return self
+
+    def render_layer(self, 
+                     region: charmy_stuff.styles.shape.ShapeRange, 
+                     draw: typing.Callable[[], typing.Any]
+                     ) -> cairo.ImageSurface:
+        """Render what `draw()` draws within a region into an offscreen Cairo image surface.
+
+        :param region: Region of the window covered by the layer
+        :param draw: Function that draws with this window's backend, in window coordinates
+        :return surface: The rendered image surface in the size of the region
+        """
+        (x, y), (w, h) = region
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, max(int(w), 1), max(int(h), 1))
+        window_context = self.cairo_context, self.cairo_state
+        self.cairo_set_context(cairo.Context(surface)) # Drawing APIs draw on this context
+        self.cairo_context.translate(-x, -y)
+        try:
+            draw()
+        finally:
+            self.cairo_context, self.cairo_state = window_context
+        return surface
+
+    def composite_layer(self, 
+                        surface: cairo.ImageSurface, 
+                        pos: charmy_stuff.styles.shape.Point
+                        ) -> typing.Self:
+        """Paint a layer surface rendered by `render_layer()` within current clip.
+
+        :param surface: The layer surface
+        :param pos: Position on the window to paint the surface at
+        :return self: The WindowBase itself
+        """
+        self.cairo_context.set_source_surface(surface, pos[0], pos[1])
+        self.cairo_state.source = None
+        self.cairo_context.paint()
+        return self
+
     def cairo_reinit_surface(self):
         """Re-init Cairo surface and canvas, only avail in Genesis backend."""
-        self.surface = cairo.ImageSurface(
-            cairo.FORMAT_ARGB32, self.size[0], self.size[1])
-        self.cairo_context = cairo.Context(self.surface)
-        self.cairo_context.set_line_join(cairo.LINE_JOIN_ROUND)
-        self.cairo_context.set_line_cap(cairo.LINE_CAP_ROUND)
+        if self.zero_copy_active:
+            # Old surface draws on pixels owned by SDL, which will be freed, so finish it first
+            self.surface.finish()
+        self.surface = None # type: ignore
+        self._window_pixels = None
+        self.zero_copy_active = False
+        if self.zero_copy:
+            zero_copy_surface = self.cairo_surface_over_window()
+            if zero_copy_surface is not None:
+                self.surface = zero_copy_surface
+                self.zero_copy_active = True
+        if self.surface is None:
+            # Fall back to a private surface, whose pixels will be copied to SDL when presenting
+            self.surface = cairo.ImageSurface(
+                cairo.FORMAT_ARGB32, self.size[0], self.size[1])
+        self.cairo_set_context(cairo.Context(self.surface))
+
+    def cairo_set_context(self, context: cairo.Context) -> None:
+        """Make drawing APIs draw on a Cairo context, with a new `ContextState` tracking its state. 
+        Only avail in Genesis backend.
+
+        :param context: The Cairo context, in default state
+        """
+        self.cairo_context = context
+        self.cairo_state = ContextState(context, self.charmy_window.frame_stats)
+        context.set_line_join(cairo.LINE_JOIN_ROUND)
+        context.set_line_cap(cairo.LINE_CAP_ROUND)
+
+    def cairo_surface_over_window(self) -> cairo.ImageSurface | None:
+        """Create a Cairo surface that draws straight into the pixels of SDL window surface.
+
+        Only avail in Genesis backend. Returns `None` if the SDL window surface is not in the same 
+        pixel format as Cairo's `FORMAT_ARGB32` (ARGB8888 or XRGB8888 with matching pitch), or 
+        cannot be accessed without locking.
+        """
+        self._window_surface = sdl2.SDL_GetWindowSurface(self.window)
+        if not self._window_surface:
+            return None
+        window_surface = self._window_surface.contents
+        if sdl2.SDL_MUSTLOCK(window_surface):
+            return None
+        if window_surface.format.contents.format not in (
+                sdl2.SDL_PIXELFORMAT_ARGB8888, sdl2.SDL_PIXELFORMAT_RGB888):
+            # 👆 Both are packed 32-bit pixels with (unused) alpha at highest byte, same as Cairo
+            return None
+        width, height, pitch = window_surface.w, window_surface.h, window_surface.pitch
+        if (width, height) != tuple(self.size):
+            return None
+        if pitch != cairo.ImageSurface.format_stride_for_width(cairo.FORMAT_ARGB32, width):
+            return None
+        pixels_ptr = window_surface.pixels
+        base_pixels = pixels_ptr.value if hasattr(pixels_ptr, "value") else pixels_ptr
+        if not base_pixels:
+            return None
+        self._window_pixels = (ctypes.c_char * (pitch * height)).from_address(base_pixels)
+        return cairo.ImageSurface.create_for_data(
+            self._window_pixels, cairo.FORMAT_ARGB32, width, height, pitch
+            )
+
+    def _window_surface_changed(self) -> bool:
+        """Check if SDL replaced the window surface that Cairo draws into (zero-copy mode only)."""
+        window_surface = sdl2.SDL_GetWindowSurface(self.window)
+        return ctypes.cast(window_surface, ctypes.c_void_p).value != \
+            ctypes.cast(self._window_surface, ctypes.c_void_p).value
 
     def set_pos(self, new: charmy_stuff.styles.shape.Point) -> typing.Self:
         """Set window position.
@@ -238,88 +758,120 @@ class WindowBase(template.WindowBase):
             case sdl2.SDL_QUIT:
                 self.charmy_window.destroy()
 
-    def update(self, redraw: bool | charmy_stuff.styles.shape.ShapeRange = True) -> typing.Self:
-        """Update the window.
+    def present(self, 
+                regions: typing.Sequence[charmy_stuff.styles.shape.ShapeRange] | bool = True
+                ) -> typing.Self:
+        """Copy drawn content to the SDL window surface and present it on screen at once.
 
+        :param regions: Regions to present, or `True` for the whole window
         :return self: The WindowBase itself
         """
-        if redraw != False and \
-            self.surface.get_width() == self.size[0] and self.surface.get_height() == self.size[1]:
-            # Following Vibed with Deepseek & GitHub Copilot (model GPT-5 mini)
-
-            # Get Cairo data（memoryview）
-            cairo_data = self.surface.get_data()
-
-            # Get SDL2 window surface
-            self._window_surface = sdl2.SDL_GetWindowSurface(self.window)
-            # Lock the surface
-            sdl2.SDL_LockSurface(self._window_surface)
-
-            # Get pixels pointer
-            pixels_ptr = self._window_surface.contents.pixels
-            # SDL surface 'pixels' may be an int or a c_void_p; normalize to integer base address
-            base_pixels = pixels_ptr.value if hasattr(pixels_ptr, "value") else pixels_ptr
-            # Improvement: Get lower level pointer directly to avoid tobytes() copy
-            # Calc data size
-            pitch = self._window_surface.contents.pitch
-            window_data_size = pitch * self.size[1]
-
-            # Prepare Cairo stride/size
-            cairo_stride = self.surface.get_stride()
-            cairo_data_size = cairo_stride * self.size[1]
-            # Create a ctypes array view of cairo data for address arithmetic
-            cairo_arr = (ctypes.c_char * cairo_data_size).from_buffer(cairo_data)
-            cairo_base_addr = ctypes.addressof(cairo_arr)
-
-            bytes_per_pixel = 4
-
-            # If redraw is a region ((x,y),(w,h)), copy only that region row-by-row.
-            # Consider any non-bool value as a region specification.
-            is_region = not isinstance(redraw, bool)
-
-            if is_region:
-                # Extract and clamp region
-                sx, sy = int(redraw[0][0]), int(redraw[0][1])
-                rw, rh = int(redraw[1][0]), int(redraw[1][1])
-                if sx < 0:
-                    rw += sx
-                    sx = 0
-                if sy < 0:
-                    rh += sy
-                    sy = 0
-                if sx >= self.size[0] or sy >= self.size[1] or rw <= 0 or rh <= 0:
-                    # Nothing to copy
-                    pass
-                else:
-                    # Clamp width/height to remaining area
-                    rw = max(0, min(rw, self.size[0] - sx))
-                    rh = max(0, min(rh, self.size[1] - sy))
-                    row_bytes = rw * bytes_per_pixel
-                    # Copy each row individually using stride/pitch
-                    for row in range(rh):
-                        src_offset = (sy + row) * cairo_stride + sx * bytes_per_pixel
-                        dst_offset = (sy + row) * pitch + sx * bytes_per_pixel
-                        src_addr = ctypes.c_void_p(cairo_base_addr + src_offset)
-                        dst_addr = ctypes.c_void_p(base_pixels + dst_offset)
-                        ctypes.memmove(dst_addr, src_addr, row_bytes)
+        if regions is False or (not isinstance(regions, bool) and len(regions) == 0):
+            return self # Nothing to present
+        if self.surface.get_width() != self.size[0] or self.surface.get_height() != self.size[1]:
+            return self # Surface not synced with window size yet, skip this frame
+        if self.zero_copy_active:
+            # Cairo already drew into SDL window surface, only need to present
+            self.surface.flush()
+            if self._window_surface_changed():
+                # SDL re-created window surface, so re-init and redraw everything next frame
+                self.cairo_reinit_surface()
+                self.charmy_window._late_damage.append(((0, 0), self.size))
+                return self
+            if regions is True:
+                sdl2.SDL_UpdateWindowSurface(self.window)
             else:
-                # Full-surface copy (existing behavior)
-                # Convert memoryview to ctypes data
-                cairo_ptr = ctypes.cast(
-                    (ctypes.c_char * window_data_size).from_buffer(cairo_data),
-                    ctypes.c_void_p
-                )
-                # Copy data
-                ctypes.memmove(ctypes.c_void_p(base_pixels), cairo_ptr, window_data_size)
+                self._sdl2_update_rects(regions)
+            return self
+        # Following Vibed with Deepseek & GitHub Copilot (model GPT-5 mini)
+
+        # Get Cairo data（memoryview）
+        self.surface.flush()
+        cairo_data = self.surface.get_data()
+        cairo_stride = self.surface.get_stride()
 
-            # Unlock surface
+        # Get SDL2 window surface
+        self._window_surface = sdl2.SDL_GetWindowSurface(self.window)
+        # Lock the surface
+        sdl2.SDL_LockSurface(self._window_surface)
+
+        # Get pixels pointer
+        pixels_ptr = self._window_surface.contents.pixels
+        # SDL surface 'pixels' may be an int or a c_void_p; normalize to integer base address
+        base_pixels = pixels_ptr.value if hasattr(pixels_ptr, "value") else pixels_ptr
+        # Improvement: Get lower level pointer directly to avoid tobytes() copy
+        # Calc data size
+        pitch = self._window_surface.contents.pitch
+        window_data = (ctypes.c_char * (pitch * self.size[1])).from_address(base_pixels)
+
+        record = self.charmy_window.frame_stats.current
+        if regions is True:
+            # Full-surface copy
+            blit_regions(cairo_data, cairo_stride, window_data, pitch, 
+                         [(0, 0, self.size[0], self.size[1])])
             sdl2.SDL_UnlockSurface(self._window_surface)
+            sdl2.SDL_UpdateWindowSurface(self.window)
+            record.bytes_copied += self.size[0] * self.size[1] * 4
+            return self
+
+        # Copy all regions with a single call first, then present them with a single call
+        clamped_regions = [
+            clamped for clamped in map(self._clamp_region, regions) if clamped is not None
+            ]
+        blit_regions(cairo_data, cairo_stride, window_data, pitch, clamped_regions)
+        record.bytes_copied += sum(w * h * 4 for _, _, w, h in clamped_regions)
+
+        # Unlock surface
+        sdl2.SDL_UnlockSurface(self._window_surface)
 
         # Update display
-        sdl2.SDL_UpdateWindowSurface(self.window)
+        self._sdl2_update_rects(regions)
+        return self
+
+    def _clamp_region(self, 
+                      region: charmy_stuff.styles.shape.ShapeRange
+                      ) -> tuple[int, int, int, int] | None:
+        """Clamp a region to the window, returns `(x, y, w, h)` or `None` if nothing left."""
+        sx, sy = int(region[0][0]), int(region[0][1])
+        rw, rh = int(region[1][0]), int(region[1][1])
+        if sx < 0:
+            rw += sx
+            sx = 0
+        if sy < 0:
+            rh += sy
+            sy = 0
+        if sx >= self.size[0] or sy >= self.size[1] or rw <= 0 or rh <= 0:
+            return None
+        # Clamp width/height to remaining area
+        rw = max(0, min(rw, self.size[0] - sx))
+        rh = max(0, min(rh, self.size[1] - sy))
+        return sx, sy, rw, rh
+
+    def _sdl2_update_rects(self, 
+                           regions: typing.Sequence[charmy_stuff.styles.shape.ShapeRange]
+                           ) -> None:
+        """Present regions of SDL window surface on screen with a single call."""
+        sdl_rects: list[sdl2.SDL_Rect] = []
+        for region in regions:
+            clamped = self._clamp_region(region)
+            if clamped is not None:
+                sdl_rects.append(sdl2.SDL_Rect(*clamped))
+        if len(sdl_rects) != 0:
+            sdl2.SDL_UpdateWindowSurfaceRects(
+                self.window, (sdl2.SDL_Rect * len(sdl_rects))(*sdl_rects), len(sdl_rects)
+                )
 
-        # Handle events
-        for event in sdl2.ext.get_events():
+    def pump_events(self) -> typing.Self:
+        """Fetch SDL2 events and handle them, should be called once per frame.
+
+        :return self: The WindowBase itself
+        """
+        record = self.charmy_window.frame_stats.current
+        start_time = time.perf_counter()
+        events = sdl2.ext.get_events()
+        fetched_time = time.perf_counter()
+        record.pump += fetched_time - start_time
+        for event in events:
             match event.type:
                 case sdl2.SDL_WINDOWEVENT:
                     if event.window.event == sdl2.SDL_WINDOWEVENT_RESIZED:
@@ -328,6 +880,19 @@ class WindowBase(template.WindowBase):
                         sdl2.SDL_GetWindowSize(self.window, w, h)
                         self.set_size((w.value, h.value), _passive = True)
             self.sdl2_handle_event(event)
+        record.dispatch += time.perf_counter() - fetched_time
+        return self
+
+    def update(self, redraw: bool | charmy_stuff.styles.shape.ShapeRange = True) -> typing.Self:
+        """Update the window, by presenting the region (or whole window) and handling events.
+
+        :return self: The WindowBase itself
+        """
+        if isinstance(redraw, bool):
+            self.present(redraw)
+        else:
+            self.present([redraw])
+        self.pump_events()
         return self
 
     def close(self):
@@ -336,16 +901,6 @@ class WindowBase(template.WindowBase):
 
 # region Lines
 
-def _calc_point_actual_pos(
-        line_point: charmy_stuff.styles.shape.Point, 
-        anchor: charmy_stuff.styles.shape.Point, 
-        offset: charmy_stuff.styles.shape.Point, 
-        ) -> charmy_stuff.styles.shape.Point:
-    return (
-        line_point[0] - anchor[0] + offset[0], 
-        line_point[1] - anchor[1] + offset[1]
-        )
-
 class LineSupportState(template.LineSupportState):
     """Flags all supported line types."""
     line                : bool = True
@@ -359,23 +914,55 @@ class LineBase(template.LineBase):
     """Line-related APIs in Genesis backend."""
     supports: LineSupportState = LineSupportState()
 
+    @staticmethod
+    def cairo_append_line(context: cairo.Context, 
+                          line: charmy_stuff.styles.shape.LinePath, 
+                          connected: bool = False, 
+                          ) -> None:
+        """Add a line to current path of a Cairo context, in coordinates of the line itself. Only 
+        available in Genesis backend.
+
+        Place the line with a transform of the context (e.g. `context.translate()`) instead of 
+        moving its points, so no point needs to be calculated in Python.
+
+        :param context: The Cairo context
+        :param line: The line to add
+        :param connected: If the line starts at current point, so it continues current path 
+                          without a `move_to()`, as lines of a shape
+        """
+        cmsh = charmy_stuff.styles.shape # CMSH = abbr. CharMy SHape
+        if isinstance(line, (cmsh.Line, cmsh.PolyLine)):
+            points = line.points
+            if not connected:
+                context.move_to(*points[0])
+            for point_x, point_y in points[1:]:
+                context.line_to(point_x, point_y)
+        elif isinstance(line, cmsh.CircleArc):
+            # Cairo connects the arc to current point by itself
+            start_orient_rad = (line.start_orient - 90) * (math.pi / 180)
+            end_orient_rad = (line.end_orient - 90) * (math.pi / 180)
+            context.arc(*line.center, line.radius, start_orient_rad, end_orient_rad)
+        elif isinstance(line, cmsh.CubicBezier):
+            if not connected:
+                context.move_to(*line.points[0])
+            context.curve_to(*line.points[1], *line.points[2], *line.points[3])
+        else:
+            template.not_implemented_func(Backend.friendly_name, f"Drawing line type {line.type}")
+
     @staticmethod
     def draw_line(drawn_line: charmy_stuff.graphics.DrawnLine, 
                   stroke: bool = True, noskip: bool = False, 
                   *args, **kwargs):
         """To draw a line on a specific window.
 
+        The line is drawn in its own coordinates under a translation of `offset - anchor`.
+
         Args:
             line: The line to be drawn
             window: The WindowBase to draw line
         """
         # Unpack the DrawnLine
-        line = drawn_line.line
         window = drawn_line.window.backend_base
-        texture = drawn_line.texture
-        line_width = drawn_line.width
-        anchor = drawn_line.anchor
-        offset = drawn_line.offset
 
         # Detect wrong backend
         if not isinstance(window, WindowBase):
@@ -383,60 +970,21 @@ class LineBase(template.LineBase):
                 "Wrong backend for draw_line()! Asked to draw on a window held by "
                 f"{window.Backend.friendly_name} but I serve backend {Backend.friendly_name}!"
                 )
+        context = window.cairo_context
         # Set texture & line width
-        if not TextureBase.cairo_set_context_texture(window.cairo_context, texture, noskip):
+        if not TextureBase.cairo_set_context_texture(window.cairo_state, drawn_line.texture, noskip):
             return
-        # window.cairo_context.set_line_join(cairo.LINE_JOIN_ROUND)
-        # window.cairo_context.set_line_cap(cairo.LINE_CAP_ROUND)
-        window.cairo_context.set_line_width(line_width)
-        painting_pos = tuple([int(v) for v in window.cairo_context.get_current_point()])
+        # context.set_line_join(cairo.LINE_JOIN_ROUND)
+        # context.set_line_cap(cairo.LINE_CAP_ROUND)
+        window.cairo_state.set_line_width(drawn_line.width)
         # Draw line
-        if isinstance(line, charmy_stuff.styles.shape.Line):
-            # Straight line
-            if painting_pos != _calc_point_actual_pos(line.points[0], anchor, offset):
-                # Avoid unnecessary move_to() when drawing shapes
-                window.cairo_context.move_to(
-                    *_calc_point_actual_pos(line.points[0], anchor, offset)
-                    )
-            window.cairo_context.line_to(
-                *_calc_point_actual_pos(line.points[1], anchor, offset)
-                )
-        elif isinstance(line, charmy_stuff.styles.shape.PolyLine):
-            # Polyline
-            if painting_pos != _calc_point_actual_pos(line.points[0], anchor, offset):
-                # Avoid unnecessary move_to() when drawing shapes
-                window.cairo_context.move_to(
-                    *_calc_point_actual_pos(line.points[0], anchor, offset)
-                    )
-            for index, point in enumerate(line.points):
-                if index == 0:
-                    continue
-                window.cairo_context.line_to(
-                    *_calc_point_actual_pos(point, anchor, offset)
-                    )
-        elif isinstance(line, charmy_stuff.styles.shape.CircleArc):
-            # Circle arc
-            start_orient_rad = (line.start_orient - 90) * (math.pi / 180)
-            end_orient_rad = (line.end_orient - 90) * (math.pi / 180)
-            window.cairo_context.arc(
-                *_calc_point_actual_pos(line.center, anchor, offset), 
-                line.radius, 
-                start_orient_rad, end_orient_rad)
-        elif isinstance(line, charmy_stuff.styles.shape.CubicBezier):
-            if painting_pos != _calc_point_actual_pos(line.points[0], anchor, offset):
-                # Avoid unnecessary move_to() when drawing shapes
-                window.cairo_context.move_to(
-                    *_calc_point_actual_pos(line.points[0], anchor, offset)
-                    )
-            window.cairo_context.curve_to(
-                *_calc_point_actual_pos(line.points[1], anchor, offset), 
-                *_calc_point_actual_pos(line.points[2], anchor, offset), 
-                *_calc_point_actual_pos(line.points[3], anchor, offset), 
-                )
-        else:
-            template.not_implemented_func(Backend.friendly_name, f"Drawing line type {line.type}")
+        translate_x = drawn_line.offset[0] - drawn_line.anchor[0]
+        translate_y = drawn_line.offset[1] - drawn_line.anchor[1]
+        context.translate(translate_x, translate_y)
+        LineBase.cairo_append_line(context, drawn_line.line)
+        context.translate(-translate_x, -translate_y)
         if stroke:
-            window.cairo_context.stroke()
+            context.stroke()
 
 
 # region Shapes
@@ -444,23 +992,133 @@ class LineBase(template.LineBase):
 class ShapeSupportState(template.ShapeSupportState):
     """Flags support state of shape types of this backend."""
     any_shape       : bool = True
-    rect            : bool = False
-    round_rect      : bool = False
+    rect            : bool = True
+    round_rect      : bool = True
     polygon         : bool = False
     oval            : bool = False
     sector          : bool = False
+    batch           : bool = True
 
 class ShapeBase(template.ShapeBase):
     """Shape-related APIs in Genesis backend."""
     supports: ShapeSupportState = ShapeSupportState()
 
+    @staticmethod
+    def cairo_append_shape(context: cairo.Context, 
+                           shape: charmy_stuff.styles.shape.SingleShape, 
+                           window: WindowBase | None = None, 
+                           ) -> None:
+        """Add outline of a shape to current path of a Cairo context as a closed path, in 
+        coordinates of the shape itself. Only available in Genesis backend.
+
+        :param context: The Cairo context
+        :param shape: The shape
+        :param window: Window to update after each line, for `DEBUG_FLAGS.OBSERVE_SHAPE_DRAWING`
+        """
+        if DEBUG_FLAGS.WARN_UNCLOSED_SHAPES:
+            last_line_end = shape.lines[-1].end_point
+        previous_end: charmy_stuff.styles.shape.Point | None = None
+        for line in shape.lines:
+            start_point = line.start_point
+            if DEBUG_FLAGS.FORCE_CLOSE_SHAPE and previous_end is not None:
+                # Dirty fix of closing shape: connect the path manually before drawing each line
+                context.line_to(*start_point)
+                previous_end = start_point
+            connected = previous_end is not None and \
+                abs(start_point[0] - previous_end[0]) < 1e-6 and \
+                abs(start_point[1] - previous_end[1]) < 1e-6
+            # 👆 End points of arcs come from trigonometry, so they may not be exactly the same
+            LineBase.cairo_append_line(context, line, connected)
+            previous_end = line.end_point
+            if DEBUG_FLAGS.OBSERVE_SHAPE_DRAWING and window is not None:
+                context.set_source_rgba(1, 0, 0, 1)
+                context.stroke_preserve()
+                window.update(redraw=False)
+                time.sleep(0.5)
+            if DEBUG_FLAGS.WARN_UNCLOSED_SHAPES:
+                if line.start_point != last_line_end:
+                    print(
+                        f"Shape not closed: {last_line_end} -> {line.start_point}"
+                        f" | {DEBUG_FLAGS.FORCE_CLOSE_SHAPE=}"
+                        )
+                last_line_end = line.end_point
+        context.close_path()
+
+    @staticmethod
+    def cairo_append_round_rect(context: cairo.Context, 
+                                round_rect: charmy_stuff.styles.shape.RoundRect, 
+                                ) -> None:
+        """Add a round rect to current path of a Cairo context as a closed sub path of 4 arcs, in 
+        coordinates of the round rect itself. Only available in Genesis backend.
+
+        :param context: The Cairo context
+        :param round_rect: The round rect
+        """
+        (x, y), (w, h) = round_rect.boundary
+        top_left, top_right, bottom_right, bottom_left = round_rect.radii
+        half_pi = math.pi / 2
+        context.new_sub_path() # Not connected to the end of last sub path
+        context.arc(x + w - top_right, y + top_right, top_right, -half_pi, 0)
+        context.arc(x + w - bottom_right, y + h - bottom_right, bottom_right, 0, half_pi)
+        context.arc(x + bottom_left, y + h - bottom_left, bottom_left, half_pi, math.pi)
+        context.arc(x + top_left, y + top_left, top_left, math.pi, 3 * half_pi)
+        context.close_path()
+
+    @staticmethod
+    def cairo_add_shape(context: cairo.Context, 
+                        shape: charmy_stuff.styles.shape.SingleShape, 
+                        window: WindowBase | None = None, 
+                        ) -> None:
+        """Add a shape to current path of a Cairo context, in coordinates of the shape itself. Only 
+        available in Genesis backend.
+
+        Rects and round rects are added natively, other shapes are added from `path_cache`.
+
+        :param context: The Cairo context
+        :param shape: The shape
+        :param window: Window to update after each line, for `DEBUG_FLAGS.OBSERVE_SHAPE_DRAWING`
+        """
+        cmsh = charmy_stuff.styles.shape # CMSH = abbr. CharMy SHape
+        if isinstance(shape, cmsh.Rect):
+            (x, y), (w, h) = shape.boundary
+            context.rectangle(x, y, w, h)
+        elif isinstance(shape, cmsh.RoundRect):
+            ShapeBase.cairo_append_round_rect(context, shape)
+        elif DEBUG_FLAGS.OBSERVE_SHAPE_DRAWING:
+            ShapeBase.cairo_append_shape(context, shape, window) # Build step by step
+        else:
+            context.append_path(path_cache.get(shape))
+
+    @staticmethod
+    def cairo_paint_shape_path(state: ContextState, 
+                               drawn_shape: charmy_stuff.graphics.DrawnShape, 
+                               noskip: bool = False, 
+                               ) -> None:
+        """Fill current path of a Cairo context and stroke its border with textures of a drawn 
+        shape, then clear the path. Only available in Genesis backend.
+
+        :param state: State tracker of the Cairo context
+        :param drawn_shape: The drawn shape to take textures and border width from
+        """
+        context = state.context
+        # Fill and border share the same path
+        if TextureBase.cairo_set_context_texture(state, drawn_shape.texture, noskip):
+            state.set_fill_rule(cairo.FILL_RULE_WINDING)
+            context.fill_preserve()
+        if drawn_shape.border_width != 0 and \
+            TextureBase.cairo_set_context_texture(state, drawn_shape.border_texture, noskip):
+            # If still need visible border, then stroke the path
+            state.set_line_width(drawn_shape.border_width)
+            context.stroke_preserve()
+        context.new_path()
+
     @staticmethod
     def draw_any_shape(
             drawn_shape: charmy_stuff.graphics.DrawnShape, 
             stroke: bool = True, 
             noskip: bool = False, 
             *args, **kwargs) -> None:
-        """Draw shape by lines."""
+        """Draw a single shape, placed by one translation of the context."""
         window = drawn_shape.window.backend_base
         if not isinstance(drawn_shape.shape, charmy_stuff.styles.shape.SingleShape):
             warnings.warn("draw_any_shape() is only for drawing AnyShape")
@@ -468,60 +1126,16 @@ class ShapeBase(template.ShapeBase):
         if not isinstance(window, WindowBase):
             warnings.warn(f"Wrong backend for shape {drawn_shape.id}.")
             return
-        if DEBUG_FLAGS.WARN_UNCLOSED_SHAPES:
-            last_line_end = drawn_shape.shape.lines[-1].end_point
-        for line in drawn_shape.shape.lines:
-            # Border drawn at this time will be covered by shape itself
-            # These lines are for drawing the shape itself, not for border
-            if DEBUG_FLAGS.FORCE_CLOSE_SHAPE:
-                # Dirty fix of closing shape: connect the path manually after drawing each line
-                window.cairo_context.line_to(
-                    line.start_point[0] + drawn_shape.offset[0] - drawn_shape.anchor[0], 
-                    line.start_point[1] + drawn_shape.offset[1] - drawn_shape.anchor[1], 
-                )
-            drawn_line = charmy_stuff.graphics.DrawnLine(
-                window.charmy_window, 
-                line, 
-                (255, 0, 0, 255 if DEBUG_FLAGS.OBSERVE_SHAPE_DRAWING else 0), 
-                1, 
-                offset=drawn_shape.offset, 
-                anchor=drawn_shape.anchor, 
-                )
-            # drawn_line.anchor = drawn_shape.shape.boundary[0]
-            LineBase.draw_line(drawn_line, stroke=False, noskip=True)
-            del drawn_line
-            if DEBUG_FLAGS.OBSERVE_SHAPE_DRAWING:
-                window.cairo_context.stroke_preserve()
-                window.update(redraw=False)
-                time.sleep(0.5)
-            if DEBUG_FLAGS.WARN_UNCLOSED_SHAPES:
-                if line.start_point != last_line_end:
-                    print(
-                        f"Shape not closed: {last_line_end} -> {line.start_point}"
-                        f" | {DEBUG_FLAGS.FORCE_CLOSE_SHAPE=}"
-                        )
-                last_line_end = line.end_point
-        window.cairo_context.close_path()
-        if DEBUG_FLAGS.OBSERVE_SHAPE_DRAWING:
-            window.cairo_context.stroke_preserve()
-            window.update(redraw=False)
-            time.sleep(0.5)
-        if not stroke:
-            return
-        if TextureBase.cairo_set_context_texture(window.cairo_context, drawn_shape.texture, noskip):
-            window.cairo_context.set_fill_rule(cairo.FILL_RULE_WINDING)
-            window.cairo_context.fill()
-        window.cairo_context.stroke()
-        if TextureBase.cairo_set_context_texture(
-            window.cairo_context, drawn_shape.border_texture, noskip) \
-            and drawn_shape.border_width != 0:
-            # If still need visible border, then draw again
-            for line in drawn_shape.shape.lines:
-                drawn_line = charmy_stuff.graphics.DrawnLine(
-                    window.charmy_window, line, drawn_shape.border_texture, drawn_shape.border_width, 
-                    offset=drawn_shape.offset, anchor=drawn_shape.anchor)
-                LineBase.draw_line(drawn_line, stroke=False)
-            window.cairo_context.stroke()
+        context = window.cairo_context
+        # Path is in coordinates of the shape, so move it to where the shape is drawn
+        translate_x = drawn_shape.offset[0] - drawn_shape.anchor[0]
+        translate_y = drawn_shape.offset[1] - drawn_shape.anchor[1]
+        context.translate(translate_x, translate_y)
+        ShapeBase.cairo_add_shape(context, drawn_shape.shape, window)
+        context.translate(-translate_x, -translate_y)
+        # 👆 Path is already transformed when added, and line width must not be affected
+        if stroke:
+            ShapeBase.cairo_paint_shape_path(window.cairo_state, drawn_shape, noskip)
 
     @staticmethod
     def draw_shape_group(
@@ -529,22 +1143,48 @@ class ShapeBase(template.ShapeBase):
             stroke: bool = True, 
             noskip: bool = False, 
             *args, **kwargs) -> None:
-        """Draw shape group."""
+        """Draw shape group as one compound path, filled and stroked once."""
         window = drawn_shape.window.backend_base
         if not isinstance(drawn_shape.shape, charmy_stuff.styles.shape.ShapeGroup):
             raise TypeError("draw_shape_group() is only designed for shape group")
         if not isinstance(window, WindowBase):
             warnings.warn(f"Wrong backend for shape {drawn_shape.id}.")
             return
-        for index, subshape in enumerate(drawn_shape.shape.shapes):
-            host = drawn_shape.copy()
-            host.shape = subshape
-            ShapeBase.draw_shape(
-                host, 
-                index == len(drawn_shape.shape.shapes) - 1 and stroke, 
-                noskip, 
-                *args, **kwargs, 
-                )
+        context = window.cairo_context
+        translate_x = drawn_shape.offset[0] - drawn_shape.anchor[0]
+        translate_y = drawn_shape.offset[1] - drawn_shape.anchor[1]
+        context.translate(translate_x, translate_y)
+        for subshape in drawn_shape.shape.shapes:
+            ShapeBase.cairo_add_shape(context, subshape, window)
+        context.translate(-translate_x, -translate_y)
+        if stroke:
+            ShapeBase.cairo_paint_shape_path(window.cairo_state, drawn_shape, noskip)
+
+    @staticmethod
+    def draw_shapes(
+            drawn_shapes: typing.Sequence[charmy_stuff.graphics.DrawnShape], 
+            noskip: bool = False, 
+            *args, **kwargs) -> None:
+        """Draw shapes sharing textures and border as one compound path, filled and stroked once."""
+        if len(drawn_shapes) == 0:
+            return
+        window = drawn_shapes[0].window.backend_base
+        if not isinstance(window, WindowBase):
+            warnings.warn(f"Wrong backend for shape {drawn_shapes[0].id}.")
+            return
+        context = window.cairo_context
+        cmsh = charmy_stuff.styles.shape # CMSH = abbr. CharMy SHape
+        for drawn_shape in drawn_shapes:
+            translate_x = drawn_shape.offset[0] - drawn_shape.anchor[0]
+            translate_y = drawn_shape.offset[1] - drawn_shape.anchor[1]
+            context.translate(translate_x, translate_y)
+            if isinstance(drawn_shape.shape, cmsh.ShapeGroup):
+                for subshape in drawn_shape.shape.shapes:
+                    ShapeBase.cairo_add_shape(context, subshape, window)
+            else:
+                ShapeBase.cairo_add_shape(context, drawn_shape.shape, window)
+            context.translate(-translate_x, -translate_y)
+        ShapeBase.cairo_paint_shape_path(window.cairo_state, drawn_shapes[0], noskip)
 
     @staticmethod
     def draw_shape(
@@ -556,7 +1196,6 @@ class ShapeBase(template.ShapeBase):
         if not isinstance(window, WindowBase):
             warnings.warn(f"Wrong backend for shape {drawn_shape.id}.")
             return
-        window.cairo_context.set_fill_rule(cairo.FILL_RULE_WINDING)
         if isinstance(drawn_shape.shape, charmy_stuff.styles.shape.SingleShape):
             ShapeBase.draw_any_shape(drawn_shape, stroke, noskip, *args, **kwargs)
         elif isinstance(drawn_shape.shape, charmy_stuff.styles.shape.ShapeGroup):
@@ -580,7 +1219,7 @@ class TextureBase(template.TextureBase):
     """Texture-related APIs in Genesis backend."""
 
     @staticmethod
-    def cairo_set_context_texture(context: cairo.Context, 
+    def cairo_set_context_texture(context: cairo.Context | ContextState, 
                                   texture: charmy_stuff.styles.texture.Texture, 
                                   noskip: bool = False
                                   ) -> bool:
@@ -588,7 +1227,8 @@ class TextureBase(template.TextureBase):
         
         function only available in Genesis backend.
 
-        :param context: The Cairo context to set texture
+        :param context: The Cairo context to set texture, or its `ContextState` to skip setting the 
+                        same color again
         :param texture: The texture to set
         :return bool: If the object needs to be drawn
         """
@@ -614,7 +1254,7 @@ class TextSupportState(template.TextSupportState):
     custom_strikethrough    : bool = True
     custom_underline        : bool = True
     any_fontweight          : bool = False
-    fontweights             : list[int] = [
+    fontweight              : list[int] = [
                                 charmy_stuff.styles.text_style.WEIGHT.REGULAR, 
                                 charmy_stuff.styles.text_style.WEIGHT.BOLD, 
                                 ]
@@ -632,103 +1272,111 @@ class TextBase(template.TextBase):
         if not isinstance(window, WindowBase):
             warnings.warn(f"Wrong backend for shape {drawn_text.id}.")
             return
+        style = drawn_text.rendered_style
         ## Set Cairo font
         TextBase.cairo_set_font(drawn_text, window)
         # Text size
-        text_size = TextBase.get_text_bound(drawn_text, window.cairo_context) [1]
+        text_size = TextBase.get_text_bound(drawn_text) [1]
         drawn_text._backend_reported_size = text_size
         if DEBUG_FLAGS.DRAW_CAIRO_STOCK_TEXT_BOUND:
-            text_bound = charmy_stuff.graphics.DrawnShape(
+            ShapeBase.draw_shape(charmy_stuff.graphics.DrawnShape(
                 drawn_text.window, 
                 charmy_stuff.styles.shape.Rect(drawn_text.offset, text_size), 
                 (255, 0, 0, 50), 
                 2, (255, 0, 0)
-                ) .draw()
-            # window.charmy_window._drawing_list.insert(
-            #     window.charmy_window._drawing_list.index(drawn_text) + 1, text_bound
-            #     )
-        ## Draw text itself
-        window.cairo_context.move_to(drawn_text.offset[0], drawn_text.offset[1] + text_size[1])
+                ))
+            TextBase.cairo_set_font(drawn_text, window) # Restore texture of the text
+        ## Draw text itself, from glyphs shaped once and cached
+        context = window.cairo_context
+        translate_x, translate_y = drawn_text.offset[0], drawn_text.offset[1] + text_size[1]
         # 👆 Cairo use bottom-left as anchor, while Charmy uses top-left, so needs conversion on y
-        window.cairo_context.show_text(drawn_text.text)
-        ## Underline & strikethrough
-        offset = int(drawn_text.style.size // 5)
-        if drawn_text.style.underlined != False:
-            # Underline
-            underline: charmy_stuff.graphics.DrawnLine
-            if isinstance(drawn_text.style.underlined, bool):
-                underline = charmy_stuff.graphics.DrawnLine(
-                    drawn_text.window, 
-                    charmy_stuff.styles.shape.Line([
-                        (drawn_text.offset[0] - 2, drawn_text.offset[1] + text_size[1] + offset), 
-                        (drawn_text.offset[0] + text_size[0] + 2, 
-                        drawn_text.offset[1] + text_size[1] + offset)
-                    ]), 
-                    drawn_text.texture, max(1, int(drawn_text.style.size) // 15))
-            else:
-                underline = drawn_text.style.underlined
-            # Insert the underline right after the text
-            underline.draw()
-            # LineBase.draw_line(underline)
-            # window.charmy_window._drawing_list.insert(
-            #     window.charmy_window._drawing_list.index(drawn_text) + 1, underline
-            #     )
-        if drawn_text.style.strikethrough != False:
-            # Strikethrough
-            strikethrough: charmy_stuff.graphics.DrawnLine
-            if isinstance(drawn_text.style.strikethrough, bool):
-                strikethrough = charmy_stuff.graphics.DrawnLine(
-                    drawn_text.window, 
-                    charmy_stuff.styles.shape.Line([
-                        (drawn_text.offset[0] - 2, drawn_text.offset[1] + text_size[1] // 2 + offset), 
-                        (drawn_text.offset[0] + text_size[0] + 2, 
-                        drawn_text.offset[1] + text_size[1]//2 + offset)
-                    ]), 
-                    drawn_text.texture, max(1, int(drawn_text.style.size) // 15))
-            else:
-                strikethrough = drawn_text.style.strikethrough
-            # Insert the underline right after the text
-            strikethrough.draw()
-            # LineBase.draw_line(strikethrough)
-            # window.charmy_window._drawing_list.insert(
-            #     window.charmy_window._drawing_list.index(drawn_text) + 1, strikethrough
-            #     )
+        context.translate(translate_x, translate_y)
+        context.show_glyphs(glyph_cache.get(drawn_text.text, style))
+        ## Underline & strikethrough, drawn as part of the text instead of as drawn objects
+        if style.underlined is True or style.strikethrough is True:
+            # Stock ones, in texture of the text
+            line_width, lines = _stock_text_decorations(
+                text_size, style.size, style.underlined is True, style.strikethrough is True, 
+                )
+            window.cairo_state.set_line_width(line_width)
+            for start_x, end_x, line_y in lines:
+                context.move_to(start_x, line_y)
+                context.line_to(end_x, line_y)
+            context.stroke()
+        context.translate(-translate_x, -translate_y)
+        for decoration in (style.underlined, style.strikethrough):
+            if not isinstance(decoration, bool):
+                # Custom ones are drawn lines given in the style, placed by themselves
+                LineBase.draw_line(decoration)
 
     @staticmethod
     def cairo_set_font(drawn_text: charmy_stuff.graphics.DrawnText, window: WindowBase):
-        """To draw text on GUI or canvas."""
+        """Set texture and font of a drawn text on Cairo context of the window."""
         ## Set Cairo font
-        if not TextureBase.cairo_set_context_texture(window.cairo_context, drawn_text.texture):
+        if not TextureBase.cairo_set_context_texture(window.cairo_state, drawn_text.texture):
             # Set text texture and skip drawing if not necessary to draw
             return
-        window.cairo_context.select_font_face(
-            drawn_text.style.font, 
-            cairo.FontSlant.NORMAL if not drawn_text.style.italic else cairo.FontSlant.ITALIC, 
-            cairo.FontWeight.BOLD if drawn_text.style.weight >= \
-                charmy_stuff.styles.text_style.WEIGHT.BOLD else cairo.FontWeight.NORMAL
-            )
-        window.cairo_context.set_font_size(drawn_text.style.size)
+        window.cairo_state.set_scaled_font(font_cache.get(drawn_text.rendered_style))
 
     @staticmethod
     def get_text_bound(drawn_text: charmy_stuff.graphics.DrawnText, 
                       ctx: typing.Optional[cairo.Context] = None):
+        """Get boundary of a drawn text.
+
+        :param drawn_text: The drawn text
+        :param ctx: Cairo context to measure on, whose font must be set already, or `None` to 
+                    measure with `measure_text()`
+        """
         ## Calc text size
         if ctx is None:
-            # If not given a context, then make one
-            surface: cairo.ImageSurface = cairo.ImageSurface(
-            cairo.FORMAT_ARGB32, 10, 10)
-            ctx = cairo.Context(surface)
-            make_ctx = True
-        else:
-            make_ctx = False
+            return drawn_text.offset, TextBase.measure_text(
+                drawn_text.text, drawn_text.rendered_style
+                )
         extents = ctx.text_extents(drawn_text.text)
         text_size = (int(round(extents.width, 0)), int(round(extents.height, 0)))
-        if make_ctx:
-            # If made context before, destroy it immediately
-            del surface
-            del ctx
         return drawn_text.offset, text_size
 
+    @staticmethod
+    def measure_text(text: str, 
+                     style: charmy_stuff.styles.text_style.TextStyle, 
+                     ) -> charmy_stuff.styles.shape.Size:
+        """Measure size of a text in a style, with the cached scaled font of the style.
+
+        Results are kept in a LRU cache, so texts like repeated labels are measured only once.
+
+        :param text: The text
+        :param style: Style of the text
+        :return size: Size of the text
+        """
+        return _measure_text(text, style.font, style.size, style.weight, style.italic)
+
+
+@functools.lru_cache(maxsize=1024)
+def _stock_text_decorations(text_size: charmy_stuff.styles.shape.Size, 
+                            font_size: float, 
+                            underlined: bool, 
+                            strikethrough: bool, 
+                            ) -> tuple[float, tuple[tuple[float, float, float], ...]]:
+    """Get stock underline and strikethrough of a text from its measured size.
+
+    :return decorations: `(line_width, lines)`, each line is in `(start_x, end_x, y)` relative to the 
+                         left end of the baseline of the text
+    """
+    offset = int(font_size // 5)
+    lines: list[tuple[float, float, float]] = []
+    if underlined:
+        lines.append((-2, text_size[0] + 2, offset))
+    if strikethrough:
+        lines.append((-2, text_size[0] + 2, text_size[1] // 2 + offset - text_size[1]))
+    return max(1, int(font_size) // 15), tuple(lines)
+
+@functools.lru_cache(maxsize=4096)
+def _measure_text(text: str, font: str, size: float, weight: int, italic: bool, 
+                  ) -> charmy_stuff.styles.shape.Size:
+    """Measure a text with its style unpacked, which makes up the key of the LRU cache."""
+    extents = font_cache.get_scaled_font(font, weight, italic, size).text_extents(text)
+    return (int(round(extents.width, 0)), int(round(extents.height, 0)))
+
 
 # region: Alias WhateverBase classes
 
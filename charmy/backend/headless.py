@@ -0,0 +1,339 @@
+"""Headless backend, which renders with Cairo into memory-only surfaces without any display.
+
+Drawing is shared with the Genesis backend, but windows never touch SDL: each window owns a Cairo
+image surface as its framebuffer, input is injected as synthetic events, and the main loop waits
+only for injected events or `wakeup()`. This makes it possible to run benchmarks and pixel-exact
+regression tests on machines without a display.
+"""
+
+from __future__ import annotations as _
+
+import typing
+
+import collections
+import sys
+import time
+
+import cairo
+
+from charmy.backend import template
+from charmy.backend import genesis
+
+import charmy.backend.utils as charmy_stuff
+
+if typing.TYPE_CHECKING:
+    from charmy.widgets import window as _window
+
+
+# region Backend class
+
+class Backend(template.Backend):
+    """The Headless backend."""
+
+    name: typing.ClassVar[str] =            "headless"
+    friendly_name: typing.ClassVar[str] =   "Headless (offscreen rendering)"
+    version: typing.ClassVar[str] =         "0.1.0"
+    author: typing.ClassVar[list[str]] =    ["Charmy dev team"]
+
+    WindowBase: type[WindowBase]
+    LineBase: type[genesis.LineBase]
+    ShapeBase: type[genesis.ShapeBase]
+    TextureBase: type[genesis.TextureBase]
+
+    def wait_events(self, timeout: float | None = None) -> None:
+        """Block until events are injected, `wakeup()` is called, or timeout.
+
+        All input of headless windows comes from injecting, which wakes this up, so there is no need
+        to poll.
+
+        :param timeout: Time to wait at most in seconds, or `None` to wait until events arrive
+        """
+        self._wakeup_flag.wait(timeout)
+        self._wakeup_flag.clear()
+
+
+# region Window
+
+class WindowBackdropSupportState(template.WindowBackdropSupportState):
+    """Represents support states of backdrop effects of windows held by this backend."""
+    color                   : bool = True
+    gradient                : bool = True
+    image                   : bool = False
+    transparent             : bool = False
+    alpha                   : bool = False
+    blur                    : bool = False
+    transformation          : bool = False
+    any_filter              : bool = False
+
+class WindowSupportState(template.WindowSupportState):
+    """Flags all supported window features."""
+    set_title               : bool = True
+    set_icon                : bool = True
+    set_pos                 : bool = True
+    set_size                : bool = True
+    set_scale_mode          : bool = False
+    set_background          : bool = True
+    translucent             : bool = False
+    backdrop                : type[WindowBackdropSupportState] = WindowBackdropSupportState
+    set_state               : bool = False
+    fullscreen              : bool = False
+    customize_titlebar      : bool = False
+
+class WindowBase(genesis.WindowBase):
+    """Window APIs in Headless backend, drawing into a Cairo image surface kept in memory."""
+    supports = WindowSupportState()
+    Backend = Backend
+
+    zero_copy: typing.ClassVar[bool] = False # No window surface to draw on, the surface is all
+
+    def __init__(self, backend: template.Backend, charmy_window: _window.WindowEntity):
+        """Creates a headless window.
+
+        :param backend: The backend that this window uses (can be get from CharmyManager)
+        """
+        template.WindowBase.__init__(self, backend, charmy_window) # 👈 Skip creating SDL window
+
+        self.title: str = "Charmy Headless Window"
+        self.size: tuple[int, int] = (540, 480)
+        self.charmy_window._pos = self.pos
+
+        self._events: collections.deque[charmy_stuff.event_types.Event] = collections.deque()
+        # 👆 Injected events waiting to be handled when pumping events, thread-safe
+        self.presented_regions: list[charmy_stuff.styles.shape.ShapeRange] = []
+        # 👆 Regions presented by latest `present()`
+        self.present_count: int = 0
+        self.closed: bool = False
+
+        # Initialize Cairo canvas
+        self.surface: cairo.ImageSurface
+        self.cairo_context: cairo.Context
+        self.cairo_state: genesis.ContextState
+        self.zero_copy_active: bool = False
+        self._window_pixels = None
+        self.cairo_reinit_surface()
+        self.cairo_state.set_source_rgba(0, 0, 0, 1.0)  # Black back
+        self.cairo_context.paint()
+
+    def show(self) -> typing.Self:
+        """Show the window, does nothing as there is no display.
+
+        :return self: The WindowBase itself
+        """
+        return self
+
+    def present(self,
+                regions: typing.Sequence[charmy_stuff.styles.shape.ShapeRange] | bool = True
+                ) -> typing.Self:
+        """Finish drawing of a frame, the surface already holds the presented content.
+
+        :param regions: Regions to present, or `True` for the whole window
+        :return self: The WindowBase itself
+        """
+        if regions is False:
+            return self
+        self.surface.flush()
+        if regions is True:
+            self.presented_regions = [((0, 0), self.size)]
+        else:
+            self.presented_regions = list(regions)
+        self.present_count += 1
+        return self
+
+    def update(self, redraw: bool | charmy_stuff.styles.shape.ShapeRange = True) -> typing.Self:
+        """Update the window, by presenting the region (or whole window) and handling events.
+
+        :return self: The WindowBase itself
+        """
+        if isinstance(redraw, bool):
+            self.present(redraw)
+        else:
+            self.present([redraw])
+        self.pump_events()
+        return self
+
+    def pump_events(self) -> typing.Self:
+        """Handle injected events in the order they were injected.
+
+        :return self: The WindowBase itself
+        """
+        cme = charmy_stuff.event_types # Alias Charmy events
+        record = self.charmy_window.frame_stats.current
+        start_time = time.perf_counter()
+        while self._events:
+            event = self._events.popleft()
+            if isinstance(event, cme.WidgetConfigure) and "size" in event.attrs_changed:
+                self.set_size(event.attrs_changed["size"], _passive=True)
+            self.charmy_window.trigger(event)
+        record.dispatch += time.perf_counter() - start_time
+        return self
+
+    def set_pos(self, new: charmy_stuff.styles.shape.Point) -> typing.Self:
+        """Set window position, which is only recorded.
+
+        :param new: New window pos
+        """
+        self.pos = new
+        return self
+
+    def set_size(self, new: charmy_stuff.styles.shape.Size, _passive: bool = False) -> typing.Self:
+        """Set window size, which re-creates the framebuffer.
+
+        :param new: The new window size in tuple of `(width, height)`
+        :param _passive: Whether the resize is caused by an injected event, internal use only
+        """
+        if new == self.size:
+            return self
+        self.size = new
+        self.cairo_reinit_surface()
+        return self
+
+    def set_title(self, new: str) -> typing.Self:
+        """Set window title, which is only recorded.
+
+        :param new: The new window title
+        """
+        self.title = new
+        return self
+
+    def set_icon(self, new: bytes) -> typing.Self:
+        """Set window icon from image bytes, which is only recorded.
+
+        :param new: New icon in bytes data
+        """
+        self.icon = bytearray(new)
+        return self
+
+    def close(self):
+        self.closed = True
+        self._events.clear()
+
+    # region Synthetic input
+
+    def inject(self, event: charmy_stuff.event_types.Event) -> typing.Self:
+        """Queue a Charmy event to be triggered on the window when pumping events, as if it came
+        from the system. Can be called from any thread.
+
+        :param event: The event, whose subject should be the Charmy window
+        :return self: The WindowBase itself
+        """
+        self._events.append(event)
+        self.charmy_window.parent.backend.wakeup() # Main loop may be waiting for events
+        return self
+
+    def inject_mouse_move(self, pos: charmy_stuff.styles.shape.Point) -> typing.Self:
+        """Inject a mouse movement to a position on the window.
+
+        :param pos: New mouse position
+        """
+        return self.inject(charmy_stuff.event_types.MouseMove(self.charmy_window, pos))
+
+    def inject_mouse_press(self, pos: charmy_stuff.styles.shape.Point, button: int = 0
+                           ) -> typing.Self:
+        """Inject a mouse button press.
+
+        :param pos: Mouse position
+        :param button: The button pressed, `0` for left button
+        """
+        return self.inject(charmy_stuff.event_types.MousePress(self.charmy_window, pos, button))
+
+    def inject_mouse_release(self, pos: charmy_stuff.styles.shape.Point, button: int = 0
+                             ) -> typing.Self:
+        """Inject a mouse button release.
+
+        :param pos: Mouse position
+        :param button: The button released, `0` for left button
+        """
+        return self.inject(charmy_stuff.event_types.MouseRelease(self.charmy_window, pos, button))
+
+    def inject_click(self, pos: charmy_stuff.styles.shape.Point, button: int = 0) -> typing.Self:
+        """Inject moving mouse to a position, then pressing and releasing a button there.
+
+        :param pos: Mouse position
+        :param button: The button clicked, `0` for left button
+        """
+        self.inject_mouse_move(pos)
+        self.inject_mouse_press(pos, button)
+        return self.inject_mouse_release(pos, button)
+
+    def inject_mouse_scroll(self,
+                            pos: charmy_stuff.styles.shape.Point,
+                            steps: int,
+                            horizontal: bool = False,
+                            ) -> typing.Self:
+        """Inject a mouse wheel scroll.
+
+        :param pos: Mouse position
+        :param steps: Steps scrolled
+        :param horizontal: Whether scrolled horizontally
+        """
+        return self.inject(charmy_stuff.event_types.MouseScroll(
+            self.charmy_window, pos, steps, horizontal
+            ))
+
+    def inject_resize(self, size: charmy_stuff.styles.shape.Size) -> typing.Self:
+        """Inject a resize of the window, as if resized by the user.
+
+        :param size: New window size
+        """
+        return self.inject(charmy_stuff.event_types.WidgetConfigure(
+            self.charmy_window, {"size": size}
+            ))
+
+    def inject_focus(self, gained: bool = True) -> typing.Self:
+        """Inject the window gaining or losing focus.
+
+        :param gained: `True` if gained focus, `False` if lost
+        """
+        if gained:
+            return self.inject(charmy_stuff.event_types.FocusGain(self.charmy_window))
+        return self.inject(charmy_stuff.event_types.FocusLoss(self.charmy_window))
+
+    # region Framebuffer
+
+    @property
+    def framebuffer(self) -> cairo.ImageSurface:
+        """The Cairo image surface holding the window content, in `FORMAT_ARGB32`."""
+        self.surface.flush()
+        return self.surface
+
+    def get_pixel(self, pos: charmy_stuff.styles.shape.Point) -> tuple[int, int, int, int]:
+        """Get color of a pixel in the framebuffer.
+
+        :param pos: Position of the pixel
+        :return color: The color in `(r, g, b, a)`, not premultiplied
+        """
+        surface = self.framebuffer
+        x, y = int(pos[0]), int(pos[1])
+        if not (0 <= x < surface.get_width() and 0 <= y < surface.get_height()):
+            raise IndexError(f"Pixel {pos} is out of the window in size {self.size}.")
+        offset = y * surface.get_stride() + x * 4
+        pixel = int.from_bytes(surface.get_data()[offset:offset + 4], sys.byteorder)
+        # 👆 ARGB32 pixels are stored as native-endian 32-bit ints
+        a, r, g, b = (pixel >> 24) & 0xFF, (pixel >> 16) & 0xFF, (pixel >> 8) & 0xFF, pixel & 0xFF
+        if a not in (0, 255):
+            r, g, b = (min(255, round(channel * 255 / a)) for channel in (r, g, b))
+        return (r, g, b, a)
+
+    def get_pixels(self) -> bytes:
+        """Get a copy of the framebuffer data, in Cairo `FORMAT_ARGB32` with the stride of
+        `framebuffer.get_stride()`."""
+        return bytes(self.framebuffer.get_data())
+
+    def write_png(self, path: str) -> typing.Self:
+        """Save the framebuffer to a PNG file.
+
+        :param path: Path of the PNG file
+        """
+        self.framebuffer.write_to_png(path)
+        return self
+
+
+# region: Alias WhateverBase classes
+
+Backend.WindowBase = WindowBase
+Backend.LineBase = genesis.LineBase
+Backend.ShapeBase = genesis.ShapeBase
+Backend.TextureBase = genesis.TextureBase
+Backend.TextBase = genesis.TextBase
+
+# endregion
@@ -19,6 +19,9 @@ def load_backend(name: str) -> type[Backend]:
     if name == "genesis":
         from . import genesis
         return genesis.Backend
+    elif name == "headless":
+        from . import headless
+        return headless.Backend
     else:
         raise NotImplementedError(
             f"Other backends (including {name}) not supported yet in early dev."
@@ -11,6 +11,7 @@ from __future__ import annotations as _
 import typing
 
 import warnings
+import threading
 
 from . import utils as charmy_stuff
 
@@ -58,11 +59,28 @@ class Backend():
 
     def __init__(self):
         """Initialize a backend"""
+        self._wakeup_flag: threading.Event = threading.Event()
         return
     
     def backend_init(self) -> None:
         return None
 
+    def wait_events(self, timeout: float | None = None) -> None:
+        """Block until events arrive, `wakeup()` is called, or timeout.
+
+        This is a fallback of such function, which cannot wait for events, so it only waits for 
+        `wakeup()` and waits 10ms at most, to keep polling events.
+
+        :param timeout: Time to wait at most in seconds, or `None` to wait until events arrive
+        """
+        timeout = .01 if timeout is None else min(timeout, .01)
+        self._wakeup_flag.wait(timeout)
+        self._wakeup_flag.clear()
+
+    def wakeup(self) -> None:
+        """Wake up `wait_events()` immediately, can be called from any thread."""
+        self._wakeup_flag.set()
+
 
 # region Base classes
 
@@ -192,6 +210,79 @@ class WindowBase(WhateverBase):
             )
         return self
 
+    def set_clip(self, 
+                 regions: typing.Sequence[charmy_stuff.styles.shape.ShapeRange]
+                 ) -> typing.Self:
+        """Restrict following drawing to the given regions.
+
+        Clipping is only an optimization, so this fallback does nothing and everything is drawn.
+
+        :param regions: Regions where drawing is allowed
+        :return self: The WindowBase itself
+        """
+        return self
+
+    def reset_clip(self) -> typing.Self:
+        """Remove restriction set by `set_clip()`, does nothing on dummy.
+
+        :return self: The WindowBase itself
+        """
+        return self
+
+    def record(self, 
+               region: charmy_stuff.styles.shape.ShapeRange | None, 
+               draw: typing.Callable[[], typing.Any]
+               ) -> typing.Any:
+        """Record drawing commands issued by `draw()`, so they can be replayed with `replay()`.
+
+        This is a fallback of such function, which cannot record and just calls `draw()` to draw 
+        directly. Backends that can record commands (e.g. into a display list) should override 
+        this, and must not draw on the window when recording.
+
+        :param region: 
+            Region of the window `draw()` may paint in, which bounds the recording, `None` if unknown
+        :param draw: Function that draws with this window's backend
+        :return recording: The recorded commands, or `None` if drawn directly instead
+        """
+        draw()
+        return None
+
+    def replay(self, recording: typing.Any) -> typing.Self:
+        """Replay drawing commands recorded by `record()` on the window, does nothing on dummy.
+
+        :param recording: The recorded commands
+        :return self: The WindowBase itself
+        """
+        return self
+
+    def render_layer(self, 
+                     region: charmy_stuff.styles.shape.ShapeRange, 
+                     draw: typing.Callable[[], typing.Any]
+                     ) -> typing.Any:
+        """Render what `draw()` draws within a region into an offscreen surface.
+
+        This is a fallback of such function, which cannot render offscreen and returns `None` 
+        without drawing, so objects of the layer are drawn on the window directly instead.
+
+        :param region: Region of the window covered by the layer
+        :param draw: Function that draws with this window's backend, in window coordinates
+        :return surface: The rendered offscreen surface, or `None` if not supported
+        """
+        return None
+
+    def composite_layer(self, 
+                        surface: typing.Any, 
+                        pos: charmy_stuff.styles.shape.Point
+                        ) -> typing.Self:
+        """Paint an offscreen surface rendered by `render_layer()` onto the window, does nothing 
+        on dummy.
+
+        :param surface: The offscreen surface
+        :param pos: Position on the window to paint the surface at
+        :return self: The WindowBase itself
+        """
+        return self
+
     def update(self, redraw: bool | charmy_stuff.styles.shape.ShapeRange = True) -> typing.Self:
         """Updates the window, although not supported in nobackend and will throw an error"""
         raise NotImplementedError(
@@ -199,9 +290,37 @@ class WindowBase(WhateverBase):
             "You must install another backend that supports your system GUI.\n"
         )
 
+    def present(self, 
+                regions: typing.Sequence[charmy_stuff.styles.shape.ShapeRange] | bool = True
+                ) -> typing.Self:
+        """Present drawn content of given regions on screen at once.
+
+        This is a fallback of such function, which presents each region via `update()`. Backends 
+        are supposed to override this to present all regions with a single call.
+
+        :param regions: Regions to present, or `True` for the whole window
+        :return self: The WindowBase itself
+        """
+        if isinstance(regions, bool):
+            if regions:
+                self.update(True)
+            return self
+        for region in regions:
+            self.update(region)
+        return self
+
+    def pump_events(self) -> typing.Self:
+        """Fetch and handle pending events of the window, does nothing on dummy.
+
+        :return self: The WindowBase itself
+        """
+        return self
+
     def clear_screen(self) -> typing.Self:
         """To clear all content from a window"""
-        self.charmy_window._drawing_list = []
+        self.charmy_window._drawing_list.clear()
+        self.charmy_window._drawing_index.clear()
+        self.charmy_window._display_list.clear()
         return self
 
     def set_pos(self, new: charmy_stuff.styles.shape.Point) -> typing.Self:
@@ -269,6 +388,7 @@ class ShapeSupportState(SupportState):
     polygon         : bool = False
     oval            : bool = False
     sector          : bool = False
+    batch           : bool = False # 👈 Can draw shapes sharing textures with `draw_shapes()`
 
 class ShapeBase():
     """Set of shape-relating APIs"""
@@ -288,6 +408,18 @@ class ShapeBase():
         """
         not_implemented_func(operation_desc="Drawing shapes")
 
+    @staticmethod
+    def draw_shapes(shapes: typing.Sequence[charmy_stuff.graphics.DrawnShape], *args, **kwargs):
+        """To draw shapes with the same texture, border width and border texture at once, e.g. as 
+        one path with a single fill. The shapes do not overlap each other.
+
+        Only called if `batch` is flagged as supported, otherwise shapes are drawn one by one with 
+        `draw_shape()`.
+
+        :param shapes: The shapes to be drawn, in paint order
+        """
+        not_implemented_func(operation_desc="Drawing shapes at once")
+
 
 # region Texture-relating
 
@@ -340,6 +472,18 @@ class TextBase():
         """To get the text's boundary when it is rendered by a specific backend."""
         not_implemented_func(operation_desc="Getting text boundary.")
 
+    @staticmethod
+    def measure_text(text: str, 
+                     style: charmy_stuff.styles.text_style.TextStyle, 
+                     ) -> charmy_stuff.styles.shape.Size | None:
+        """To measure size of a text in a style as it will be drawn, without drawing it.
+
+        :param text: The text
+        :param style: Style of the text
+        :return size: Size of the text, or `None` if backend can only tell it after drawn
+        """
+        return None
+
 
 # region: Alias WhateverBase classes
 
@@ -3,6 +3,9 @@ from __future__ import annotations as _
 import typing as _typing
 
 import time as _time
+import heapq as _heapq
+import itertools as _itertools
+import threading as _threading
 
 from .backend import loader as _backend_loader
 # from .const import MANAGER_ID
@@ -11,13 +14,14 @@ from .backend import loader as _backend_loader
 from .cm_object import CharmyObject as _CharmyObject, CharmyRegisteredObject as _CharmyRegisteredObject
 from .event import EventHandling as _EventHandling, event_types as _event_types
 from .const import DEBUG_FLAGS as _DEBUG_FLAGS
+from .utils import frame_clock as _frame_clock, frame_stats as _frame_stats
 
 if _typing.TYPE_CHECKING:
     from .backend.template import Backend
     from . import window
 
 
-__all__ = ["CharmyManager", "mainloop", "quit"]
+__all__ = ["CharmyManager", "mainloop", "quit", "call_later", "wakeup"]
 
 
 class CharmyManager(_CharmyRegisteredObject, _EventHandling):
@@ -41,24 +45,49 @@ class CharmyManager(_CharmyRegisteredObject, _EventHandling):
         self.windows: list[window.WindowEntity] = [] 
         # 👆 Stores all windows this CharmyManager manages
         self._alive = True # This var stores if the manager is still alive
+        self.frame_stats: _frame_stats.FrameStats = _frame_stats.FrameStats()
+        # 👆 Frame statistics summed up over all windows updated in each frame
 
-    def update(self) -> _typing.Self:
+    def update(self, pump_events: bool = True) -> _typing.Self:
         """Update all windows under this manager,
 
+        :param pump_events: Handle pending events of each window after presenting it
         :return self: The manager itself
         """
         if not self._alive:
             return self
         none_alive = True
+        records: list[_frame_stats.FrameRecord] = []
         for window in self.windows:
             if window.visible and window._alive:
                 none_alive = False
-                window.update()
+                window.update(pump_events=pump_events)
+                if window.frame_stats.latest is not None:
+                    records.append(window.frame_stats.latest)
+        if records:
+            self.frame_stats.push(_frame_stats.FrameRecord.sum(records))
         self.trigger(_event_types.WidgetUpdate(self))
         if none_alive:
             self.destroy() # destroy self if no window alive
         return self
 
+    def pump_events(self) -> _typing.Self:
+        """Handle pending events of all windows under this manager, without redrawing them.
+
+        :return self: The manager itself
+        """
+        for window in self.windows:
+            if window._alive:
+                window.backend_base.pump_events()
+        return self
+
+    @property
+    def has_pending_damage(self) -> bool:
+        """Whether any window under this manager still has regions waiting to be redrawn."""
+        return any(
+            window._alive and len(window._redraw_regions) != 0 for window in self.windows
+            )
+
     def destroy(self) -> None:
         """Destroy the manager."""
         self._alive = False
@@ -67,10 +96,64 @@ class CharmyManager(_CharmyRegisteredObject, _EventHandling):
         return
 
 
-def mainloop(interval: float = .01) -> None:
+# region Scheduling
+
+_timers: list[tuple[float, int, _typing.Callable[[], _typing.Any]]] = [] # Heap of timers
+_timers_lock = _threading.Lock()
+_timers_counter = _itertools.count() # Keeps timers with the same deadline in order
+
+
+def call_later(delay: float, callback: _typing.Callable[[], _typing.Any]) -> None:
+    """Schedule a function to be called by the main loop after a delay, can be called from any 
+    thread.
+
+    :param delay: Time to wait before calling, in seconds
+    :param callback: The function to call, without any argument
+    """
+    with _timers_lock:
+        _heapq.heappush(_timers, (_time.monotonic() + delay, next(_timers_counter), callback))
+    wakeup() # The main loop may be waiting for an earlier deadline, or for no deadline at all
+
+
+def wakeup() -> None:
+    """Wake up the main loop if waiting for events, can be called from any thread."""
+    for manager in CharmyManager.instances:
+        if manager is not None and manager._alive:
+            manager.backend.wakeup()
+
+
+def _run_due_timers() -> tuple[bool, float | None]:
+    """Call all timers that are due.
+
+    :return ran_any: Whether any timer was called, which may have changed widgets
+    :return next_deadline: Deadline of the next timer, if any
+    """
+    ran_any = False
+    while True:
+        with _timers_lock:
+            if len(_timers) == 0:
+                return ran_any, None
+            deadline, _, callback = _timers[0]
+            if deadline > _time.monotonic():
+                return ran_any, deadline
+            _heapq.heappop(_timers)
+        callback()
+        ran_any = True
+
+
+def mainloop(interval: float | None = None, fps: float | None = 60) -> None:
     """Start main loop.
 
-    :param interval: Time to wait between each loop, in integer seconds
+    By default, the main loop is event-driven: once all windows are redrawn, it blocks on the 
+    backend until an event arrives, the next timer is due, or `wakeup()` is called, so idle apps 
+    cost no CPU and events are handled without delay.
+
+    Rendering is paced at `fps`: events are handled as soon as they arrive, but changes made before
+    the next frame deadline are coalesced into one render. If a frame overruns, the deadlines it 
+    missed are skipped rather than rendered back to back, so animations keep their pace under load.
+
+    :param interval: Time to wait between each loop in seconds, to poll at fixed interval instead
+    :param fps: Target frame rate of event-driven loop, `None` to render as soon as anything changes
     """
     none_alive = False
     if _DEBUG_FLAGS.WAIT_AFTER_EACH_FRAME != False:
@@ -78,16 +161,60 @@ def mainloop(interval: float = .01) -> None:
             interval = 0.5
         else:
             interval = _DEBUG_FLAGS.WAIT_AFTER_EACH_FRAME
+    clock = _frame_clock.FrameClock(fps) if fps is not None else None
+    woke_up = True
     while not none_alive:
         none_alive = True
+        timers_ran, next_deadline = _run_due_timers()
+        if timers_ran:
+            woke_up = True # Damage made by timers is only found when drawing, so render a frame
+        alive_managers: list[CharmyManager] = []
         for manager_ref in CharmyManager.instances:
             manager = manager_ref
             if manager is not None:
                 if manager._alive:
                     none_alive = False
-                    manager.update()
-        if interval > 0:
-            _time.sleep(interval)
+                    alive_managers.append(manager)
+        if none_alive:
+            break
+        if interval is not None:
+            for manager in alive_managers:
+                manager.update()
+            if interval > 0:
+                _time.sleep(interval)
+            continue
+        # Event-driven, only wait when there is nothing to do
+        if not woke_up and not any(manager.has_pending_damage for manager in alive_managers):
+            _wait_events(alive_managers, next_deadline)
+            woke_up = True # Events may have arrived, which may change widgets
+            continue
+        for manager in alive_managers:
+            manager.pump_events() # Input is handled right away, even if not rendering yet
+        if clock is not None and (frame_wait := clock.time_until_frame()) > 0:
+            # Too early for next frame, changes until then are coalesced into one render
+            frame_deadline = _time.monotonic() + frame_wait
+            _wait_events(
+                alive_managers, 
+                frame_deadline if next_deadline is None else min(frame_deadline, next_deadline), 
+                )
+            continue
+        frame_started = _time.monotonic()
+        for manager in alive_managers:
+            if manager._alive:
+                manager.update(pump_events=False)
+        # 👆 Events arrived while rendering stay queued, so waiting returns at once to handle them
+        woke_up = False
+        if clock is not None:
+            clock.frame_done(frame_started)
+
+
+def _wait_events(managers: list[CharmyManager], deadline: float | None) -> None:
+    """Block until an event arrives, the main loop is woken up, or the deadline passes."""
+    timeout = None if deadline is None else max(0., deadline - _time.monotonic())
+    if len(managers) > 1:
+        # Can only wait on one backend, so keep polling others
+        timeout = .01 if timeout is None else min(timeout, .01)
+    managers[0].backend.wait_events(timeout)
 
 
 def quit():  # NOQA
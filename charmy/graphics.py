@@ -5,7 +5,6 @@ from __future__ import annotations as _
 import typing as _typing
 
 from abc import abstractmethod as _abstractmethod
-import copy as _copy
 
 from . import styles as _styles
 from . import cm_object as _cm_object
@@ -14,6 +13,7 @@ from .const import DEBUG_FLAGS as _DEBUG_FLAGS
 
 if _typing.TYPE_CHECKING:
     from .widgets import window as _window
+    from .backend import template as _backend
 
 
 def _draw_bbox(obj: DrawnObject):
@@ -43,6 +43,9 @@ class DrawnObject(_cm_object.CharmyObject):
         self._attrs: list[str] = []
         self._need_redraw: bool = True
         self._drawn: bool = False
+        self._drawn_key: _typing.Hashable = None # Render key when last damaged
+        self._drawn_boundary: _styles.shape.ShapeRange | None = None
+        # 👆 Paint boundary when last drawn
         self._booting = False
         self.window: _window.WindowEntity = window
         self.offset: _styles.shape.Point
@@ -55,6 +58,70 @@ class DrawnObject(_cm_object.CharmyObject):
     @_abstractmethod
     def boundary(self) -> _styles.shape.ShapeRange: ...
 
+    @property
+    def paint_margin(self) -> float:
+        """How far drawing of the object may reach outside its boundary, e.g. by borders, line 
+        widths and antialiased edges."""
+        return 0
+
+    @property
+    def paint_boundary(self) -> _styles.shape.ShapeRange:
+        """Rect boundary of everything the object paints, which is its boundary grown by its paint 
+        margin. Damaged when the object changes, and used to look up objects in damaged regions."""
+        margin = self.paint_margin
+        if margin == 0:
+            return self.boundary
+        (x, y), (w, h) = self.boundary
+        return (x - margin, y - margin), (w + margin * 2, h + margin * 2)
+
+    @property
+    @_abstractmethod
+    def render_key(self) -> _typing.Hashable:
+        """A hashable key that changes whenever the object would be drawn differently.
+
+        Covers geometry, texture and position, and is used by windows to reuse recorded drawing 
+        commands of unchanged objects, and to damage only objects that changed.
+        """
+
+    def _damage_if_changed(self) -> None:
+        """Mark old and new boundary of self as damaged, if self changed since last time."""
+        render_key = self.render_key
+        if render_key == self._drawn_key:
+            return
+        if self._drawn_boundary is not None:
+            self.window._redraw_regions.append(self._drawn_boundary)
+        self._drawn_boundary = self.paint_boundary
+        self.window._redraw_regions.append(self._drawn_boundary)
+        self._drawn_key = render_key
+        layer = self.window._current_layer
+        if layer is not None:
+            layer.invalidate() # Content of the layer changed, needs to be rendered again
+
+    def _remove_from_drawing_list(self) -> None:
+        """Remove self from drawing list of the window, if drawn on the window already."""
+        if self in self.window._drawing_list:
+            self.window._drawing_list.remove(self)
+            self.window._drawing_index.remove(self)
+            self.window._display_list.pop(self, None) # Drop recorded commands no longer replayed
+
+    def _add_to_drawing_list(self, drawn_obj: _typing.Optional[DrawnObject] = None) -> None:
+        """Add self, or the object actually rendered for self, to the layer being drawn currently, 
+        or to drawing list of the window if not drawing a layer.
+
+        Objects already in drawing list of the window keep their stacking position.
+
+        :param drawn_obj: The object to add, default is self
+        """
+        if drawn_obj is None:
+            drawn_obj = self
+        layer = self.window._current_layer
+        if layer is not None:
+            self._remove_from_drawing_list() # In case moved from window into the layer
+            layer.objects.append(drawn_obj)
+        else:
+            slot = self.window._drawing_list.add(drawn_obj)
+            self.window._drawing_index.insert(drawn_obj, drawn_obj.paint_boundary, slot)
+
     @_abstractmethod
     def __contains__(self, point: _styles.shape.Point) -> bool: ...
 
@@ -110,6 +177,8 @@ class DrawnLine(DrawnObject):
             anchor = self.line.boundary[0]
         self.anchor: _styles.shape.Point = anchor  # NOQA
 
+        self._fallback_parts: list[DrawnLine] = [] # Lines drawn instead if line type not supported
+
     @property
     def texture(self) -> _styles.texture.Texture:
         """Texture of the drawn line."""
@@ -131,6 +200,18 @@ class DrawnLine(DrawnObject):
             self.offset[1] + self.line.boundary[0][1] - self.anchor[1]
             ), self.line.boundary[1]
 
+    @property
+    def paint_margin(self) -> float:
+        """Half of line width, which line caps reach, and a pixel of antialiased edges."""
+        return self.width / 2 + 1
+
+    @property
+    def render_key(self) -> _typing.Hashable:
+        return (
+            self.line.cache_key, self.texture.cache_key, self.width, 
+            tuple(self.offset), tuple(self.anchor), 
+            )
+
     def draw(self, 
             _fallback_from: _typing.Optional[list[type[_styles.shape.LinePath]]] = None
             ) -> _typing.Self:
@@ -144,26 +225,41 @@ class DrawnLine(DrawnObject):
 
         if not _fallback_from:
             _fallback_from = []
+            self._damage_if_changed() # Fallback parts lie within self, so only check on self
 
         backend = window.parent.backend
         # 👆 Alias to avoid path to backend properties getting too long. 😅
-        # Remove self from render list if already rendered
-        if self in self.window._drawing_list:
-            self.window._drawing_list.remove(self)
         # Rendering process
         if self.line.type == "line_path_class":
             raise TypeError("styles.shape.LinePath class is a template, cannot be drawn.")
         else:
             if self.line.type in backend.LineBase.supports:
                 # If supported by the windows' backend.
-                window.backend_base.charmy_window._drawing_list.append(self)
+                self._add_to_drawing_list()
             else:
                 # If not supported, enters the fallback process
+                self._remove_from_drawing_list()
                 _fallback_from.append(self.line.__class__)
-                for fallback_line in self.line.fallback(_from = _fallback_from):
-                    drawn_host = _copy.copy(self)
-                    drawn_host.line = fallback_line
-                    drawn_host.draw(_fallback_from)
+                fallback_lines = self.line.fallback(_from = _fallback_from)
+                for part in self._fallback_parts[len(fallback_lines):]:
+                    part._remove_from_drawing_list()
+                del self._fallback_parts[len(fallback_lines):]
+                for index, fallback_line in enumerate(fallback_lines):
+                    # Parts are kept across frames, so they stay in the drawing list only once
+                    if index < len(self._fallback_parts):
+                        part = self._fallback_parts[index]
+                        part.line = fallback_line
+                        part.texture = self.texture
+                        part.width = self.width
+                        part.offset = self.offset
+                        part.anchor = self.anchor
+                    else:
+                        part = DrawnLine(
+                            self.window, fallback_line, self.texture, self.width, 
+                            self.offset, self.anchor, 
+                            )
+                        self._fallback_parts.append(part)
+                    part.draw(_fallback_from.copy())
             if _DEBUG_FLAGS.DRAW_OBJECTS_BOUNDARY:
                 _draw_bbox(self)
         self._drawn = True
@@ -245,6 +341,20 @@ class DrawnShape(DrawnObject):
             self.offset[1] + self.shape.boundary[0][1] - self.anchor[1]
             ), self.shape.boundary[1]
 
+    @property
+    def paint_margin(self) -> float:
+        """Half of border width, which is stroked centered on the edges, and a pixel of antialiased 
+        edges."""
+        return self.border_width / 2 + 1
+
+    @property
+    def render_key(self) -> _typing.Hashable:
+        return (
+            self.shape.cache_key, self.texture.cache_key, 
+            self.border_width, self.border_texture.cache_key, 
+            tuple(self.offset), tuple(self.anchor), 
+            )
+
     def copy(self) -> DrawnShape:
         return DrawnShape(
             self.window, 
@@ -265,17 +375,15 @@ class DrawnShape(DrawnObject):
         :param _fallback_from: Internal use only, the fallback path
         """
         backend = self.window.parent.backend
-        # Remove self from render list if already rendered
-        if self in self.window._drawing_list:
-            self.window._drawing_list.remove(self)
         # Rendering process
-        backend = self.window.parent.backend
         if self.shape.type in backend.ShapeBase.supports or \
             "any_shape" in backend.ShapeBase.supports:
-            self.window.backend_base.charmy_window._drawing_list.append(self)
+            self._add_to_drawing_list()
+        else:
+            self._remove_from_drawing_list()
         if _DEBUG_FLAGS.DRAW_OBJECTS_BOUNDARY:
             _draw_bbox(self)
-        self.window._redraw_regions.append(self.boundary)
+        self._damage_if_changed()
         self._drawn = True
         return self
 
@@ -285,6 +393,51 @@ class DrawnShape(DrawnObject):
 
 # region Text
 
+_resolved_text_styles: dict[_typing.Hashable, _styles.text_style.TextStyle] = {}
+_MAX_RESOLVED_TEXT_STYLES: int = 1024
+
+def _resolve_text_style(style: _styles.text_style.TextStyle, 
+                        supports: _backend.TextSupportState, 
+                        ) -> _styles.text_style.TextStyle:
+    """Get the style to render a text style in with features a backend supports.
+
+    Results are interned by the style and the support state, so texts in the same style share one 
+    frozen style, and nothing is copied when drawing. The style itself is returned if fully 
+    supported.
+
+    :param style: The text style
+    :param supports: Support state of text features of the backend
+    """
+    if supports.custom_underline and supports.custom_strikethrough and supports.any_fontweight:
+        return style
+    key = (
+        style.cache_key, supports.custom_underline, supports.custom_strikethrough, 
+        supports.any_fontweight, tuple(supports.fontweight), 
+        )
+    resolved = _resolved_text_styles.get(key)
+    if resolved is not None:
+        return resolved
+    ## Custom underline and strikethrough fall back to the stock ones
+    underlined = style.underlined
+    if not supports.custom_underline and not isinstance(underlined, bool):
+        underlined = True
+    strikethrough = style.strikethrough
+    if not supports.custom_strikethrough and not isinstance(strikethrough, bool):
+        strikethrough = True
+    ## Font weight
+    # Set font weight to closest supported one
+    # This part vibed with GitHub Copilot using model GPT-5 mini
+    weight = style.weight
+    available_weights = supports.fontweight
+    if not supports.any_fontweight and available_weights and weight not in available_weights:
+        weight = min(available_weights, key=lambda w: abs(w - style.weight))
+    if len(_resolved_text_styles) >= _MAX_RESOLVED_TEXT_STYLES:
+        _resolved_text_styles.clear()
+    resolved = _resolved_text_styles[key] = _styles.text_style.FrozenTextStyle(
+        style.font, style.size, weight, style.italic, underlined, strikethrough, 
+        )
+    return resolved
+
 class DrawnText(DrawnObject):
     """A class used to represent texts drawn to GUI or canvas.
 
@@ -337,61 +490,162 @@ class DrawnText(DrawnObject):
             # Convert into texture
             self._texture = _styles.texture.ensure_texture(new_texture)
 
+    @property
+    def rendered_style(self) -> _styles.text_style.TextStyle:
+        """Text style actually rendered by backend, with what backend does not support replaced by 
+        the closest it supports. Backends draw texts in this style."""
+        return _resolve_text_style(self.style, self.window.parent.backend.TextBase.supports)
+
     @property
     def boundary(self) -> _styles.shape.ShapeRange:
-        """Rect boundary of the drawn text."""
+        """Rect boundary of the drawn text, measured by backend even before drawn if supported."""
         # TODO: Implement getting text boundary via text-shape conversion
         pos = self.offset[0] - self.anchor[0], self.offset[1] - self.anchor[1]
-        size = self._backend_reported_size
+        size = self.window.parent.backend.TextBase.measure_text(self.text, self.rendered_style)
+        if size is None:
+            size = self._backend_reported_size # Only known after drawn
         return pos, size
 
+    @property
+    def paint_margin(self) -> float:
+        """Half of font size, as the baseline is placed at the bottom of measured size, leaving 
+        descenders below it."""
+        return self.rendered_style.size / 2 + 1
+
+    @property
+    def paint_boundary(self) -> _styles.shape.ShapeRange:
+        (_, _), (w, h) = self.boundary
+        if w == 0 and h == 0:
+            return self.boundary # Size is only known after drawn
+        x, y = self.offset # Texts are drawn at offset regardless of anchor
+        margin = self.paint_margin
+        return (x - margin, y - margin), (w + margin * 2, h + margin * 2)
+
+    @property
+    def render_key(self) -> _typing.Hashable:
+        return (
+            self.text, self.style.cache_key, self.texture.cache_key, 
+            tuple(self.offset), tuple(self.anchor), 
+            )
+
     def draw(self) -> _typing.Self:
         """Draw the text.
 
         :param window: The window to draw text to
         """
         backend = self.window.parent.backend
-        # Remove self from render list if already rendered
-        if self in self.window._drawing_list:
-            self.window._drawing_list.remove(self)
         # Rendering process
         if backend.TextBase.supports.direct_render:
             # TODO: Add support for backend's prefer_conversion flag
-            #### Direct render
-            ### Handle fallback of styles
-            if not False in [
-                    backend.TextBase.supports.custom_strikethrough, 
-                    backend.TextBase.supports.custom_underline, 
-                    backend.TextBase.supports.any_fontweight, 
-                    ]:
-                ## Make a copy of current style
-                rendered_style = _copy.deepcopy(self.style)
-                ## Custom underline and strikethrough
-                if not backend.TextBase.supports.custom_underline:
-                    rendered_style.underlined = True
-                if not backend.TextBase.supports.custom_strikethrough:
-                    rendered_style.strikethrough = True
-                ## Font weight
-                # Set font weight to closest supported one
-                # This part vibed with GitHub Copilot using model GPT-5 mini
-                available_weights = backend.TextBase.supports.fontweight
-                if self.style.weight not in available_weights:
-                    closest = min(available_weights, key=lambda w: abs(w - self.style.weight))
-                    rendered_style.weight = closest
-                ## Make new render object
-                rendered_text = _copy.deepcopy(self)
-                rendered_text.style = rendered_style
-            else:
-                rendered_text = self
-            self.window.backend_base.charmy_window._drawing_list.append(rendered_text)
+            #### Direct render, styles unsupported by backend are resolved in `rendered_style`
+            self._add_to_drawing_list()
             if _DEBUG_FLAGS.DRAW_OBJECTS_BOUNDARY:
                 _draw_bbox(self)
         else:
             #### Render as shape
             # TODO: Implement text → shape fallback
             raise NotImplementedError("Currently cannot render text as shape!")
+        self._damage_if_changed()
+        self._drawn = True
+        return self
+
+    def __contains__(self, point: _styles.shape.Point) -> bool:
+        return point in _styles.shape.Rect((0, 0), self.boundary[1])
+
+
+# region Layer
+
+class DrawnLayer(DrawnObject):
+    """A class used to represent a group of drawn objects cached as a layer.
+
+    Objects in a layer are rendered by backend into an offscreen surface in the size of the layer, 
+    which is composited onto the window as a whole. The surface is rendered again only when the 
+    layer is invalidated, i.e. when any object inside changed, or objects are added or removed. 
+    Objects are clipped to the boundary of the layer.
+    """
+
+    def __init__(self, 
+                window: _window.WindowEntity, 
+                offset: _styles.shape.Point, 
+                size: _styles.shape.Size, 
+                ):
+        """Used to express a layer of drawn objects.
+
+        :param offset: Position of the layer
+        :param size: Size of the layer
+        """
+        super().__init__(window)
+        self._attrs = ["offset", "size"]
+
+        self.objects: list[DrawnObject] = [] # Objects in the layer, in drawing order
+        self.offset: _styles.shape.Point = offset
+        self.anchor: _styles.shape.Point = (0, 0)
+        self.size: _styles.shape.Size = size
+
+        self._last_objects: list[DrawnObject] = []
+        self._version: int = 0 # Increases every time the layer is invalidated
+        self._surface: _typing.Any = None # Offscreen surface rendered by backend
+        self._surface_version: int = -1 # Version of the layer when the surface was rendered
+
+    @property
+    def boundary(self) -> _styles.shape.ShapeRange:
+        """Rect boundary of the layer."""
+        return (self.offset[0] - self.anchor[0], self.offset[1] - self.anchor[1]), self.size
+
+    @property
+    def render_key(self) -> _typing.Hashable:
+        return (self._version, tuple(self.offset), tuple(self.anchor), tuple(self.size))
+
+    @property
+    def need_render(self) -> bool:
+        """Whether the offscreen surface is missing or outdated."""
+        return self._surface is None or self._surface_version != self._version
+
+    def invalidate(self) -> _typing.Self:
+        """Mark the layer as changed, so it is rendered again next time it is drawn."""
+        self._version += 1
+        return self
+
+    def begin(self) -> _typing.Self:
+        """Start collecting objects drawn after this, until `end()` is called."""
+        self._last_objects = self.objects
+        self.objects = []
+        self.window._layer_stack.append(self)
+        return self
+
+    def end(self) -> _typing.Self:
+        """Stop collecting objects, and invalidate the layer if objects inside are not the same."""
+        if self.window._layer_stack[-1] is not self:
+            raise RuntimeError(f"Layer {self.id} ended while not being the current layer.")
+        self.window._layer_stack.pop()
+        if self.objects != self._last_objects:
+            self.invalidate()
+            current_objects = set(self.objects)
+            for drawn_obj in self._last_objects:
+                if drawn_obj not in current_objects and drawn_obj not in self.window._drawing_list:
+                    self.window._display_list.pop(drawn_obj, None)
+                    # 👆 No longer drawn in the layer, drop its recorded commands
+        self._last_objects = []
+        return self
+
+    def draw(self) -> _typing.Self:
+        """Draw the layer, should be called after `end()`."""
+        self._add_to_drawing_list()
+        boundary = self.boundary
+        if boundary != self._drawn_boundary:
+            # Unlike other objects, changes inside do not damage the whole layer
+            if self._drawn_boundary is not None:
+                self.window._redraw_regions.append(self._drawn_boundary)
+            self.window._redraw_regions.append(boundary)
+            self._drawn_boundary = boundary
+            self.invalidate()
+        render_key = self.render_key
+        if render_key != self._drawn_key:
+            self._drawn_key = render_key
+            if self.window._current_layer is not None:
+                self.window._current_layer.invalidate() # Nested in another layer
         self._drawn = True
         return self
 
     def __contains__(self, point: _styles.shape.Point) -> bool:
-        return point in _styles.shape.Rect((0, 0), self.boundary[1])
\ No newline at end of file
+        return point in _styles.shape.Rect(*self.boundary)
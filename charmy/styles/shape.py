@@ -31,7 +31,7 @@ from __future__ import annotations as _
 import typing as _typing
 
 import warnings as _warnings
-from dataclasses import dataclass as _dataclass
+from dataclasses import dataclass as _dataclass, fields as _fields, is_dataclass as _is_dataclass
 from abc import abstractmethod as _abstractmethod
 import json as _json
 import reactive_caching as _reactive_caching
@@ -45,6 +45,13 @@ from ..utils import \
 
 # region Lines
 
+def _freeze(value: _typing.Any) -> _typing.Hashable:
+    """Unpack vars and convert lists into tuples recursively, so the value can be used as a key."""
+    value = _var.unpack_var(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 class LinePath(_reactive_caching.CachedClass):
     """Base class of all line paths."""
 
@@ -76,6 +83,17 @@ class LinePath(_reactive_caching.CachedClass):
         _warnings.warn(f"Line type {self.type} does not support getting boundary.")
         return (0, 0), (0, 0)
 
+    @_reactive_caching.cached_property("-all-")
+    def cache_key(self) -> _typing.Hashable:
+        """A hashable key that equals for lines with the same type and geometry.
+
+        Used to tell if a line changed, e.g. to find out if drawn commands or paths built by 
+        backends can be reused. Cached until any attribute of the line is set.
+        """
+        if not _is_dataclass(self):
+            return (self.type, id(self))
+        return (self.type, *(_freeze(getattr(self, field.name)) for field in _fields(self)))
+
     @staticmethod
     def find_class_by_type(type_name: str) -> type[LinePath] | None:
         """Find a line class by line type, return `None` if not found.
@@ -294,7 +312,10 @@ class Curve(LinePath):
         raise TypeError("Curve class is only used for classification, and cannot be drawn!")
 
     @_abstractmethod
-    def flatten(self, tolerance: int = 15) -> PolyLine: ...
+    def flatten(self, 
+                tolerance: float | None = None, 
+                max_error: float = _geo_math.DEFAULT_MAX_ERROR, 
+                ) -> PolyLine: ...
 
 @_dataclass
 class CircleArc(Curve):
@@ -356,8 +377,15 @@ class CircleArc(Curve):
         # and return the ______
         return [CubicBezier(b) for b in beziers]
 
-    def flatten(self, tolerance: float = 15.0) -> PolyLine:
-        """Flatten the circle arc into a PolyLine approximation."""
+    def flatten(self, 
+                tolerance: float | None = None, 
+                max_error: float = _geo_math.DEFAULT_MAX_ERROR, 
+                ) -> PolyLine:
+        """Flatten the circle arc into a PolyLine approximation.
+
+        :param tolerance: Maximum angle step in degrees, splits by angle only and ignores max_error
+        :param max_error: Maximum distance in pixels between the polyline and the arc
+        """
         # Vars conversion
         center = _var.unpack_var(self.center, (0, 0))
         radius = _var.unpack_var(self.radius, 0)
@@ -366,7 +394,7 @@ class CircleArc(Curve):
         # Calc and return flattened curve, which is also a fuck
         points = _geo_math.flatten_circle_arc(
             center, radius, start_orient, end_orient,
-            tolerance=tolerance)
+            tolerance=tolerance, max_error=max_error)
         return PolyLine(points)
 
     @_reactive_caching.cached_property(["center", "radius", "start_orient", "end_orient"])
@@ -473,10 +501,17 @@ class QuadraticBezier(Curve):
         else:
             return LinePath.fallback(self, [*_from, self.__class__])
 
-    def flatten(self, tolerance: float = 15.0) -> PolyLine:
-        """Flatten the quadratic Bezier curve into a PolyLine approximation."""
+    def flatten(self, 
+                tolerance: float | None = None, 
+                max_error: float = _geo_math.DEFAULT_MAX_ERROR, 
+                ) -> PolyLine:
+        """Flatten the quadratic Bezier curve into a PolyLine approximation.
+
+        :param tolerance: Angle tolerance in degrees, uses fixed segments and ignores max_error
+        :param max_error: Maximum distance in pixels between the polyline and the curve
+        """
         points = _var.unpack_var(self.points, [])
-        polyline_points = _geo_math.flatten_quadratic_bezier(points, tolerance)
+        polyline_points = _geo_math.flatten_quadratic_bezier(points, tolerance, max_error)
         return PolyLine(polyline_points)
 
     @_reactive_caching.cached_property(["points"])
@@ -538,10 +573,17 @@ class CubicBezier(Curve):
         points = _var.unpack_var(self.points, [])
         return points[-1]
 
-    def flatten(self, tolerance: float = 15.0) -> PolyLine:
-        """Flatten the cubic Bezier curve into a PolyLine approximation."""
+    def flatten(self, 
+                tolerance: float | None = None, 
+                max_error: float = _geo_math.DEFAULT_MAX_ERROR, 
+                ) -> PolyLine:
+        """Flatten the cubic Bezier curve into a PolyLine approximation.
+
+        :param tolerance: Angle tolerance in degrees, uses fixed segments and ignores max_error
+        :param max_error: Maximum distance in pixels between the polyline and the curve
+        """
         points = _var.unpack_var(self.points, [])
-        points = _geo_math.flatten_cubic_bezier(points, tolerance)
+        points = _geo_math.flatten_cubic_bezier(points, tolerance, max_error)
         return PolyLine(points)
 
     @_reactive_caching.cached_property(["points"])
@@ -583,6 +625,14 @@ class ShapeType(_reactive_caching.CachedClass):
     @_abstractmethod
     def boundary(self) -> ShapeRange: ...
 
+    @property
+    def cache_key(self) -> _typing.Hashable:
+        """A hashable key that equals for shapes with the same type and geometry.
+
+        Used to tell if a shape changed, e.g. to find out if drawn commands can be reused.
+        """
+        return (self.type, id(self))
+
     @_abstractmethod
     def __contains__(self, point: Point) -> bool: ...
 
@@ -686,6 +736,12 @@ class SingleShape(ShapeType):
         min_y, max_y = min(ys), max(ys)
         return (min_x, min_y), (max_x - min_x, max_y - min_y)
 
+    @_reactive_caching.cached_property("-all-")
+    def cache_key(self) -> _typing.Hashable:
+        """A hashable key made up of keys of all lines of the shape, cached until any attribute of 
+        the shape is set."""
+        return (self.type, tuple(line.cache_key for line in self.lines))
+
     def _validate_lines(self):
         """Validate if lines form a valid closed shape."""
         if len(self.lines) == 0:
@@ -699,15 +755,36 @@ class SingleShape(ShapeType):
             # 👆 Set last_line_end to end point of current line, lines must be connected.
         return True
 
-    def flatten(self, tolerance: int = 15) -> PolyLine:
-        """Convert all curve edges to polyline and merge the shape into a single polyline."""
-        lines: list[Line | PolyLine] = []
-        for line in self.lines:
+    def flatten(self, 
+                tolerance: float | None = None, 
+                max_error: float = _geo_math.DEFAULT_MAX_ERROR, 
+                ) -> PolyLine:
+        """Convert all curve edges to polyline and merge the shape into a single polyline.
+
+        :param tolerance: Angle tolerance in degrees, uses fixed segments and ignores max_error
+        :param max_error: Maximum distance in pixels between the polyline and each curve edge
+        """
+        lines: list[LinePath] = list(self.lines)
+        if tolerance is None:
+            # Flatten Bezier edges of each degree in one batch, much faster for shapes with lots of
+            # them, e.g. ones from SVG paths
+            for bezier_type, flatten_batch in (
+                (QuadraticBezier, _geo_math.flatten_quadratic_beziers), 
+                (CubicBezier, _geo_math.flatten_cubic_beziers), 
+                ):
+                indexes = [index for index, line in enumerate(lines) if type(line) is bezier_type]
+                if not indexes:
+                    continue
+                batch = flatten_batch(
+                    [_var.unpack_var(lines[index].points, []) for index in indexes], # type: ignore
+                    max_error, 
+                    )
+                for index, points in zip(indexes, batch):
+                    lines[index] = PolyLine(points)
+        for index, line in enumerate(lines):
             if isinstance(line, Curve):
-                lines.append(line.flatten(tolerance))
-            else:
-                lines.append(line) # type: ignore
-        return PolyLine.join(lines)
+                lines[index] = line.flatten(tolerance, max_error)
+        return PolyLine.join(lines) # type: ignore
 
     def __contains__(self, point: Point) -> bool:
         """Perform a hit test and test if a point is within shape."""
@@ -719,7 +796,7 @@ class SingleShape(ShapeType):
             return False
         point_x, point_y = point
         winding: int = 0
-        shape_lines = self.flatten(30).to_lines()
+        shape_lines = self.flatten(max_error=1.0).to_lines()
         for line in shape_lines:
             if not line.boundary[0][1] <= point[1] <= line.boundary[0][1] + line.boundary[1][1] or \
                 line.boundary[0][1] + line.boundary[1][1] < point[1]:
@@ -803,6 +880,11 @@ class Rect(SingleShape):
         pos = _var.unpack_var(self.pos, (0, 0))
         size = _var.unpack_var(self.size, (0, 0))
         return pos, size
+
+    @property
+    def cache_key(self) -> _typing.Hashable:
+        """A hashable key of the rect, without building its lines."""
+        return (self.type, _freeze(self.pos), _freeze(self.size))
     
     def __contains__(self, point: Point) -> bool:
         """Accelerated implemention of point hit test in rect."""
@@ -830,15 +912,19 @@ class RoundRect(SingleShape):
         """Init parent class."""
         super().__init__()
 
-    @_reactive_caching.cached_property(["position", "size", "radius"])
+    @_reactive_caching.cached_property(["radius"])
+    def radii(self) -> tuple[int, int, int, int]:
+        """Radius of each corner, in order of top-left, top-right, bottom-right, bottom-left."""
+        radius_raw = _var.unpack_var(self.radius, (0, 0, 0, 0))
+        if isinstance(radius_raw, int):
+            return (radius_raw, radius_raw, radius_raw, radius_raw)
+        return tuple(radius_raw) # type: ignore
+
+    @_reactive_caching.cached_property(["pos", "size", "radius"])
     def lines(self) -> list[LinePath]:
         pos = _var.unpack_var(self.pos, (0, 0))
         size = _var.unpack_var(self.size, (0, 0))
-        radius_raw = _var.unpack_var(self.radius, (0, 0, 0, 0))
-        if isinstance(radius_raw, int):
-            radii = (radius_raw, radius_raw, radius_raw, radius_raw)
-        else:
-            radii = radius_raw
+        radii = self.radii
         return [
             Line([
                 (pos[0] + radii[0], pos[1]), # top-left
@@ -884,6 +970,11 @@ class RoundRect(SingleShape):
         size = _var.unpack_var(self.size, (0, 0))
         return pos, size
 
+    @property
+    def cache_key(self) -> _typing.Hashable:
+        """A hashable key of the round rect, without building its lines."""
+        return (self.type, _freeze(self.pos), _freeze(self.size), _freeze(self.radius))
+
 # region ShapeGroup
 class ShapeGroup(ShapeType):
     """Complicated shapes formed by a group of AnyShape."""
@@ -928,6 +1019,11 @@ class ShapeGroup(ShapeType):
         min_y, max_y = min(ys), max(ys)
         return (min_x, min_y), (max_x - min_x, max_y - min_y)
 
+    @property
+    def cache_key(self) -> _typing.Hashable:
+        """A hashable key made up of keys of all shapes in the group."""
+        return (self.type, tuple(shape.cache_key for shape in self.shapes))
+
     def __getitem__(self, item: int) -> AnyShape:
         return self.shapes[item]
 
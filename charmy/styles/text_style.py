@@ -103,6 +103,15 @@ eights?view=netframework-4.8#remarks) to learn more about the values. Presets ar
         self.underlined: bool | _draw.DrawnLine = underlined
         self.strikethrough: bool | _draw.DrawnLine = strikethrough
 
+    @property
+    def cache_key(self) -> _typing.Hashable:
+        """A hashable key that equals for text styles that look the same."""
+        return (
+            self.font, self.size, self.weight, self.italic, 
+            *(decoration if isinstance(decoration, bool) else decoration.render_key 
+              for decoration in (self.underlined, self.strikethrough)), 
+            )
+
     @staticmethod
     def from_json(json_content):
         return TextStyle(**json_content)
@@ -131,8 +140,38 @@ eights?view=netframework-4.8#remarks) to learn more about the values. Presets ar
             text: str, 
             backend: _typing.Optional[_backend.Backend]
             ) -> _shape.ShapeRange:
-        """Get boundary of a specific text in this style. (NOT IMPLEMENTED)"""
-        return (0, 0), (0, 0)
+        """Get boundary of a specific text in this style, measured by the backend before drawn.
+
+        :param text: The text
+        :param backend: Backend to measure with, boundary is empty if not given or not supported
+        """
+        if backend is None:
+            return (0, 0), (0, 0)
+        size = backend.TextBase.measure_text(text, self)
+        if size is None:
+            return (0, 0), (0, 0)
+        return (0, 0), size
+
+
+class FrozenTextStyle(TextStyle):
+    """Text style that cannot be modified after created, so it can be shared safely, e.g. styles 
+    resolved for what a backend supports."""
+
+    def __init__(self, *args, **kwargs):
+        """To create a text style that cannot be modified, see `TextStyle.__init__()`."""
+        super().__init__(*args, **kwargs)
+        self._cache_key: _typing.Hashable = super().cache_key
+        self._frozen: bool = True
+
+    @property
+    def cache_key(self) -> _typing.Hashable:
+        """A hashable key that equals for text styles that look the same, computed once."""
+        return self._cache_key
+
+    def __setattr__(self, name: str, value: _typing.Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{type(self).__name__} cannot be modified.")
+        super().__setattr__(name, value)
 
 
 TextStyle.sys_default = TextStyle("Arial", 14)
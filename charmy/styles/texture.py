@@ -64,6 +64,14 @@ class Texture:
             case _: # Not even suspected to be anything
                 return False
 
+    @property
+    def cache_key(self) -> _typing.Hashable:
+        """A hashable key that equals for textures that look the same.
+
+        Used to tell if a texture changed, e.g. to find out if drawn commands can be reused.
+        """
+        return (self.type, id(self))
+
     @staticmethod
     def find_class_by_type(type_name: str) -> type[Texture] | None:
         """Find a texture class by line type, return `None` if not found.
@@ -198,6 +206,10 @@ class Color(Texture):
     def __iter__(self):
         return iter(self.color)
 
+    @property
+    def cache_key(self) -> _typing.Hashable:
+        return (self.type, tuple(self.color))
+
     @property
     def r(self) -> int:
         return self.color[0]
@@ -228,6 +240,10 @@ class Transparent(Texture):
     def __iter__(self):
         return iter(self.color)
 
+    @property
+    def cache_key(self) -> _typing.Hashable:
+        return (self.type,)
+
 TransparentLike: _typing.TypeAlias = None | tuple[int, int, int, _typing.Literal[0]]
 
 
@@ -1,6 +1,7 @@
 """Utilities package for Charmy.
 
 Expose some general utils."""
-from . import geo_math, type_checking, layout_profiles, svg, event_types, var
+from . import geo_math, type_checking, layout_profiles, svg, event_types, var, spatial_index, damage
+from . import drawing_list, frame_clock, frame_stats, batching
 
 # __all__ = ["geo_math", "type_checking", "layout_profiles", "svg", "event_types", "var"]
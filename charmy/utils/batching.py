@@ -0,0 +1,73 @@
+"""Splitting objects in paint order into runs that can be drawn together as one batch.
+
+Objects that share the same drawing state (e.g. fill and border textures) can be drawn as one
+combined path with a single fill, but only if doing so paints the same pixels as drawing them one by
+one. A run is therefore made up of consecutive objects only, so no other object is painted between
+them, and none of them overlaps another one of the run, so no object is painted over by one before
+it in a different order.
+"""
+
+from __future__ import annotations as _
+
+import typing as _typing
+
+from .spatial_index import is_overlapping as _is_overlapping
+
+if _typing.TYPE_CHECKING:
+    from ..styles import shape as _shape
+
+__all__ = ["split_runs"]
+
+
+_ItemType = _typing.TypeVar("_ItemType")
+
+
+def split_runs(items: _typing.Iterable[_ItemType],
+               batch_key: _typing.Callable[[_ItemType], _typing.Hashable | None],
+               boundary: _typing.Callable[[_ItemType], _shape.ShapeRange],
+               max_run: int = 256,
+               ) -> _typing.Iterator[list[_ItemType]]:
+    """Split items in paint order into runs, keeping the order.
+
+    A run holds consecutive items with the same batch key whose boundaries do not overlap each
+    other. Items with `None` as batch key are never batched, and make up a run of their own.
+
+    :param items: Items in paint order
+    :param batch_key: Gets the key of drawing state of an item, or `None` if it cannot be batched
+    :param boundary: Gets the rect boundary of an item, including everything it paints
+    :param max_run: Maximum items in a run, which bounds the cost of testing overlaps
+    :return runs: Iterator of runs, each is a list of items in paint order
+    """
+    run: list[_ItemType] = []
+    run_key: _typing.Hashable | None = None
+    run_boundaries: list[_shape.ShapeRange] = []
+    run_box: list[float] = [0, 0, 0, 0] # Union of boundaries in the run, in (x1, y1, x2, y2)
+    for item in items:
+        key = batch_key(item)
+        if key is None:
+            if run:
+                yield run
+                run = []
+            yield [item]
+            continue
+        item_boundary = boundary(item)
+        (x, y), (w, h) = item_boundary
+        if run and key == run_key and len(run) < max_run:
+            box_x1, box_y1, box_x2, box_y2 = run_box
+            if not (x < box_x2 and x + w > box_x1 and y < box_y2 and y + h > box_y1) or \
+                not any(_is_overlapping(item_boundary, other) for other in run_boundaries):
+                # 👆 Only test each one in the run if overlapping with the run as a whole
+                run.append(item)
+                run_boundaries.append(item_boundary)
+                run_box[:] = (
+                    min(box_x1, x), min(box_y1, y), max(box_x2, x + w), max(box_y2, y + h),
+                    )
+                continue
+        if run:
+            yield run
+        run = [item]
+        run_key = key
+        run_boundaries = [item_boundary]
+        run_box[:] = (x, y, x + w, y + h)
+    if run:
+        yield run
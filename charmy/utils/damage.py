@@ -0,0 +1,168 @@
+"""Damage (regions to be redrawn) accumulating for windows.
+
+Drawn objects report their regions to their window when they need to be redrawn. These regions are
+collected by a `DamageAccumulator` during a frame, and then coalesced into a small set of
+non-overlapping rects before the window redraws and presents them, so duplicated or overlapping
+regions never cause the same pixels to be redrawn or copied more than once.
+"""
+
+from __future__ import annotations as _
+
+import typing as _typing
+
+if _typing.TYPE_CHECKING:
+    from ..styles import shape as _shape
+
+__all__ = ["DamageAccumulator"]
+
+
+_Box: _typing.TypeAlias = tuple[int, int, int, int] # (left, top, right, bottom)
+
+
+def _box_area(box: _Box) -> int:
+    return (box[2] - box[0]) * (box[3] - box[1])
+
+def _box_union(box_a: _Box, box_b: _Box) -> _Box:
+    return (
+        min(box_a[0], box_b[0]), min(box_a[1], box_b[1]),
+        max(box_a[2], box_b[2]), max(box_a[3], box_b[3]),
+        )
+
+def _box_intersection_area(box_a: _Box, box_b: _Box) -> int:
+    width = min(box_a[2], box_b[2]) - max(box_a[0], box_b[0])
+    height = min(box_a[3], box_b[3]) - max(box_a[1], box_b[1])
+    if width <= 0 or height <= 0:
+        return 0
+    return width * height
+
+
+class DamageAccumulator:
+    """Collects damaged regions of a window during a frame, and coalesces them when asked.
+
+    Coalescing clamps all regions to the window, drops duplicated and empty ones, then merges
+    overlapping regions and regions that are cheap to merge, resulting non-overlapping rects.
+
+    Tuning
+    ------
+    :max_rects:         If still more rects than this after merging, use their bounding rect
+    :merge_cost:        Area (in px) of extra pixels we accept to redraw to save one rect
+    :full_window_ratio: If damaged area covers this ratio of the window, redraw the full window
+    """
+
+    max_rects: int = 16
+    merge_cost: int = 4096
+    full_window_ratio: float = 0.75
+
+    def __init__(self, initial: _typing.Iterable[_shape.ShapeRange] = ()):
+        """To create a damage accumulator.
+
+        :param initial: Regions that are already damaged
+        """
+        self._regions: dict[_shape.ShapeRange, None] = {} # Dict as an insertion-ordered set
+        self._coalesced: list[_shape.ShapeRange] | None = None
+        self._coalesced_for: _shape.Size | None = None
+        for region in initial:
+            self.append(region)
+
+    def append(self, region: _shape.ShapeRange) -> _typing.Self:
+        """Mark a region as damaged.
+
+        :param region: The damaged region, in `((x, y), (width, height))`
+        """
+        if region[1][0] <= 0 or region[1][1] <= 0:
+            return self # Empty region, nothing to redraw
+        if region not in self._regions:
+            self._regions[region] = None
+            self._coalesced = None
+        return self
+
+    def clear(self) -> _typing.Self:
+        """Forget all damaged regions, usually called after a frame is presented."""
+        self._regions.clear()
+        self._coalesced = None
+        return self
+
+    def is_full(self, window_size: _shape.Size) -> bool:
+        """Check if the whole window is damaged after coalescing.
+
+        :param window_size: Size of the window
+        """
+        return self.coalesce(window_size) == [((0, 0), window_size)]
+
+    def coalesce(self, window_size: _shape.Size) -> list[_shape.ShapeRange]:
+        """Get the damaged regions as a small set of non-overlapping rects clamped to the window.
+
+        :param window_size: Size of the window, used to clamp the regions
+        :return regions: Coalesced regions, in `((x, y), (width, height))`
+        """
+        if self._coalesced is not None and self._coalesced_for == window_size:
+            return self._coalesced
+        window_w, window_h = window_size
+        full_window: _Box = (0, 0, window_w, window_h)
+        # Clamp to window and drop empty or duplicated regions
+        boxes: dict[_Box, None] = {}
+        for (x, y), (w, h) in self._regions:
+            box = (max(int(x), 0), max(int(y), 0),
+                   min(int(x + w), window_w), min(int(y + h), window_h))
+            if box[0] < box[2] and box[1] < box[3]:
+                boxes[box] = None
+        if len(boxes) == 0:
+            result_boxes: list[_Box] = []
+        elif full_window in boxes:
+            result_boxes = [full_window]
+        elif len(boxes) > self.max_rects * 8:
+            # Too many to merge one by one, it is already worth a bounding rect
+            result_boxes = [self._bounding_box(boxes)]
+        else:
+            result_boxes = self._merge(list(boxes))
+            if len(result_boxes) > self.max_rects:
+                result_boxes = [self._bounding_box(result_boxes)]
+        # Fall back to full window if most of the window is damaged anyway
+        window_area = window_w * window_h
+        if window_area > 0 and \
+            sum(_box_area(box) for box in result_boxes) >= window_area * self.full_window_ratio:
+            result_boxes = [full_window]
+        self._coalesced = [
+            ((box[0], box[1]), (box[2] - box[0], box[3] - box[1])) for box in result_boxes
+            ]
+        self._coalesced_for = window_size
+        return self._coalesced
+
+    @staticmethod
+    def _bounding_box(boxes: _typing.Iterable[_Box]) -> _Box:
+        boxes = list(boxes)
+        return (
+            min(box[0] for box in boxes), min(box[1] for box in boxes),
+            max(box[2] for box in boxes), max(box[3] for box in boxes),
+            )
+
+    def _merge(self, boxes: list[_Box]) -> list[_Box]:
+        """Merge overlapping boxes, and boxes whose union wastes no more area than `merge_cost`."""
+        merged_any = True
+        while merged_any:
+            merged_any = False
+            result: list[_Box] = []
+            for box in boxes:
+                for index, other in enumerate(result):
+                    overlap = _box_intersection_area(box, other)
+                    union = _box_union(box, other)
+                    wasted = _box_area(union) - (_box_area(box) + _box_area(other) - overlap)
+                    if overlap > 0 or wasted <= self.merge_cost:
+                        # Overlapping boxes must be merged to keep results non-overlapping
+                        result[index] = union
+                        merged_any = True
+                        break
+                else:
+                    result.append(box)
+            boxes = result
+        return boxes
+
+    def __iter__(self) -> _typing.Iterator[_shape.ShapeRange]:
+        """Iterate raw damaged regions (not coalesced)."""
+        return iter(self._regions)
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, region: object) -> bool:
+        return region in self._regions
@@ -0,0 +1,101 @@
+"""Ordered collection of drawn objects of a window, in paint order.
+
+Each object is given a z-order slot when it is added for the first time. Adding an object that is
+already present again keeps its slot, so re-drawing an object every frame neither moves it in the
+stacking order nor costs more than a dict lookup. Objects are iterated from the lowest slot (painted
+first) to the highest slot (painted last, on the top).
+"""
+
+from __future__ import annotations as _
+
+import typing as _typing
+
+__all__ = ["DrawingList"]
+
+
+_ItemType = _typing.TypeVar("_ItemType", bound=_typing.Hashable)
+
+
+class DrawingList(_typing.Generic[_ItemType]):
+    """Insertion-ordered dict of objects with explicit z-order slots.
+
+    Adding, removing and membership checks are O(1). Iteration follows the slots, which is the same
+    as the dict order unless an object was given a slot below the top explicitly, in which case the
+    dict is sorted once on the next iteration.
+    """
+
+    def __init__(self, items: _typing.Iterable[_ItemType] = ()):
+        """To create a drawing list.
+
+        :param items: Objects to add initially, in paint order
+        """
+        self._entries: dict[_ItemType, tuple[int, _ItemType]] = {} # {key: (slot, latest object)}
+        self._next_slot: int = 0
+        self._sorted: bool = True
+        for item in items:
+            self.add(item)
+
+    def add(self, item: _ItemType, slot: int | None = None) -> int:
+        """Add an object on the top, or keep its slot if already added.
+
+        :param item: The object to add
+        :param slot: Put the object at this slot instead, can be used to move an object
+        :return slot: Slot of the object
+        """
+        entry = self._entries.get(item)
+        if slot is None:
+            slot = entry[0] if entry is not None else self._next_slot
+        if entry is None or entry[0] != slot:
+            self._entries.pop(item, None) # Re-insert the key so dict order follows slots
+            if slot < self._next_slot - 1:
+                self._sorted = False # Not on the top, dict order no longer follows slots
+        self._entries[item] = (slot, item) # 👈 Keep the latest object, in case an equal copy is given
+        self._next_slot = max(self._next_slot, slot + 1)
+        return slot
+
+    def raise_to_top(self, item: _ItemType) -> int:
+        """Move an object to the top of the stacking order, adds it if not added yet.
+
+        :param item: The object to raise
+        :return slot: New slot of the object
+        """
+        self._entries.pop(item, None)
+        return self.add(item)
+
+    def remove(self, item: _ItemType) -> _typing.Self:
+        """Remove an object, does nothing if not added.
+
+        :param item: The object to remove
+        """
+        self._entries.pop(item, None)
+        return self
+
+    def clear(self) -> _typing.Self:
+        """Remove all objects."""
+        self._entries.clear()
+        self._next_slot = 0
+        self._sorted = True
+        return self
+
+    def slot_of(self, item: _ItemType) -> int:
+        """Get the slot of an object.
+
+        :param item: The object to look up
+        """
+        return self._entries[item][0]
+
+    def _sort(self) -> None:
+        self._entries = dict(sorted(self._entries.items(), key=lambda kv: kv[1][0]))
+        self._sorted = True
+
+    def __iter__(self) -> _typing.Iterator[_ItemType]:
+        """Iterate objects in paint order, from bottom to top."""
+        if not self._sorted:
+            self._sort()
+        return (obj for _, obj in self._entries.values())
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,69 @@
+"""Frame clock used by the main loop to pace rendering at a target frame rate.
+
+Frames are rendered on a grid of deadlines spaced by the frame time. Invalidations that happen
+before the next deadline are coalesced into a single render. When a frame overruns, the deadlines
+it missed are skipped instead of being rendered back to back, so later frames land on the grid
+again, while the main loop keeps handling input in between.
+"""
+
+from __future__ import annotations as _
+
+import time as _time
+
+__all__ = ["FrameClock"]
+
+
+class FrameClock:
+    """Frame deadline accounting for a target frame rate.
+
+    Tuning
+    ------
+    :max_skip: If a frame overruns more deadlines than this, render next frame at once instead
+    """
+
+    max_skip: int = 4
+
+    def __init__(self, fps: float = 60.):
+        """To create a frame clock.
+
+        :param fps: Target frame rate, in frames per second
+        """
+        if fps <= 0:
+            raise ValueError(f"Target frame rate must be positive, got {fps}.")
+        self.fps: float = fps
+        self.frame_time: float = 1 / fps
+        self.next_deadline: float = 0. # Earliest time to start next frame, in monotonic time
+        self.rendered_frames: int = 0
+        self.skipped_frames: int = 0 # Frames dropped because of overrunning, since created
+
+    def time_until_frame(self, now: float | None = None) -> float:
+        """Get time to wait before next frame can be rendered, `0` if already due.
+
+        :param now: Current monotonic time, default is got from `time.monotonic()`
+        """
+        if now is None:
+            now = _time.monotonic()
+        return max(0., self.next_deadline - now)
+
+    def frame_done(self, started: float, now: float | None = None) -> int:
+        """Account a rendered frame, and set deadline of next frame.
+
+        :param started: Monotonic time when the frame started
+        :param now: Current monotonic time, default is got from `time.monotonic()`
+        :return skipped: Number of deadlines skipped because the frame overran
+        """
+        if now is None:
+            now = _time.monotonic()
+        # After being idle, the grid restarts from the start of this frame
+        deadline = max(self.next_deadline, started) + self.frame_time
+        skipped = 0
+        if now > deadline:
+            skipped = int((now - deadline) // self.frame_time) + 1
+            if skipped <= self.max_skip:
+                deadline += skipped * self.frame_time
+            else:
+                deadline = now # Far behind anyway, no point waiting for the grid
+        self.next_deadline = deadline
+        self.rendered_frames += 1
+        self.skipped_frames += skipped
+        return skipped
@@ -0,0 +1,146 @@
+"""Per-frame timing statistics of windows.
+
+Each window keeps a `FrameStats`, which records the time spent in each phase of a frame, and a few
+counts telling how much work the frame did, into a fixed-size ring buffer. Recording only costs a
+few `time.perf_counter()` calls and attribute additions per frame, so it is always on.
+
+Phases
+------
+:pump:          Fetching events from the backend
+:dispatch:      Handling events, including triggering `WidgetUpdate`
+:draw_children: Drawing widgets and their components, which updates the drawing list
+:damage:        Coalescing damaged regions and finding objects to redraw in them
+:rasterize:     Drawing objects in `draw_frame`
+:present:       Copying drawn pixels to the screen and presenting them
+"""
+
+from __future__ import annotations as _
+
+import collections as _collections
+import time as _time
+import typing as _typing
+
+__all__ = ["PHASES", "FrameRecord", "FrameStats"]
+
+
+PHASES: tuple[str, ...] = ("pump", "dispatch", "draw_children", "damage", "rasterize", "present")
+COUNTS: tuple[str, ...] = ("objects_drawn", "regions", "bytes_copied", "calls_saved")
+
+
+class FrameRecord:
+    """Statistics of one frame, times are in seconds."""
+
+    __slots__ = PHASES + COUNTS + ("timestamp",)
+
+    def __init__(self):
+        self.pump: float = 0.
+        self.dispatch: float = 0.
+        self.draw_children: float = 0.
+        self.damage: float = 0.
+        self.rasterize: float = 0.
+        self.present: float = 0.
+        self.objects_drawn: int = 0 # Including objects drawn into layers
+        self.regions: int = 0 # Regions redrawn, 1 for a full redraw
+        self.bytes_copied: int = 0 # Bytes copied to the screen, 0 if presented without copying
+        self.calls_saved: int = 0 # Backend calls skipped as they would not change any state
+        self.timestamp: float = 0. # `time.perf_counter()` when the frame ended
+
+    @property
+    def total(self) -> float:
+        """Total time of all phases."""
+        return (self.pump + self.dispatch + self.draw_children + self.damage + self.rasterize +
+                self.present)
+
+    @classmethod
+    def sum(cls, records: _typing.Iterable[FrameRecord]) -> FrameRecord:
+        """Add up the records, e.g. of all windows in one frame.
+
+        :param records: Records to add up
+        """
+        result = cls()
+        for record in records:
+            for name in PHASES + COUNTS:
+                setattr(result, name, getattr(result, name) + getattr(record, name))
+            result.timestamp = max(result.timestamp, record.timestamp)
+        return result
+
+    def as_dict(self) -> dict[str, float]:
+        """Get all phase times and counts as a dict."""
+        return {name: getattr(self, name) for name in PHASES + COUNTS + ("total",)}
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{name}={getattr(self, name) * 1000:.3f}ms" for name in PHASES)
+        counts = ", ".join(f"{name}={getattr(self, name)}" for name in COUNTS)
+        return f"{type(self).__name__}({phases}, {counts})"
+
+
+class FrameStats:
+    """Ring buffer of `FrameRecord`s of the latest frames.
+
+    Code running during a frame adds to `current`, then `end_frame()` moves it into the buffer.
+    """
+
+    def __init__(self, capacity: int = 120):
+        """To create a frame statistics recorder.
+
+        :param capacity: Number of latest frames to keep
+        """
+        self._records: _collections.deque[FrameRecord] = _collections.deque(maxlen=capacity)
+        self.current: FrameRecord = FrameRecord() # 👈 The frame being recorded
+        self.frame_count: int = 0 # Frames recorded since created, including dropped ones
+
+    @property
+    def capacity(self) -> int:
+        """Number of latest frames kept."""
+        return _typing.cast(int, self._records.maxlen)
+
+    def end_frame(self) -> FrameRecord:
+        """Finish recording current frame and put it into the buffer.
+
+        :return record: The finished record
+        """
+        record = self.current
+        record.timestamp = _time.perf_counter()
+        self._records.append(record)
+        self.current = FrameRecord()
+        self.frame_count += 1
+        return record
+
+    def push(self, record: FrameRecord) -> _typing.Self:
+        """Put a finished record into the buffer directly.
+
+        :param record: The record to put
+        """
+        self._records.append(record)
+        self.frame_count += 1
+        return self
+
+    @property
+    def latest(self) -> FrameRecord | None:
+        """Record of the last finished frame, `None` if no frame is recorded yet."""
+        return self._records[-1] if self._records else None
+
+    @property
+    def frames(self) -> list[FrameRecord]:
+        """Records in the buffer, from the oldest to the latest."""
+        return list(self._records)
+
+    def average(self) -> FrameRecord:
+        """Get the average of records in the buffer."""
+        result = FrameRecord.sum(self._records)
+        if self._records:
+            for name in PHASES + COUNTS:
+                setattr(result, name, getattr(result, name) / len(self._records))
+        return result
+
+    def clear(self) -> _typing.Self:
+        """Forget all recorded frames."""
+        self._records.clear()
+        self.current = FrameRecord()
+        return self
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> _typing.Iterator[FrameRecord]:
+        return iter(self._records)
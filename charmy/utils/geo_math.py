@@ -18,6 +18,11 @@ from __future__ import annotations
 import math
 from typing import Tuple, List, Sequence
 
+try:
+    import numpy
+except ImportError:
+    numpy = None # 👈 Optional, only used to flatten large batches of curves faster
+
 Point = tuple[int, int]
 
 
@@ -72,17 +77,18 @@ def evaluate_cubic_bezier(points: Sequence[Point], t: float) -> tuple[float, flo
     """Evaluate a cubic Bezier at parameter t (0..1). Returns (x, y) floats."""
     start_point, control_point_first, control_point_second, end_point = points
     one_minus_t = 1.0 - t
+    # Powers are written as products, so batches flattened with NumPy round exactly the same way
     x = (
-        (one_minus_t**3) * start_point[0]
-        + 3 * (one_minus_t**2) * t * control_point_first[0]
-        + 3 * one_minus_t * (t**2) * control_point_second[0]
-        + (t**3) * end_point[0]
+        (one_minus_t * one_minus_t * one_minus_t) * start_point[0]
+        + 3 * (one_minus_t * one_minus_t) * t * control_point_first[0]
+        + 3 * one_minus_t * (t * t) * control_point_second[0]
+        + (t * t * t) * end_point[0]
     )
     y = (
-        (one_minus_t**3) * start_point[1]
-        + 3 * (one_minus_t**2) * t * control_point_first[1]
-        + 3 * one_minus_t * (t**2) * control_point_second[1]
-        + (t**3) * end_point[1]
+        (one_minus_t * one_minus_t * one_minus_t) * start_point[1]
+        + 3 * (one_minus_t * one_minus_t) * t * control_point_first[1]
+        + 3 * one_minus_t * (t * t) * control_point_second[1]
+        + (t * t * t) * end_point[1]
     )
     return x, y
 
@@ -220,17 +226,80 @@ def arc_to_cubic_beziers(
     return beziers
 
 
+DEFAULT_MAX_ERROR: float = 0.5
+"""Default maximum distance in pixels between a flattened polyline and the exact curve.
+
+This bounds the polyline before its points are rounded to whole pixels, which moves each point by up
+to another sqrt(2) / 2 pixels.
+"""
+
+_NUMPY_MIN_BATCH: int = 8
+"""Smallest batch of curves flattened with NumPy, below which its overhead is not worth it."""
+
+
+def circle_arc_segment_count(radius: float, sweep_rad: float, max_error: float) -> int:
+    """Return the number of chords needed for an arc to deviate at most max_error from the circle.
+
+    A chord spanning angle a deviates from the circle by its sagitta r * (1 - cos(a / 2)), so each
+    chord may span at most 2 * acos(1 - max_error / r).
+    """
+    if max_error <= 0:
+        raise ValueError("max_error must be positive.")
+    if radius <= max_error:
+        return 1
+    max_step = 2 * math.acos(1 - max_error / radius)
+    return max(1, int(math.ceil(abs(sweep_rad) / max_step)))
+
+
+def _bezier_segment_count(points: Sequence[Point], max_error: float) -> int:
+    """Return the number of uniform segments needed for a Bezier to deviate at most max_error.
+
+    Uses Wang's formula: a Bezier of degree d split into n uniform segments deviates at most
+    d * (d - 1) / 8 * M / n^2, where M is the largest norm of second differences of its points.
+    """
+    if max_error <= 0:
+        raise ValueError("max_error must be positive.")
+    degree = len(points) - 1
+    max_second_difference = 0.0
+    for index in range(degree - 1):
+        second_difference = math.hypot(
+            points[index][0] - 2 * points[index + 1][0] + points[index + 2][0],
+            points[index][1] - 2 * points[index + 1][1] + points[index + 2][1],
+        )
+        max_second_difference = max(max_second_difference, second_difference)
+    segments = math.sqrt(degree * (degree - 1) * max_second_difference / (8 * max_error))
+    return max(1, int(math.ceil(segments)))
+
+
+def quadratic_bezier_segment_count(points: Sequence[Point], max_error: float) -> int:
+    """Return the number of uniform segments needed for a quadratic Bezier to deviate at most
+    max_error pixels from the curve."""
+    return _bezier_segment_count(points, max_error)
+
+
+def cubic_bezier_segment_count(points: Sequence[Point], max_error: float) -> int:
+    """Return the number of uniform segments needed for a cubic Bezier to deviate at most
+    max_error pixels from the curve."""
+    return _bezier_segment_count(points, max_error)
+
+
 def flatten_circle_arc(
         center: Point,
         radius: int,
         start_orient: int,
         end_orient: int,
-        tolerance: float = 15.0,
+        tolerance: float | None = None,
+        max_error: float = DEFAULT_MAX_ERROR,
     ) -> List[Point]:
     """Flatten a circle arc into a polyline approximation.
 
     The returned list includes the start and end points of the arc.
-    :param tolerance: Maximum allowed angle step between consecutive points, in degrees.
+    :param tolerance:
+        Maximum allowed angle step between consecutive points, in degrees. If given, the arc is 
+        split by angle only and max_error is ignored.
+    :param max_error: 
+        Maximum distance in pixels between the polyline and the arc, before rounding points to 
+        whole pixels.
     """
     start_rad = gui_deg_to_math_rad(start_orient)
     end_rad = gui_deg_to_math_rad(end_orient)
@@ -244,7 +313,10 @@ def flatten_circle_arc(
     if math.isclose(total_delta, 0.0, abs_tol=1e-12):
         return [point_on_circle(center, radius, start_orient), point_on_circle(center, radius, end_orient)]
 
-    segment_count = max(1, int(math.ceil(abs(total_delta) / math.radians(tolerance))))
+    if tolerance is not None:
+        segment_count = max(1, int(math.ceil(abs(total_delta) / math.radians(tolerance))))
+    else:
+        segment_count = circle_arc_segment_count(radius, total_delta, max_error)
     points: List[Point] = []
     for segment_index in range(segment_count + 1):
         angle = start_rad + segment_index * (total_delta / segment_count)
@@ -253,18 +325,31 @@ def flatten_circle_arc(
     return points
 
 
+def _legacy_segment_count(tolerance: float) -> int:
+    """Return the fixed number of segments used for Beziers flattened by angle tolerance."""
+    if tolerance <= 0:
+        return 1
+    return max(1, int(math.ceil(180.0 / tolerance)))
+
+
 def flatten_quadratic_bezier(
         points: Sequence[Point],
-        tolerance: float = 15.0,
+        tolerance: float | None = None,
+        max_error: float = DEFAULT_MAX_ERROR,
     ) -> List[Point]:
     """Flatten a quadratic Bezier curve into a polyline.
 
-    :param tolerance: Approximate maximum angle between adjacent polyline segments, in degrees.
+    :param tolerance:
+        Approximate maximum angle between adjacent polyline segments, in degrees. If given, a fixed 
+        number of segments is used and max_error is ignored.
+    :param max_error: 
+        Maximum distance in pixels between the polyline and the curve, before rounding points to 
+        whole pixels.
     """
-    if tolerance <= 0:
-        segments = 1
+    if tolerance is not None:
+        segments = _legacy_segment_count(tolerance)
     else:
-        segments = max(1, int(math.ceil(180.0 / tolerance)))
+        segments = quadratic_bezier_segment_count(points, max_error)
     result: List[Point] = []
     for i in range(segments + 1):
         t = i / segments
@@ -275,19 +360,98 @@ def flatten_quadratic_bezier(
 
 def flatten_cubic_bezier(
         points: Sequence[Point],
-        tolerance: float = 15.0,
+        tolerance: float | None = None,
+        max_error: float = DEFAULT_MAX_ERROR,
     ) -> List[Point]:
     """Flatten a cubic Bezier curve into a polyline.
 
-    :param tolerance: Approximate maximum angle between adjacent polyline segments, in degrees.
+    :param tolerance:
+        Approximate maximum angle between adjacent polyline segments, in degrees. If given, a fixed 
+        number of segments is used and max_error is ignored.
+    :param max_error: 
+        Maximum distance in pixels between the polyline and the curve, before rounding points to 
+        whole pixels.
     """
-    if tolerance <= 0:
-        segments = 1
+    if tolerance is not None:
+        segments = _legacy_segment_count(tolerance)
     else:
-        segments = max(1, int(math.ceil(180.0 / tolerance)))
+        segments = cubic_bezier_segment_count(points, max_error)
     result: List[Point] = []
     for i in range(segments + 1):
         t = i / segments
         x_f, y_f = evaluate_cubic_bezier(points, t)
         result.append((int(round(x_f)), int(round(y_f))))
     return result
+
+
+def _flatten_beziers_numpy(
+        curves: Sequence[Sequence[Point]], max_error: float) -> List[List[Point]]:
+    """Flatten Beziers of the same degree at once with NumPy, see `flatten_cubic_beziers()`.
+
+    Segment counts and points are computed with the same operations in the same order as flattening
+    one curve at a time, so the results are exactly the same.
+    """
+    control = numpy.asarray(curves, dtype=numpy.float64) # (curves, degree + 1, 2)
+    degree = control.shape[1] - 1
+    counts = numpy.array(
+        [_bezier_segment_count(points, max_error) for points in curves], dtype=numpy.intp, 
+    )
+    # All t values of all curves in one array, with index of the curve each belongs to
+    sizes = counts + 1
+    ends = numpy.cumsum(sizes)
+    starts = ends - sizes
+    owners = numpy.repeat(numpy.arange(len(control)), sizes)
+    t = (numpy.arange(ends[-1]) - starts[owners]) / counts[owners]
+    # Evaluated as in evaluate_quadratic_bezier() and evaluate_cubic_bezier()
+    one_minus_t = (1.0 - t)[:, None]
+    t = t[:, None]
+    points = control[owners]
+    if degree == 2:
+        evaluated = one_minus_t * one_minus_t * points[:, 0] + \
+            2 * one_minus_t * t * points[:, 1] + t * t * points[:, 2]
+    elif degree == 3:
+        evaluated = (
+            (one_minus_t * one_minus_t * one_minus_t) * points[:, 0]
+            + 3 * (one_minus_t * one_minus_t) * t * points[:, 1]
+            + 3 * one_minus_t * (t * t) * points[:, 2]
+            + (t * t * t) * points[:, 3]
+        )
+    else:
+        raise ValueError(f"Only quadratic and cubic Beziers can be flattened, got degree {degree}.")
+    rounded = numpy.rint(evaluated).astype(numpy.int64) # Rounds half to even, same as round()
+    flat_points = list(zip(rounded[:, 0].tolist(), rounded[:, 1].tolist()))
+    return [flat_points[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
+
+
+def flatten_quadratic_beziers(
+        curves: Sequence[Sequence[Point]],
+        max_error: float = DEFAULT_MAX_ERROR,
+    ) -> List[List[Point]]:
+    """Flatten a batch of quadratic Bezier curves into polylines.
+
+    Same as calling `flatten_quadratic_bezier()` on each curve, but vectorized with NumPy for large 
+    batches if it is installed.
+    :param max_error: 
+        Maximum distance in pixels between each polyline and its curve, before rounding points to 
+        whole pixels.
+    """
+    if numpy is not None and len(curves) >= _NUMPY_MIN_BATCH:
+        return _flatten_beziers_numpy(curves, max_error)
+    return [flatten_quadratic_bezier(points, max_error=max_error) for points in curves]
+
+
+def flatten_cubic_beziers(
+        curves: Sequence[Sequence[Point]],
+        max_error: float = DEFAULT_MAX_ERROR,
+    ) -> List[List[Point]]:
+    """Flatten a batch of cubic Bezier curves into polylines.
+
+    Same as calling `flatten_cubic_bezier()` on each curve, but vectorized with NumPy for large 
+    batches if it is installed.
+    :param max_error: 
+        Maximum distance in pixels between each polyline and its curve, before rounding points to 
+        whole pixels.
+    """
+    if numpy is not None and len(curves) >= _NUMPY_MIN_BATCH:
+        return _flatten_beziers_numpy(curves, max_error)
+    return [flatten_cubic_bezier(points, max_error=max_error) for points in curves]
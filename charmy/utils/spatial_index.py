@@ -0,0 +1,207 @@
+"""Spatial index used to find drawn objects that lie within a region quickly.
+
+Windows keep every drawn object in a uniform grid, where each object is stored in all cells that its
+rect boundary covers. Looking for objects within a damaged region then only needs to visit the cells
+covered by that region, instead of testing every drawn object against every region.
+
+Objects too large to be stored cell by cell (e.g. scrolled content) are kept aside instead, and are
+tested against every region looked up.
+"""
+
+from __future__ import annotations as _
+
+import typing as _typing
+
+if _typing.TYPE_CHECKING:
+    from ..styles import shape as _shape
+
+__all__ = ["GridIndex", "is_overlapping"]
+
+
+_ItemType = _typing.TypeVar("_ItemType", bound=_typing.Hashable)
+
+_CellRange: _typing.TypeAlias = tuple[int, int, int, int]
+
+
+def is_overlapping(boundary: _shape.ShapeRange, region: _shape.ShapeRange) -> bool:
+    """Check if a boundary overlaps with a region on both axes (x AND y).
+
+    :param boundary: Rect boundary of the object
+    :param region: The region to test with
+    """
+    x1, y1 = boundary[0]
+    w1, h1 = boundary[1]
+    x2, y2 = region[0]
+    w2, h2 = region[1]
+    return (x1 < x2 + w2) and (x1 + w1 > x2) and (y1 < y2 + h2) and (y1 + h1 > y2)
+
+
+class GridIndex(_typing.Generic[_ItemType]):
+    """A uniform grid that buckets items by their rect boundary.
+
+    Each item also gets a paint order stamp when it is inserted for the first time, or the one given
+    when inserting. Query results are sorted by the stamp, which is the paint order when stamps are
+    given by a window's drawing list.
+    """
+
+    def __init__(self, cell_size: int = 64, max_cells: int = 256):
+        """To create an empty grid index.
+
+        :param cell_size: Width and height of each grid cell, in px
+        :param max_cells: Items covering more cells than this are kept aside instead of in cells
+        """
+        self.cell_size: int = cell_size
+        self.max_cells: int = max_cells
+        self._cells: dict[tuple[int, int], set[_ItemType]] = {}
+        self._oversized: set[_ItemType] = set() # Items kept aside, always tested by `query()`
+        self._boundaries: dict[_ItemType, _shape.ShapeRange] = {}
+        self._cell_ranges: dict[_ItemType, _CellRange | None] = {} # 👈 `None` if kept aside
+        self._order: dict[_ItemType, int] = {}
+        self._objects: dict[_ItemType, _ItemType] = {}
+        self._next_order: int = 0
+
+    def _cell_range(self, boundary: _shape.ShapeRange) -> _CellRange:
+        """Get the range of cells covered by a boundary, in `(x0, y0, x1, y1)` (both inclusive)."""
+        (x, y), (w, h) = boundary
+        size = self.cell_size
+        return (
+            int(x // size), int(y // size),
+            int((x + max(w, 0)) // size), int((y + max(h, 0)) // size),
+            )
+
+    def _indexed_range(self, boundary: _shape.ShapeRange) -> _CellRange | None:
+        """Get the range of cells to store an item in, `None` if it should be kept aside."""
+        cell_range = self._cell_range(boundary)
+        x0, y0, x1, y1 = cell_range
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > self.max_cells:
+            return None
+        return cell_range
+
+    def _add_to_cells(self, item: _ItemType, cell_range: _CellRange | None) -> None:
+        if cell_range is None:
+            self._oversized.add(item)
+            return
+        x0, y0, x1, y1 = cell_range
+        for cell_y in range(y0, y1 + 1):
+            for cell_x in range(x0, x1 + 1):
+                cell = self._cells.get((cell_x, cell_y))
+                if cell is None:
+                    self._cells[(cell_x, cell_y)] = cell = set()
+                cell.add(item)
+
+    def _remove_from_cells(self, item: _ItemType, cell_range: _CellRange | None) -> None:
+        if cell_range is None:
+            self._oversized.discard(item)
+            return
+        x0, y0, x1, y1 = cell_range
+        for cell_y in range(y0, y1 + 1):
+            for cell_x in range(x0, x1 + 1):
+                cell = self._cells.get((cell_x, cell_y))
+                if cell is None:
+                    continue
+                cell.discard(item)
+                if not cell:
+                    del self._cells[(cell_x, cell_y)]
+
+    def insert(self, 
+               item: _ItemType, 
+               boundary: _shape.ShapeRange, 
+               order: int | None = None, 
+               ) -> _typing.Self:
+        """Insert an item, or update its boundary if already inserted.
+
+        :param item: The item to insert
+        :param boundary: Rect boundary of the item
+        :param order: Paint order stamp of the item, default is on the top for new items, and 
+            unchanged for inserted items
+        """
+        if item in self._order:
+            self.update(item, boundary)
+        else:
+            cell_range = self._indexed_range(boundary)
+            self._add_to_cells(item, cell_range)
+            self._cell_ranges[item] = cell_range
+            self._boundaries[item] = boundary
+            if order is None:
+                order = self._next_order
+        self._objects[item] = item # 👈 Keep the latest object, in case an equal copy is given
+        if order is not None:
+            self._order[item] = order
+            self._next_order = max(self._next_order, order + 1)
+        return self
+
+    def update(self, item: _ItemType, boundary: _shape.ShapeRange) -> _typing.Self:
+        """Update boundary of an item while keeping its paint order, does nothing if not inserted.
+
+        :param item: The item to update
+        :param boundary: New rect boundary of the item
+        """
+        if item not in self._order or self._boundaries[item] == boundary:
+            return self
+        cell_range = self._indexed_range(boundary)
+        if cell_range != self._cell_ranges[item]:
+            self._remove_from_cells(item, self._cell_ranges[item])
+            self._add_to_cells(item, cell_range)
+            self._cell_ranges[item] = cell_range
+        self._boundaries[item] = boundary
+        return self
+
+    def remove(self, item: _ItemType) -> _typing.Self:
+        """Remove an item from the index, does nothing if not inserted.
+
+        :param item: The item to remove
+        """
+        if item not in self._order:
+            return self
+        self._remove_from_cells(item, self._cell_ranges.pop(item))
+        del self._boundaries[item]
+        del self._order[item]
+        del self._objects[item]
+        return self
+
+    def clear(self) -> _typing.Self:
+        """Remove all items from the index."""
+        self._cells.clear()
+        self._oversized.clear()
+        self._boundaries.clear()
+        self._cell_ranges.clear()
+        self._order.clear()
+        self._objects.clear()
+        return self
+
+    def query(self, *regions: _shape.ShapeRange) -> list[_ItemType]:
+        """Find all items overlapping with any of the regions, sorted in paint order.
+
+        :param regions: Regions to look up
+        """
+        candidates: set[_ItemType] = set(self._oversized)
+        for region in regions:
+            x0, y0, x1, y1 = self._cell_range(region)
+            if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._cells):
+                # Visiting cells one by one costs more than testing every item
+                candidates = set(self._boundaries)
+                break
+            for cell_y in range(y0, y1 + 1):
+                for cell_x in range(x0, x1 + 1):
+                    cell = self._cells.get((cell_x, cell_y))
+                    if cell:
+                        candidates.update(cell)
+        boundaries = self._boundaries
+        objects = self._objects
+        result = [
+            objects[item] for item in candidates
+            if any(is_overlapping(boundaries[item], region) for region in regions)
+            ]
+        result.sort(key=self._order.__getitem__)
+        return result
+
+    def boundary_of(self, item: _ItemType) -> _shape.ShapeRange:
+        """Get the boundary stored for an item."""
+        return self._boundaries[item]
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
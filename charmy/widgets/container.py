@@ -10,6 +10,7 @@ import reactive_caching
 from ..utils import layout_profiles # Expose them as (...).container.layout_profiles
 from ..utils import type_checking
 from ..styles import shape, texture
+from .. import graphics
 
 if typing.TYPE_CHECKING:
     from . import widget
@@ -26,6 +27,13 @@ class Container(reactive_caching.CachedClass):
     """
 
     _with_stack: typing.ClassVar[list[Container]] = [] # Used to store embedding stack in with as
+    is_root_container: typing.ClassVar[bool] = False
+
+    cache_as_layer: bool = False
+    # 👆 Opt-in, render children into an offscreen layer that is composited onto the window as a 
+    # whole, and rendered again only when any of them changes. Useful for large and mostly static 
+    # containers. Children are clipped to the container. Has no effect on root containers.
+    _layer: graphics.DrawnLayer | None = None
 
     def __init__(self, *args, **kwargs):
         """Initialize a container base class.
@@ -85,6 +93,18 @@ class Container(reactive_caching.CachedClass):
 
     def draw_children(self) -> typing.Self:
         """Draw the container and its children."""
+        if self.cache_as_layer and not self.is_root_container:
+            return self._draw_children_as_layer()
+        if self._layer is not None:
+            # No longer cached as layer, remove the layer from window
+            self._layer._remove_from_drawing_list()
+            if self._layer._drawn_boundary is not None:
+                self._layer.window._redraw_regions.append(self._layer._drawn_boundary)
+            self._layer = None
+        self._draw_each_child()
+        return self
+
+    def _draw_each_child(self) -> None:
         _, managed_layer, place_layer = self.layers
         if typing.TYPE_CHECKING:
             managed_layer = typing.cast(list[widget.Widget], managed_layer)
@@ -92,6 +112,20 @@ class Container(reactive_caching.CachedClass):
         for layer in place_layer, managed_layer:
             for child in reversed(layer):
                 child.draw()
+
+    def _draw_children_as_layer(self) -> typing.Self:
+        """Draw children into the layer of the container, then draw the layer."""
+        if self._layer is None:
+            root = typing.cast("widget.Widget", self).root_container # Non-root ones are widgets
+            self._layer = graphics.DrawnLayer(root, self.abs_pos, self.size)
+        self._layer.offset = self.abs_pos
+        self._layer.size = self.size
+        self._layer.begin()
+        try:
+            self._draw_each_child()
+        finally:
+            self._layer.end()
+        self._layer.draw()
         return self
 
     def _clear_children(self):
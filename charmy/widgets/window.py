@@ -4,6 +4,7 @@ import typing as _typing
 
 import pathlib as _pathlib
 import io as _io
+import time as _time
 
 from ..event import EventHandling as _EventHandling, event_types as _event_types
 from ..cm_object import CharmyObject as _CharmyObject
@@ -11,7 +12,9 @@ from .container import Container as _Container
 from .. import const as _const
 from ..cmm import CharmyManager as _CharmyManager
 from .. import styles as _styles
-from ..utils import type_checking as _type_checking
+from ..utils import type_checking as _type_checking, spatial_index as _spatial_index
+from ..utils import damage as _damage, drawing_list as _drawing_list, frame_stats as _frame_stats
+from ..utils import batching as _batching
 from .. import graphics as _graphics
 from ..const import DEBUG_FLAGS as _DEBUG_FLAGS
 
@@ -62,6 +65,9 @@ class WindowEntity(_CharmyObject, _EventHandling):
         # Other flags
         self.visible = True
         self._alive = True
+        self.frame_stats: _frame_stats.FrameStats = _frame_stats.FrameStats()
+        # 👆 Time spent in each phase of latest frames, see `charmy.utils.frame_stats`, also
+        # recorded into by the WindowBase, so created before it
         # Initialize the WindowBase
         self.backend_base: _WindowBase = self.parent.backend.WindowBase(self.parent.backend, self)
         # Set props
@@ -71,8 +77,24 @@ class WindowEntity(_CharmyObject, _EventHandling):
         self.background = background
         # Other internal attrs
         self._mouse_hovering_on: list[_Container | _Widget] = []
-        self._drawing_list: _typing.List[_graphics.DrawnObject] = []
-        self._redraw_regions: list[_styles.shape.ShapeRange] = [((0, 0), self.size)]
+        self._drawing_list: _drawing_list.DrawingList[_graphics.DrawnObject] = \
+            _drawing_list.DrawingList()
+        # 👆 Objects to draw in paint order, re-drawn objects keep their stacking position
+        self._drawing_index: _spatial_index.GridIndex[_graphics.DrawnObject] = \
+            _spatial_index.GridIndex()
+        # 👆 Spatial index of objects in drawing list, kept in sync when objects are drawn
+        self._redraw_regions: _damage.DamageAccumulator = \
+            _damage.DamageAccumulator([((0, 0), self.size)])
+        self._layer_stack: list[_graphics.DrawnLayer] = []
+        # 👆 Layers being drawn currently, objects drawn go to the innermost one instead of window
+        self._late_damage: list[_styles.shape.ShapeRange] = []
+        # 👆 Regions found out to be damaged only during drawing, to be redrawn in next frame
+        self._display_list: dict[_graphics.DrawnObject, tuple[_typing.Hashable, _typing.Any]] = {}
+        # 👆 Drawing commands recorded by backend for each drawn object, with the render key of the 
+        # object when recorded, so unchanged objects can be drawn by replaying their commands
+        self.batch_draws: bool = True
+        # 👆 Draw consecutive shapes sharing textures and border at once if backend supports, see 
+        # `charmy.utils.batching`. Batched shapes are not recorded, see `_draw_objects()`
         # Bind on window events
         self.bind(_event_types.WidgetResize, lambda _: self.update(True), _is_internal=True)
         self.bind(_event_types.WidgetDestroy, lambda _: self.destroy(), _is_internal=True)
@@ -93,6 +115,13 @@ class WindowEntity(_CharmyObject, _EventHandling):
     def abs_pos(self) -> _styles.shape.Point:
         return(0, 0)
 
+    @property
+    def _current_layer(self) -> _graphics.DrawnLayer | None:
+        """The innermost layer being drawn currently, or `None` if drawing on window directly."""
+        if len(self._layer_stack) == 0:
+            return None
+        return self._layer_stack[-1]
+
     @property
     def size(self) -> _styles.shape.Size:
         """Window size."""
@@ -169,25 +198,134 @@ class WindowEntity(_CharmyObject, _EventHandling):
         self.backend_base.show()
         return self
 
-    def draw_frame(self, drawing_list: list[_graphics.DrawnObject]) -> _typing.Self:
+    def draw_frame(self, 
+                   drawing_list: list[_graphics.DrawnObject], 
+                   regions: _typing.Optional[list[_styles.shape.ShapeRange]] = None, 
+                   ) -> _typing.Self:
         """Draw a frame for the window.
         
         :param drawing_list: The list of the objects to draw
+        :param regions: Regions to restrict drawing in, or `None` to draw on the whole window
         """
-        backend = self.parent.backend # Alias to avoid the path to backend getting too long
-        self.backend_base.draw_background()
-        for drawn_obj in drawing_list:
-            if isinstance(drawn_obj, _graphics.DrawnLine):
-                backend.LineBase.draw_line(drawn_obj)
-            elif isinstance(drawn_obj, _graphics.DrawnShape):
-                backend.ShapeBase.draw_shape(drawn_obj)
-            elif isinstance(drawn_obj, _graphics.DrawnText):
-                backend.TextBase.draw_text(drawn_obj)
+        if regions is not None:
+            # Clip background and objects to the damaged regions
+            self.backend_base.set_clip(regions)
+        try:
+            self.backend_base.draw_background()
+            self._draw_objects(drawing_list)
+        finally:
+            if regions is not None:
+                self.backend_base.reset_clip()
+        return self
+
+    def _draw_objects(self, drawing_list: list[_graphics.DrawnObject]) -> None:
+        """Draw objects in the list with backend in order, by replaying their recorded commands.
+
+        Commands of an object are recorded again only when its render key changed. If batching is 
+        enabled and supported by backend, runs of consecutive shapes that share textures and border 
+        and do not overlap each other are drawn directly at once instead.
+
+        Trade-off of batching
+        ---------------------
+        Batched runs bypass the display list: their paths are built again on each redraw (from 
+        cached paths of shapes if backend caches them), and filled and stroked once for the whole 
+        run. Runs are not recorded, as which shapes make up a run changes with any object between 
+        or overlapping them, so entries keyed by runs would rarely be reused; and drawing them on 
+        the window directly lets backend skip state calls repeated by following runs. Set 
+        `batch_draws` to `False` to record and replay every shape instead, e.g. for complex shapes 
+        that are expensive to build paths for and are redrawn often.
+        """
+        backend_base = self.backend_base
+        display_list = self._display_list
+        self.frame_stats.current.objects_drawn += len(drawing_list)
+        if self.batch_draws and "batch" in self.parent.backend.ShapeBase.supports:
+            runs: _typing.Iterable[list[_graphics.DrawnObject]] = _batching.split_runs(
+                drawing_list, self._batch_key, lambda drawn_obj: drawn_obj.paint_boundary, 
+                )
+        else:
+            runs = ([drawn_obj] for drawn_obj in drawing_list)
+        for run in runs:
+            if len(run) > 1:
+                self.parent.backend.ShapeBase.draw_shapes(run)
+                for drawn_obj in run:
+                    self._sync_drawn_boundary(drawn_obj)
+                continue
+            drawn_obj = run[0]
+            render_key = drawn_obj.render_key
+            compiled = display_list.get(drawn_obj)
+            if compiled is not None and compiled[0] == render_key:
+                backend_base.replay(compiled[1])
             else:
-                raise RuntimeError(
-                    f"Unsupported of drawn object type: {drawn_obj.__class__.__name__}"
+                recording = backend_base.record(
+                    self._record_region(drawn_obj), lambda: self._draw_object(drawn_obj), 
                     )
-        return self
+                if recording is not None: # Otherwise backend cannot record and drew it directly
+                    display_list[drawn_obj] = (render_key, recording)
+                    backend_base.replay(recording)
+            self._sync_drawn_boundary(drawn_obj)
+
+    def _sync_drawn_boundary(self, drawn_obj: _graphics.DrawnObject) -> None:
+        """Boundary may change after drawn (e.g. text size reported by backend), sync it."""
+        boundary = drawn_obj.paint_boundary
+        if boundary != drawn_obj._drawn_boundary:
+            self._late_damage.append(boundary) # Part outside damaged regions was clipped
+            drawn_obj._drawn_boundary = boundary
+        self._drawing_index.update(drawn_obj, boundary)
+
+    @staticmethod
+    def _batch_key(drawn_obj: _graphics.DrawnObject) -> _typing.Hashable | None:
+        """Drawing state of an object for batching, `None` for objects other than shapes."""
+        if type(drawn_obj) is not _graphics.DrawnShape:
+            return None
+        return (
+            drawn_obj.texture.cache_key, drawn_obj.border_width, 
+            drawn_obj.border_texture.cache_key, 
+            )
+
+    @staticmethod
+    def _record_region(drawn_obj: _graphics.DrawnObject) -> _styles.shape.ShapeRange | None:
+        """Region an object may paint in, which bounds its recorded commands. `None` if it cannot be 
+        told before drawn."""
+        if isinstance(drawn_obj, _graphics.DrawnText):
+            style = drawn_obj.rendered_style
+            if not (isinstance(style.underlined, bool) and isinstance(style.strikethrough, bool)):
+                return None # Custom decorations are drawn lines placed by themselves
+            if drawn_obj.boundary[1] == (0, 0):
+                return None # Size is only known after drawn
+        elif not isinstance(drawn_obj, (
+            _graphics.DrawnShape, _graphics.DrawnLine, _graphics.DrawnLayer, 
+            )):
+            return None
+        return drawn_obj.paint_boundary
+
+    def _draw_object(self, drawn_obj: _graphics.DrawnObject) -> None:
+        """Draw an object with backend immediately."""
+        backend = self.parent.backend # Alias to avoid the path to backend getting too long
+        if isinstance(drawn_obj, _graphics.DrawnLine):
+            backend.LineBase.draw_line(drawn_obj)
+        elif isinstance(drawn_obj, _graphics.DrawnShape):
+            backend.ShapeBase.draw_shape(drawn_obj)
+        elif isinstance(drawn_obj, _graphics.DrawnText):
+            backend.TextBase.draw_text(drawn_obj)
+        elif isinstance(drawn_obj, _graphics.DrawnLayer):
+            self._draw_layer(drawn_obj)
+        else:
+            raise RuntimeError(
+                f"Unsupported of drawn object type: {drawn_obj.__class__.__name__}"
+                )
+
+    def _draw_layer(self, layer: _graphics.DrawnLayer) -> None:
+        """Render a layer offscreen if outdated, then composite it onto the window."""
+        if layer.need_render:
+            layer._surface = self.backend_base.render_layer(
+                layer.boundary, lambda: self._draw_objects(layer.objects)
+                )
+            layer._surface_version = layer._version
+        if layer._surface is None:
+            # Backend cannot render layers offscreen, so draw objects inside directly
+            self._draw_objects(layer.objects)
+        else:
+            self.backend_base.composite_layer(layer._surface, layer.boundary[0])
 
     def _find_need_redraw(self) -> _typing.List[_graphics.DrawnObject]:
         """Find all components that need to be redrawn in current frame."""
@@ -198,43 +336,44 @@ class WindowEntity(_CharmyObject, _EventHandling):
         #             # Repeat check
         #             self._redraw_regions.append(region)
         #             drawn_obj._need_redraw = False
-        result: _typing.List[_graphics.DrawnObject] = []
-        for drawn_obj in self._drawing_list:
-            boundary = drawn_obj.boundary
-            for region in self._redraw_regions:
-                 # Check overlap on both axes (x AND y) to determine intersection
-                x1, y1 = boundary[0]
-                w1, h1 = boundary[1]
-                x2, y2 = region[0]
-                w2, h2 = region[1]
-                x_overlap = (x1 < x2 + w2) and (x1 + w1 > x2)
-                y_overlap = (y1 < y2 + h2) and (y1 + h1 > y2)
-                if x_overlap and y_overlap:
-                    if drawn_obj not in result:
-                        result.append(drawn_obj)
-        return result
-
-    def update(self, force_redraw: bool = False):
+        regions = self._redraw_regions.coalesce(self.size)
+        if len(regions) == 0:
+            return []
+        return self._drawing_index.query(*regions)
+
+    def update(self, force_redraw: bool = False, pump_events: bool = True):
         """Update the window.
 
         :param force_redraw: Redraw the window content regardless presence of changes
+        :param pump_events: Handle pending events after presenting, disable if handled elsewhere
         """
         # Handle params
         if not self._alive:
             return # Skip if window inactive
-        if ((0, 0), self.size) in self._redraw_regions:
-            force_redraw = True # When whole window needs redraw, it is force redraw then
+        record = self.frame_stats.current
+        start_time = _time.perf_counter()
         # Trigger event
         self.trigger(_event_types.WidgetUpdate(self))
+        dispatched_time = _time.perf_counter()
+        record.dispatch += dispatched_time - start_time
+        if self._redraw_regions.is_full(self.size):
+            force_redraw = True # When whole window needs redraw, it is force redraw then
+        redraw_regions = self._redraw_regions.coalesce(self.size)
         if force_redraw:
-            redraw_list = self._drawing_list.copy()
+            need_redraw = list(self._drawing_list)
+            record.regions += 1
+        elif len(redraw_regions) != 0:
+            need_redraw = self._find_need_redraw()
+            record.regions += len(redraw_regions)
         else:
-            redraw_list = self._find_need_redraw()
-        self.draw_frame(redraw_list)
-        # print([str(obj) for obj in redraw_list])
+            need_redraw = None
+        damage_time = _time.perf_counter()
+        record.damage += damage_time - dispatched_time
+        if need_redraw is not None:
+            self.draw_frame(need_redraw, None if force_redraw else redraw_regions)
         # Debug: Mark redraws
         if _DEBUG_FLAGS.MARK_REDRAWS:
-            for region in self._redraw_regions:
+            for region in redraw_regions:
                 self.parent.backend.ShapeBase.draw_shape(
                     _graphics.DrawnShape(
                         self, 
@@ -242,16 +381,21 @@ class WindowEntity(_CharmyObject, _EventHandling):
                         ), 
                     self.backend_base
                     )
-        # Update window
+        rasterized_time = _time.perf_counter()
+        record.rasterize += rasterized_time - damage_time
+        # Present all redrawn regions at once, then handle events once per frame
         if force_redraw:
-            self.backend_base.update(True)
+            self.backend_base.present(True)
         else:
-            for redraw_region in self._redraw_regions:
-                self.backend_base.update(redraw_region)
-            if len(self._redraw_regions) == 0:
-                # If no region to redraw, still update window for events or so
-                self.backend_base.update(False)
-        self._redraw_regions = []
+            self.backend_base.present(redraw_regions)
+        record.present += _time.perf_counter() - rasterized_time
+        self._redraw_regions.clear()
+        for region in self._late_damage:
+            self._redraw_regions.append(region)
+        self._late_damage.clear()
+        if pump_events:
+            self.backend_base.pump_events()
+        self.frame_stats.end_frame()
 
     def destroy(self):
         """Close the window and mark it as inactive."""
@@ -273,13 +417,16 @@ class Window(WindowEntity, _Container):
         WindowEntity.__init__(self, parent, size, title, background)
         _Container.__init__(self)
 
-    def update(self, force_redraw: bool = False):
+    def update(self, force_redraw: bool = False, pump_events: bool = True):
         """Update the window.
 
         :param force_redraw: Redraw the window content regardless presence of changes
+        :param pump_events: Handle pending events after presenting, disable if handled elsewhere
         """
+        start_time = _time.perf_counter()
         _Container.draw_children(self)
-        WindowEntity.update(self, force_redraw)
+        self.frame_stats.current.draw_children += _time.perf_counter() - start_time
+        WindowEntity.update(self, force_redraw, pump_events)
 
     def destroy(self):
         """Destroy the window and its children."""
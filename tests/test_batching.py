@@ -0,0 +1,55 @@
+from charmy.utils.batching import split_runs
+
+
+def _runs(items, max_run=256):
+    """Split `(name, key, boundary)` items, and return names of each run."""
+    runs = split_runs(items, lambda item: item[1], lambda item: item[2], max_run=max_run)
+    return [[item[0] for item in run] for run in runs]
+
+
+def _box(x, y, size=10):
+    return ((x, y), (size, size))
+
+
+def test_consecutive_items_with_same_key_make_one_run():
+    items = [("a", "red", _box(0, 0)), ("b", "red", _box(20, 0)), ("c", "red", _box(40, 0))]
+    assert _runs(items) == [["a", "b", "c"]]
+
+
+def test_key_change_ends_run():
+    items = [("a", "red", _box(0, 0)), ("b", "blue", _box(20, 0)), ("c", "red", _box(40, 0))]
+    assert _runs(items) == [["a"], ["b"], ["c"]]
+
+
+def test_unbatchable_item_is_a_run_of_its_own():
+    items = [("a", "red", _box(0, 0)), ("b", None, _box(20, 0)), ("c", None, _box(40, 0)),
+             ("d", "red", _box(60, 0))]
+    assert _runs(items) == [["a"], ["b"], ["c"], ["d"]]
+
+
+def test_overlapping_item_ends_run():
+    items = [("a", "red", _box(0, 0)), ("b", "red", _box(20, 0)), ("c", "red", _box(25, 5)),
+             ("d", "red", _box(60, 0))]
+    assert _runs(items) == [["a", "b"], ["c", "d"]]
+
+
+def test_item_within_run_box_but_not_overlapping_joins_run():
+    # "c" lies inside the union of "a" and "b", without overlapping either of them
+    items = [("a", "red", _box(0, 0)), ("b", "red", _box(40, 40)), ("c", "red", _box(40, 0))]
+    assert _runs(items) == [["a", "b", "c"]]
+
+
+def test_touching_edges_do_not_overlap():
+    items = [("a", "red", _box(0, 0)), ("b", "red", _box(10, 0))]
+    assert _runs(items) == [["a", "b"]]
+
+
+def test_max_run_splits_long_runs():
+    items = [(str(x), "red", _box(x * 20, 0)) for x in range(5)]
+    assert _runs(items, max_run=2) == [["0", "1"], ["2", "3"], ["4"]]
+
+
+def test_order_and_items_are_kept():
+    items = [(str(x), "red" if x % 3 else None, _box(x * 5, 0)) for x in range(30)]
+    runs = _runs(items)
+    assert [name for run in runs for name in run] == [item[0] for item in items]
@@ -0,0 +1,96 @@
+from charmy.utils.damage import DamageAccumulator
+
+WINDOW = (1000, 1000)
+
+
+def _total_area(regions):
+    return sum(w * h for _, (w, h) in regions)
+
+
+def _overlaps(region_a, region_b):
+    (x1, y1), (w1, h1) = region_a
+    (x2, y2), (w2, h2) = region_b
+    return x1 < x2 + w2 and x2 < x1 + w1 and y1 < y2 + h2 and y2 < y1 + h1
+
+
+def test_empty_and_duplicated_regions_are_dropped():
+    damage = DamageAccumulator()
+    damage.append(((10, 10), (0, 20))).append(((10, 10), (20, 20))).append(((10, 10), (20, 20)))
+    assert len(damage) == 1
+    assert damage.coalesce(WINDOW) == [((10, 10), (20, 20))]
+
+
+def test_regions_are_clamped_to_window():
+    damage = DamageAccumulator([((-10, -10), (30, 30)), ((990, 0), (50, 10)), ((2000, 0), (5, 5))])
+    assert sorted(damage.coalesce(WINDOW)) == [((0, 0), (20, 20)), ((990, 0), (10, 10))]
+
+
+def test_overlapping_regions_merge():
+    damage = DamageAccumulator([((0, 0), (100, 100)), ((50, 50), (100, 100))])
+    assert damage.coalesce(WINDOW) == [((0, 0), (150, 150))]
+
+
+def test_far_apart_regions_stay_separate():
+    damage = DamageAccumulator([((0, 0), (10, 10)), ((500, 500), (10, 10))])
+    assert sorted(damage.coalesce(WINDOW)) == [((0, 0), (10, 10)), ((500, 500), (10, 10))]
+
+
+def test_merging_stops_at_a_fixed_point():
+    # Merging the third into the first makes a rect overlapping the second, found by the next pass
+    damage = DamageAccumulator([((0, 0), (10, 10)), ((20, 0), (10, 10)), ((5, 0), (20, 10))])
+    damage.merge_cost = 0
+    assert damage.coalesce(WINDOW) == [((0, 0), (30, 10))]
+
+
+def test_coalesced_regions_never_overlap():
+    damage = DamageAccumulator([((x * 37 % 400, x * 53 % 400), (60, 40)) for x in range(12)])
+    damage.merge_cost = 0
+    result = damage.coalesce(WINDOW)
+    for index, region in enumerate(result):
+        assert not any(_overlaps(region, other) for other in result[index + 1:])
+    # Coalescing its own result again changes nothing
+    assert sorted(DamageAccumulator(result).coalesce(WINDOW)) == sorted(result)
+
+
+def test_cheap_merge_within_merge_cost():
+    damage = DamageAccumulator([((0, 0), (10, 10)), ((12, 0), (10, 10))])
+    assert damage.coalesce(WINDOW) == [((0, 0), (22, 10))]
+    damage = DamageAccumulator([((0, 0), (10, 10)), ((12, 0), (10, 10))])
+    damage.merge_cost = 0
+    assert len(damage.coalesce(WINDOW)) == 2
+
+
+def test_full_window_above_full_window_ratio():
+    damage = DamageAccumulator([((0, 0), (1000, 800))])
+    assert damage.is_full(WINDOW)
+    assert damage.coalesce(WINDOW) == [((0, 0), WINDOW)]
+
+
+def test_not_full_window_below_full_window_ratio():
+    damage = DamageAccumulator([((0, 0), (1000, 700))])
+    assert not damage.is_full(WINDOW)
+    assert _total_area(damage.coalesce(WINDOW)) == 700_000
+
+
+def test_full_window_ratio_is_tunable():
+    damage = DamageAccumulator([((0, 0), (1000, 500))])
+    damage.full_window_ratio = 0.5
+    assert damage.is_full(WINDOW)
+
+
+def test_too_many_rects_fall_back_to_bounding_rect():
+    damage = DamageAccumulator([((x * 50, 0), (10, 10)) for x in range(10)])
+    damage.merge_cost = 0
+    damage.max_rects = 4
+    assert damage.coalesce(WINDOW) == [((0, 0), (460, 10))]
+
+
+def test_coalesced_result_cached_until_changed():
+    damage = DamageAccumulator([((0, 0), (10, 10))])
+    first = damage.coalesce(WINDOW)
+    assert damage.coalesce(WINDOW) is first
+    damage.append(((500, 500), (10, 10)))
+    assert damage.coalesce(WINDOW) is not first
+    assert len(damage.coalesce(WINDOW)) == 2
+    damage.clear()
+    assert damage.coalesce(WINDOW) == []
@@ -0,0 +1,81 @@
+from charmy.utils.drawing_list import DrawingList
+
+
+def test_iterates_in_insertion_order():
+    drawing_list = DrawingList(["a", "b", "c"])
+    assert list(drawing_list) == ["a", "b", "c"]
+    assert [drawing_list.slot_of(item) for item in "abc"] == [0, 1, 2]
+
+
+def test_adding_again_keeps_slot():
+    drawing_list = DrawingList(["a", "b", "c"])
+    assert drawing_list.add("a") == 0
+    assert list(drawing_list) == ["a", "b", "c"]
+    assert len(drawing_list) == 3
+
+
+def test_raise_to_top():
+    drawing_list = DrawingList(["a", "b", "c"])
+    slot = drawing_list.raise_to_top("a")
+    assert slot > drawing_list.slot_of("c")
+    assert list(drawing_list) == ["b", "c", "a"]
+    # Raising the top one again still keeps it on the top
+    drawing_list.raise_to_top("a")
+    assert list(drawing_list) == ["b", "c", "a"]
+
+
+def test_raise_to_top_adds_missing_item():
+    drawing_list = DrawingList(["a"])
+    drawing_list.raise_to_top("b")
+    assert list(drawing_list) == ["a", "b"]
+
+
+def test_explicit_slot_below_top_is_sorted():
+    drawing_list = DrawingList(["a", "b", "c"])
+    drawing_list.add("c", slot=-1)
+    assert drawing_list.slot_of("c") == -1
+    assert list(drawing_list) == ["c", "a", "b"]
+    drawing_list.add("d")
+    assert drawing_list.slot_of("d") == 3
+    assert list(drawing_list) == ["c", "a", "b", "d"]
+
+
+def test_slot_of_follows_moves_and_removal():
+    drawing_list = DrawingList(["a", "b"])
+    drawing_list.add("a", slot=5)
+    assert drawing_list.slot_of("a") == 5
+    assert list(drawing_list) == ["b", "a"]
+    drawing_list.remove("a")
+    assert "a" not in drawing_list
+    try:
+        drawing_list.slot_of("a")
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("Removed item should have no slot")
+
+
+def test_keeps_latest_equal_object():
+    first, second = [1.0], [1.0]
+    drawing_list = DrawingList([_Key(first)])
+    drawing_list.add(_Key(second))
+    assert next(iter(drawing_list)).payload is second
+
+
+def test_clear_restarts_slots():
+    drawing_list = DrawingList(["a", "b"])
+    drawing_list.clear()
+    assert len(drawing_list) == 0
+    assert drawing_list.add("c") == 0
+
+
+class _Key:
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def __eq__(self, other):
+        return isinstance(other, _Key) and self.payload == other.payload
+
+    def __hash__(self):
+        return hash(tuple(self.payload))
@@ -0,0 +1,60 @@
+import pytest
+
+from charmy.utils.frame_clock import FrameClock
+
+
+def test_rejects_non_positive_fps():
+    with pytest.raises(ValueError):
+        FrameClock(0)
+
+
+def test_first_frame_is_due_at_once():
+    clock = FrameClock(10)
+    assert clock.time_until_frame(now=123.) == 0.
+
+
+def test_frames_on_time_land_on_the_grid():
+    clock = FrameClock(10)
+    assert clock.frame_done(started=1.0, now=1.02) == 0
+    assert clock.next_deadline == pytest.approx(1.1)
+    assert clock.time_until_frame(now=1.05) == pytest.approx(0.05)
+    assert clock.time_until_frame(now=1.2) == 0.
+    # Next frame starts right at its deadline
+    assert clock.frame_done(started=1.1, now=1.13) == 0
+    assert clock.next_deadline == pytest.approx(1.2)
+    assert clock.rendered_frames == 2
+    assert clock.skipped_frames == 0
+
+
+def test_early_start_waits_for_the_grid():
+    clock = FrameClock(10)
+    clock.frame_done(started=1.0, now=1.02)
+    # Started before its deadline, next deadline still follows the grid instead of the start
+    clock.frame_done(started=1.05, now=1.06)
+    assert clock.next_deadline == pytest.approx(1.2)
+
+
+def test_overrun_skips_missed_deadlines():
+    clock = FrameClock(10)
+    # Frame started at 1.0 should end before 1.1, but took until 1.25
+    assert clock.frame_done(started=1.0, now=1.25) == 2
+    assert clock.next_deadline == pytest.approx(1.3)
+    assert clock.skipped_frames == 2
+
+
+def test_overrun_far_behind_renders_at_once():
+    clock = FrameClock(10)
+    clock.max_skip = 2
+    skipped = clock.frame_done(started=1.0, now=2.0)
+    assert skipped > clock.max_skip
+    assert clock.next_deadline == 2.0
+    assert clock.time_until_frame(now=2.0) == 0.
+
+
+def test_grid_restarts_after_idle():
+    clock = FrameClock(10)
+    clock.frame_done(started=1.0, now=1.01)
+    # Nothing rendered for a while, the next frame starts a new grid
+    clock.frame_done(started=5.03, now=5.05)
+    assert clock.next_deadline == pytest.approx(5.13)
+    assert clock.skipped_frames == 0
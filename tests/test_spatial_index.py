@@ -0,0 +1,84 @@
+from charmy.utils.spatial_index import GridIndex, is_overlapping
+
+
+def test_is_overlapping_needs_both_axes():
+    assert is_overlapping(((0, 0), (10, 10)), ((5, 5), (10, 10)))
+    assert not is_overlapping(((0, 0), (10, 10)), ((10, 0), (10, 10))) # Touching edges only
+    assert not is_overlapping(((0, 0), (10, 10)), ((5, 20), (10, 10))) # Overlapping on x only
+
+
+def test_query_finds_overlapping_items_in_paint_order():
+    index = GridIndex(cell_size=16)
+    index.insert("top", ((0, 0), (40, 40)), order=5)
+    index.insert("bottom", ((20, 20), (40, 40)), order=1)
+    index.insert("far", ((500, 500), (10, 10)), order=0)
+    assert index.query(((30, 30), (4, 4))) == ["bottom", "top"]
+    assert index.query(((500, 500), (1, 1))) == ["far"]
+    assert index.query(((200, 200), (10, 10))) == []
+
+
+def test_update_moves_item_between_cells_and_keeps_order():
+    index = GridIndex(cell_size=16)
+    index.insert("a", ((0, 0), (10, 10)))
+    index.insert("b", ((0, 0), (10, 10)))
+    index.update("a", ((100, 100), (10, 10)))
+    assert index.query(((0, 0), (10, 10))) == ["b"]
+    assert index.query(((100, 100), (10, 10))) == ["a"]
+    assert index.query(((0, 0), (200, 200))) == ["a", "b"]
+
+
+def test_remove_drops_item_from_every_cell():
+    index = GridIndex(cell_size=16)
+    index.insert("a", ((0, 0), (64, 64)))
+    index.remove("a")
+    assert "a" not in index
+    assert len(index) == 0
+    assert index._cells == {}
+    assert index.query(((0, 0), (64, 64))) == []
+
+
+def test_oversized_item_is_kept_aside():
+    index = GridIndex(cell_size=16, max_cells=4)
+    index.insert("huge", ((0, 0), (1000, 1000)))
+    index.insert("small", ((0, 0), (10, 10)))
+    assert index._oversized == {"huge"}
+    assert index._cell_ranges["huge"] is None
+    assert all("huge" not in cell for cell in index._cells.values())
+    # Still found anywhere within its boundary, but not outside of it
+    assert index.query(((900, 900), (5, 5))) == ["huge"]
+    assert index.query(((2000, 2000), (5, 5))) == []
+
+
+def test_oversized_item_shrinking_goes_back_to_cells():
+    index = GridIndex(cell_size=16, max_cells=4)
+    index.insert("item", ((0, 0), (1000, 1000)))
+    index.update("item", ((0, 0), (10, 10)))
+    assert index._oversized == set()
+    assert index.query(((0, 0), (5, 5))) == ["item"]
+    index.update("item", ((0, 0), (1000, 1000)))
+    assert index._oversized == {"item"}
+    index.remove("item")
+    assert index._oversized == set()
+
+
+def test_large_region_query_scans_every_item(monkeypatch):
+    index = GridIndex(cell_size=16)
+    index.insert("a", ((0, 0), (10, 10)))
+    index.insert("b", ((5000, 5000), (10, 10)))
+    # A region covering far more cells than stored must not visit its cells one by one
+    visited = []
+    cells = index._cells
+    monkeypatch.setattr(index, "_cells", _RecordingDict(cells, visited))
+    assert index.query(((0, 0), (10000, 10000))) == ["a", "b"]
+    assert visited == []
+
+
+class _RecordingDict(dict):
+
+    def __init__(self, data, visited):
+        super().__init__(data)
+        self._visited = visited
+
+    def get(self, key, default=None):
+        self._visited.append(key)
+        return super().get(key, default)